@@ -1,63 +1,122 @@
 import pygame
 
 import game_config as gc
-from explosions import Explosion
 
 
 class Bullet(pygame.sprite.Sprite):
 
-    def __init__(
-            self,
-            assets,
-            groups,
-            owner,
-            position,
-            direction
-            ) -> None:
+    __slots__ = (
+        'assets',
+        'group',
+        'tank_group',
+        'bullet_group',
+        'pos_x',
+        'pos_y',
+        'direction',
+        'owner',
+        'game',
+        'power',
+        'speed',
+        'distance_left',
+        'obstacles_hit',
+        'grid_revision',
+        'images',
+        'image',
+        'rect',
+        'mask',
+        'hitbox',
+        'last_rect',
+        'pool'
+    )
 
+    def __init__(self, assets, groups, pool) -> None:
+        """
+        Creates a blank bullet. Bullets are pooled by the Game object,
+        so they're brought to life by reset(), through the pool's
+        acquire(), and taken out of the game by release().
+        """
         super().__init__()
 
         self.assets = assets
         self.group = groups
+        self.pool = pool
 
         # Groups for collision detection
         self.tank_group = self.group['all_tanks']
         self.bullet_group = self.group['bullets']
 
+        # Bullet images, and the rects and lists reused by every shot
+        self.images = self.assets.bullet_images
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.last_rect = pygame.Rect(0, 0, 0, 0)
+        self.obstacles_hit: list = []
+
+    def reset(self, owner, position, direction) -> None:
         # Bullet position and direction
         self.pos_x, self.pos_y = position
         self.direction = direction
 
         # Bullet attributes
         self.owner = owner
+        self.game = self.owner.game
         self.power = self.owner.power
         self.speed = self.owner.bullet_speed
+        self.distance_left = 0
+        self.obstacles_hit.clear()
+        self.grid_revision = 0
 
-        # Bullet images
-        self.images = self.assets.bullet_images
+        # Bullet image
         self.image = self.images[self.direction]
-        self.rect = self.image.get_rect(center=(self.pos_x, self.pos_y))
+        self.rect.size = self.image.get_size()
+        self.rect.center = (self.pos_x, self.pos_y)
 
         # Get bullet mask
-        self.mask = pygame.mask.from_surface(self.image)
+        self.mask = self.assets.bullet_masks[self.direction]
         # self.mask_image = self.mask.to_surface()
 
-        # Add bullet to bullets group
+        # Bounding box of the mask, relative to the bullet's rect. It is
+        # used by resolve_bullet_collisions(), along with the rect the
+        # bullet had before its last move.
+        self.hitbox = self.assets.bullet_hitboxes[self.direction]
+        self.last_rect.update(self.rect)
+
+        # Add bullet to bullets group, and to the game updates
         self.bullet_group.add(self)
+        self.game.updates.register('bullets', self)
+
+    def release(self) -> None:
+        """
+        Takes the bullet out of the game and gives it back to the pool.
+        """
+        self.kill()
+        self.pool.release(self)
 
     def update(self) -> None:
         # Bullet movement
         self.move()
+        # Check for bullet collisions, except between bullets
+        self.check_collisions()
+
+    def check_collisions(self) -> None:
+        """
+        Runs every collision check of the bullet, except the bullet on
+        bullet one, which is resolved for all the bullets at once by
+        resolve_bullet_collisions().
+
+        NOTE: The checks stop as soon as the bullet is destroyed, since
+        it's back in the pool by then.
+        """
         # Check if bullet has reached the edge of the screen
         self.check_bullet_on_screen_border_collision()
         # Check for bullet collision with tank
-        self.check_bullet_on_tank_collision()
-        # Check for bullet collision between bullets
-        self.check_bullet_on_bullet_collision()
+        if self.alive():
+            self.check_bullet_on_tank_collision()
         # Check for bullet collision with destructable tile
-        self.check_bullet_on_obstacle_collision()
+        if self.alive():
+            self.check_bullet_on_obstacle_collision()
         # Check for bullet collision with Phoenix
-        self.check_bullet_on_phoenix_collision()
+        if self.alive():
+            self.check_bullet_on_phoenix_collision()
 
     def draw(self, window) -> None:
         window.blit(self.image, self.rect)
@@ -67,17 +126,37 @@ class Bullet(pygame.sprite.Sprite):
     def move(self) -> None:
         """
         Moves the bullet in the direction indicated in the init method.
+
+        The bullet walks the tile occupancy grid cell by cell along its
+        path, so it stops right where it first touches a brick or steel
+        tile, no matter how fast it goes. The tiles hit are stored, to
+        be handled by check_bullet_on_obstacle_collision().
         """
         # speed = gc.TANK_SPEED * 3
 
-        if self.direction == 'Up':
-            self.pos_y -= self.speed
-        elif self.direction == 'Down':
-            self.pos_y += self.speed
-        elif self.direction == 'Left':
-            self.pos_x -= self.speed
-        elif self.direction == 'Right':
-            self.pos_x += self.speed
+        self.last_rect.update(self.rect)
+        self._sweep(self.speed)
+
+    def _sweep(self, distance: float) -> None:
+        """
+        Moves the bullet up to the given distance along the tile grid,
+        until it touches a brick or steel tile, and keeps the distance
+        left and the grid revision the tiles hit were found in.
+        """
+        dx, dy = gc.DIRECTION_VECTORS[self.direction]
+
+        tile_grid = self.game.tile_grid
+        travel, self.obstacles_hit = tile_grid.sweep(
+            self.rect,
+            dx,
+            dy,
+            distance,
+            (gc.GRID_BRICK, gc.GRID_STEEL)
+        )
+        self.distance_left = distance - travel
+        self.grid_revision = tile_grid.revision
+        self.pos_x += dx * travel
+        self.pos_y += dy * travel
 
         self.rect.center = (self.pos_x, self.pos_y)
 
@@ -91,27 +170,18 @@ class Bullet(pygame.sprite.Sprite):
             self.rect.left <= gc.SCREEN_BORDER_LEFT or
             self.rect.right >= gc.SCREEN_BORDER_RIGHT
         ):
-            Explosion(
-                self.assets,
-                self.group,
-                self.rect.center,
-                1
-            )
+            self.game.pools['explosion'].acquire(self.rect.center, 1)
             self.assets.steel_sound_channel.play(
                 self.assets.steel_sound
             )
             self.update_owner()
-            self.kill()
+            self.release()
 
     def check_bullet_on_tank_collision(self) -> None:
         """
         Checks if the bullet collides with a tank.
         """
-        tank_collisions = pygame.sprite.spritecollide(
-            self,
-            self.tank_group,
-            False
-        )
+        tank_collisions = self.tank_group.spritecollide(self)
 
         for tank in tank_collisions:
             if self.owner == tank or tank.is_spawning:
@@ -121,13 +191,11 @@ class Bullet(pygame.sprite.Sprite):
                 if not self.owner.is_enemy and not tank.is_enemy:
                     self.update_owner()
                     tank.paralyze_tank(gc.TANK_PARALYSIS)
-                    Explosion(
-                        self.assets,
-                        self.group,
+                    self.game.pools['explosion'].acquire(
                         self.rect.center,
                         1
                     )
-                    self.kill()
+                    self.release()
                     break
                 # Player bullet has collided with enemy tank
                 if (
@@ -137,57 +205,36 @@ class Bullet(pygame.sprite.Sprite):
                     self.update_owner()
                     if not self.owner.is_enemy:
                         self.owner.scores.append(
-                            gc.TANK_CRITERIA[tank.level]['score']
+                            tank.score
                         )
                     tank.destroy_tank()
-                    Explosion(
-                        self.assets,
-                        self.group,
+                    self.game.pools['explosion'].acquire(
                         self.rect.center,
                         1
                     )
-                    self.kill()
+                    self.release()
                     break
 
-    def check_bullet_on_bullet_collision(self) -> None:
-        """
-        Check for collisions with other bullets and destroy self once
-        detected.
+    def check_bullet_on_obstacle_collision(self) -> None:
         """
-        bullet_hit = pygame.sprite.spritecollide(
-            self,
-            self.bullet_group,
-            False
-        )
-
-        if len(bullet_hit) == 1:
-            return
-
-        for bullet in bullet_hit:
-            if bullet == self:
-                continue
-            if pygame.sprite.collide_mask(self, bullet):
-                bullet.update_owner()
-                bullet.kill()
-                self.update_owner()
-                self.kill()
-                break
+        Handles the brick or steel tiles hit by the bullet, as found by
+        move() while walking the tile grid.
 
-    def check_bullet_on_obstacle_collision(self) -> None:
-        obstacle_collision = pygame.sprite.spritecollide(
-            self,
-            self.group['destructable_tiles'],
-            False
-        )
-        for obstacle in obstacle_collision:
+        NOTE: Every bullet moves before any hit is handled, so the tiles
+        hit may have been destroyed (or reshaped) by another bullet in
+        the meantime. If the grid has changed since, the bullet walks it
+        again along the rest of its path, and only the tiles still in
+        the way are hit.
+        """
+        if (
+            self.obstacles_hit and
+            self.grid_revision != self.game.tile_grid.revision
+        ):
+            self._sweep(self.distance_left)
+        for obstacle in self.obstacles_hit:
             self._call_bullet_on_obstacle_sounds(obstacle)
             obstacle.handle_bullet_hit(self)
-            Explosion(
-                self.assets,
-                self.group,
-                self.rect.center,
-                1
-            )
+            self.game.pools['explosion'].acquire(self.rect.center, 1)
 
     def _call_bullet_on_obstacle_sounds(self, obstacle) -> None:
         """
@@ -212,15 +259,10 @@ class Bullet(pygame.sprite.Sprite):
         on purpose!
         """
         if self.rect.colliderect(self.group['phoenix'].sprite.rect):
-            Explosion(
-                self.assets,
-                self.group,
-                self.rect.center,
-                1
-            )
+            self.game.pools['explosion'].acquire(self.rect.center, 1)
             self.update_owner()
             self.group['phoenix'].sprite.destroy_phoenix()
-            self.kill()
+            self.release()
 
     def update_owner(self) -> None:
         """
@@ -229,3 +271,104 @@ class Bullet(pygame.sprite.Sprite):
         """
         if self.owner.bullet_sum > 0:
             self.owner.bullet_sum -= 1
+
+
+def resolve_bullet_collisions(bullets) -> None:
+    """
+    Destroys every pair of bullets whose paths crossed during the last
+    tick, so two fast bullets travelling head-on can't swap places
+    without colliding.
+
+    Each bullet's hitbox is swept from where it was before its last
+    move to where it is now. The swept boxes are sorted along the X
+    axis and scanned once, keeping a list of the boxes that are still
+    open (sweep and prune), so only bullets sharing a lane are tested.
+    For those, the exact time of impact within the tick is found, and
+    the pairs are destroyed from the earliest impact on. This way, a
+    bullet already destroyed can't take a second bullet with it.
+    """
+    boxes: list = []
+    for bullet in bullets:
+        if not bullet.alive():
+            continue
+        start = bullet.hitbox.move(bullet.last_rect.topleft)
+        end = bullet.hitbox.move(bullet.rect.topleft)
+        boxes.append((start.union(end), start, end.topleft, bullet))
+    boxes.sort(key=lambda box: box[0].left)
+
+    hits: list = []
+    open_boxes: list = []
+    for index, box in enumerate(boxes):
+        swept = box[0]
+        open_boxes = [
+            other for other in open_boxes
+            if boxes[other][0].right > swept.left
+        ]
+        for other in open_boxes:
+            if not swept.colliderect(boxes[other][0]):
+                continue
+            time = _get_time_of_impact(box, boxes[other])
+            if time is not None:
+                hits.append((time, other, index))
+        open_boxes.append(index)
+
+    hits.sort()
+    for _, first, second in hits:
+        first_bullet, second_bullet = boxes[first][3], boxes[second][3]
+        if not first_bullet.alive() or not second_bullet.alive():
+            continue
+        for bullet in (first_bullet, second_bullet):
+            bullet.update_owner()
+            bullet.release()
+
+
+def _get_time_of_impact(box, other) -> float | None:
+    """
+    Returns the first moment of the tick, from 0 (start) to 1 (end),
+    at which the two moving hitboxes overlap, or None if they don't.
+    The boxes move in a straight line and at constant speed.
+    """
+    _, start, end = box[:3]
+    _, other_start, other_end = other[:3]
+    speed_x = (end[0] - start.x) - (other_end[0] - other_start.x)
+    speed_y = (end[1] - start.y) - (other_end[1] - other_start.y)
+
+    interval_x = _get_overlap_interval(
+        start.left, start.right, other_start.left, other_start.right,
+        speed_x
+    )
+    interval_y = _get_overlap_interval(
+        start.top, start.bottom, other_start.top, other_start.bottom,
+        speed_y
+    )
+    if interval_x is None or interval_y is None:
+        return None
+
+    enter = max(interval_x[0], interval_y[0], 0.0)
+    leave = min(interval_x[1], interval_y[1], 1.0)
+    if enter >= leave:
+        return None
+    return enter
+
+
+def _get_overlap_interval(
+        low: int,
+        high: int,
+        other_low: int,
+        other_high: int,
+        speed: int
+        ) -> tuple[float, float] | None:
+    """
+    Returns the times at which the segment [low, high), moving at the
+    given speed relative to [other_low, other_high), starts and stops
+    overlapping it. Returns None if they never overlap.
+    """
+    if speed == 0:
+        if low < other_high and high > other_low:
+            return float('-inf'), float('inf')
+        return None
+    enter = (other_low - high) / speed
+    leave = (other_high - low) / speed
+    if enter > leave:
+        enter, leave = leave, enter
+    return enter, leave
@@ -0,0 +1,72 @@
+class AnimationTrack:
+    """
+    A looping animation shared by any number of sprites, which only
+    read its current frame instead of keeping a timer of their own.
+
+    The track moves to the next frame once the frame time has passed
+    since the last change, as checked on each tick. The number of frames
+    advanced since the track was reset is kept too, so one-shot
+    animations (e.g. explosions) can count their own frames from the
+    moment they start.
+    """
+
+    __slots__ = (
+        'name',
+        'frame_time',
+        'frame_count',
+        'frame',
+        'steps',
+        'timer'
+    )
+
+    def __init__(self, name: str, frame_time: int, frame_count: int) -> None:
+        self.name: str = name
+        self.frame_time: int = frame_time
+        self.frame_count: int = frame_count
+        self.frame: int = 0
+        self.steps: int = 0
+        self.timer: int = 0
+
+    def reset(self, now: int) -> None:
+        self.frame = 0
+        self.steps = 0
+        self.timer = now
+
+    def advance(self, now: int) -> None:
+        if now - self.timer >= self.frame_time:
+            self.frame = (self.frame + 1) % self.frame_count
+            self.steps += 1
+            self.timer = now
+
+
+class AnimationClock:
+    """
+    Keeps the named animation tracks of the game (see
+    gc.ANIMATION_TRACKS), and advances all of them once per tick, going
+    by the game clock.
+
+    NOTE: Since the tracks are shared, sprites of the same kind animate
+    in sync (e.g. every water tile of the map), and a one-shot animation
+    may show its first frame for less than a full frame time.
+    """
+
+    def __init__(self, clock, tracks: dict[str, tuple[int, int]]) -> None:
+        self.clock = clock
+        self.tracks: dict[str, AnimationTrack] = {
+            name: AnimationTrack(name, frame_time, frame_count)
+            for name, (frame_time, frame_count) in tracks.items()
+        }
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Restarts every track from its first frame, e.g. on a new stage.
+        """
+        now = self.clock.get_ticks()
+        for track in self.tracks.values():
+            track.reset(now)
+
+    def update(self) -> None:
+        now = self.clock.get_ticks()
+        for track in self.tracks.values():
+            track.advance(now)
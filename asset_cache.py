@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+
+import game_config as gc
+
+
+class AssetCache:
+    """
+    Keeps baked assets (i.e. images and sounds already decoded) on disk,
+    so they're not decoded again on every launch.
+
+    Each cache is made of a data file, holding all of the entries one
+    after another, and a JSON manifest, holding the offset, length and
+    any other details of each entry. The whole data file is read at once.
+
+    The cache is keyed by a hash of the source files, the game settings
+    file and the given settings (e.g. the mixer format), so it's rebuilt
+    from scratch whenever any of them change.
+
+    NOTE: A missing, outdated or broken cache is just ignored, and the
+    assets are built as usual and saved again.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            sources: list[str],
+            settings: tuple = (),
+            directory: str = gc.ASSET_CACHE_DIR
+            ) -> None:
+        self.data_path: str = os.path.join(directory, f'{name}.bin')
+        self.manifest_path: str = os.path.join(directory, f'{name}.json')
+        self.key: str = self._get_key(sources, settings)
+
+        self.entries: dict[str, dict] = {}
+        self.data: bytes = b''
+        self.new_entries: dict[str, tuple[dict, bytes]] = {}
+
+        self._read()
+
+    def get(self, name: str) -> tuple[dict, memoryview] | None:
+        """
+        Returns the details and data of the given entry, or None if it's
+        not in the cache. The data is a view of the cache, not a copy.
+        """
+        entry = self.entries.get(name)
+        if entry is None:
+            return None
+        start = entry['offset']
+        return entry, memoryview(self.data)[start:start + entry['length']]
+
+    def add(self, name: str, data: bytes, **details) -> None:
+        """
+        Adds an entry to be saved to the cache.
+        """
+        self.new_entries[name] = (details, data)
+
+    def save(self) -> None:
+        """
+        Writes the cache again if any entries have been added, along
+        with the ones already in it.
+        """
+        if not self.new_entries:
+            return
+
+        entries: dict[str, tuple[dict, bytes | memoryview]] = {}
+        for name in self.entries:
+            entry, data = self.get(name)
+            details = {
+                k: v for k, v in entry.items()
+                if k not in ('offset', 'length')
+            }
+            entries[name] = (details, data)
+        entries.update(self.new_entries)
+
+        manifest: dict = {'key': self.key, 'entries': {}}
+        chunks: list[bytes | memoryview] = []
+        offset = 0
+        for name, (details, data) in entries.items():
+            manifest['entries'][name] = {
+                **details,
+                'offset': offset,
+                'length': len(data)
+            }
+            chunks.append(data)
+            offset += len(data)
+
+        data = b''.join(chunks)
+        try:
+            os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
+            self._write(self.data_path, data)
+            self._write(
+                self.manifest_path,
+                json.dumps(manifest, indent=1).encode()
+            )
+        except OSError as e:
+            print(f'Asset cache {self.data_path} not saved: {e}')
+            return
+
+        self.entries = manifest['entries']
+        self.data = data
+        self.new_entries.clear()
+
+    def _get_key(self, sources: list[str], settings: tuple) -> str:
+        """
+        Returns the hash of the cache version, the given settings and the
+        contents of the source files and the game settings file.
+        """
+        key = hashlib.sha256()
+        key.update(repr((gc.ASSET_CACHE_VERSION, settings)).encode())
+        for path in sorted(sources):
+            key.update(path.encode())
+            with open(path, 'rb') as file:
+                key.update(file.read())
+        with open(gc.__file__, 'rb') as file:
+            key.update(file.read())
+        return key.hexdigest()
+
+    def _read(self) -> None:
+        """
+        Reads the manifest and the data file, if they're up to date.
+        """
+        try:
+            with open(self.manifest_path, 'rb') as file:
+                manifest = json.load(file)
+            if manifest.get('key') != self.key:
+                return
+            with open(self.data_path, 'rb') as file:
+                data = file.read()
+        except (OSError, ValueError):
+            return
+
+        entries = manifest.get('entries', {})
+        if sum(entry['length'] for entry in entries.values()) != len(data):
+            return  # truncated or overwritten data file
+        self.entries = entries
+        self.data = data
+
+    def _write(self, path: str, data: bytes) -> None:
+        """
+        Writes the file in one go, so it's never left half written.
+        """
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_path, path)
@@ -1,44 +1,122 @@
 import random
-from typing import List
+from typing import List, NamedTuple
 
 import pygame
 from pygame.rect import Rect
 from pygame.surface import Surface
 
 import game_config as gc
-from ammunition import Bullet
-from explosions import Explosion
 from power_ups import PowerUp
+from timer_wheel import Timer
 
 
-class MyRect(pygame.sprite.Sprite):
-
-    def __init__(
-            self,
-            x_coord: int,
-            y_coord: int,
-            width: int,
-            height: int
-            ) -> None:
-
-        super().__init__()
-        self.image: None = None
-        self.rect = pygame.Rect(x_coord, y_coord, width, height)
+class TankStats(NamedTuple):
+    """
+    Stats shared by all the tanks of the same level, as defined in the
+    gc.TANK_CRITERIA table. Each tank copies them into its attributes
+    when it's created, since some of them change during the game.
+    """
+    speed: int | float
+    power: int
+    score: int
+    health: int
+
+
+# Stats per tank level. The player tanks are created at level zero, and
+# upgraded by the star power up instead, so all player levels share the
+# same stats.
+TANK_STATS: tuple[TankStats, ...] = tuple(
+    next(
+        (
+            TankStats(
+                speed=gc.TANK_SPEED * criteria['speed'],
+                power=criteria['power'],
+                score=criteria['score'],
+                health=criteria['health']
+            )
+            for criteria in gc.TANK_CRITERIA
+            if criteria['image'] == level
+        ),
+        TankStats(speed=gc.TANK_SPEED, power=1, score=100, health=1)
+    )
+    for level in range(gc.TANK_LEVELS)
+)
+
+# Area where the enemy tanks can move around
+GAME_SCREEN_RECT = Rect(
+    gc.GAME_SCREEN['pos_x'],
+    gc.GAME_SCREEN['pos_y'],
+    gc.GAME_SCREEN['width'],
+    gc.GAME_SCREEN['height']
+)
 
 
 class Tank(pygame.sprite.Sprite):
     """
     Blueprint for all the tank objects.
+
+    NOTE: Big battles can get crowded, so tank attributes are kept in
+    slots. The images, masks and level stats are shared by all tanks
+    (see GameAssets and TANK_STATS), and tanks only hold references to
+    them. They're all kept in tuples, indexed by the tank level, color
+    and direction, which are plain integers (see gc.TankColor and
+    gc.Direction). The frames for the current ones are kept in
+    self.frames (see set_frames).
     """
 
+    __slots__ = (
+        'game',
+        'assets',
+        'groups',
+        'tank_group',
+        'player_group',
+        'tank_images',
+        'spawn_images',
+        'spawn_pos',
+        'pos_x',
+        'pos_y',
+        'direction',
+        'is_spawning',
+        'is_active',
+        'tank_level',
+        'color',
+        'tank_speed',
+        'power',
+        'bullet_speed_modifier',
+        'bullet_speed',
+        'score',
+        'is_enemy',
+        'tank_health',
+        'frame_index',
+        'frames',
+        'image',
+        'rect',
+        'width',
+        'height',
+        'bullet_limit',
+        'bullet_sum',
+        'shot_cooldown_time',
+        'shot_cooldown',
+        'is_paralyzed',
+        'paralysis',
+        'paralysis_timer',
+        'spawn_image',
+        'spawn_timer',
+        'spawn_track',
+        'mask_dict',
+        'mask',
+        'mask_direction',
+        'is_amphibious'
+    )
+
     def __init__(
             self,
             game,
             assets,
             groups,
             position: tuple[int, int],
-            direction: str,
-            color: str = 'Silver',
+            direction: gc.Direction,
+            color: gc.TankColor = gc.TankColor.SILVER,
             tank_level: int = 0,
             is_enemy: bool = True
             ) -> None:
@@ -54,27 +132,19 @@ class Tank(pygame.sprite.Sprite):
         self.tank_group = self.groups['all_tanks']
         self.player_group = self.groups['player_tanks']
 
-        # Add tank object to the sprite group
-        self.tank_group.add(self)
-
         # Enemy tank criteria
-        levels: dict[int, str | None] = {
-            0: None,
-            4: 'level_0',
-            5: 'level_1',
-            6: 'level_2',
-            7: 'level_3'
-        }
-        self.level: str | None = levels[tank_level]
+        stats: TankStats = TANK_STATS[tank_level]
 
         # Tank images
-        self.tank_images: dict[str, dict[str, dict]] = self.assets.tank_images
-        self.spawn_images: dict[str, Surface] = self.assets.spawn_star_images
+        self.tank_images: tuple = self.assets.tank_images
+        self.spawn_images: tuple[Surface, ...] = (
+            self.assets.spawn_star_images
+        )
 
         # Tank position and direction
         self.spawn_pos: tuple[int, int] = position
         self.pos_x, self.pos_y = self.spawn_pos
-        self.direction: str = direction
+        self.direction: gc.Direction = direction
 
         # Tank spawning / active
         self.is_spawning: bool = True
@@ -82,61 +152,51 @@ class Tank(pygame.sprite.Sprite):
 
         # Common tank attributes
         self.tank_level: int = tank_level
-        self.color: str = color
-        self.tank_speed: int | float = (
-            gc.TANK_SPEED if not self.level
-            else gc.TANK_SPEED * gc.TANK_CRITERIA[self.level]['speed']
-        )
-        self.power: int = (
-            1 if not self.level
-            else gc.TANK_CRITERIA[self.level]['power']
-        )
+        self.color: gc.TankColor = color
+        self.tank_speed: int | float = stats.speed
+        self.power: int = stats.power
         self.bullet_speed_modifier: int = 1
-        self.bullet_speed: int = (
+        self.bullet_speed: float = (
             gc.TANK_SPEED * (3 * self.bullet_speed_modifier)
         )
-        self.score: int = (
-            100 if not self.level
-            else gc.TANK_CRITERIA[self.level]['score']
-        )
+        self.score: int = stats.score
         self.is_enemy: bool = is_enemy
-        self.tank_health: int = (
-            1 if not self.level
-            else gc.TANK_CRITERIA[self.level]['health']
-        )
+        self.tank_health: int = stats.health
 
         # Tank image, rectangle, and frame index
         self.frame_index: int = 0
-        self.image: Surface = (
-            self.tank_images[f'Tank_{self.tank_level}']
-            [self.color]
-            [self.direction]
-            [self.frame_index]
-        )
+        self.frames: tuple[Surface, ...] = ()
+        self.image: Surface | None = None
+        self.set_frames()
         self.rect = self.image.get_rect(topleft=self.spawn_pos)
         self.width, self.height = self.image.get_size()
 
+        # Add tank object to the sprite group (it needs a rect to be
+        # placed into the group's spatial hash)
+        self.tank_group.add(self)
+        self.game.updates.register('all_tanks', self)
+
         # Shoot cooldowns and bullet totals
         self.bullet_limit: int = 1
         self.bullet_sum: int = 0
         self.shot_cooldown_time: int = 500  # milliseconds
-        self.shot_cooldown: int = pygame.time.get_ticks()
+        self.shot_cooldown: int = self.game.clock.get_ticks()
 
         # Tank paralysis
         self.is_paralyzed: bool = False
         self.paralysis: int = gc.TANK_PARALYSIS
-        self.paralysis_timer: int = pygame.time.get_ticks()
+        self.paralysis_timer: Timer | None = None
 
-        # Spawn images
-        self.spawn_image = self.spawn_images[f'star_{self.frame_index}']
-        self.spawn_timer = pygame.time.get_ticks()
-        self.spawn_anim_timer = pygame.time.get_ticks()
+        # Spawn images, animated by the shared spawn star track
+        self.spawn_track = self.game.animations.tracks['spawn_star']
+        self.spawn_image = self.spawn_images[self.spawn_track.frame]
+        self.spawn_timer = self.game.clock.get_ticks()
 
         # Tank image masks
         self.mask_dict = self.get_tank_masks()
         self.mask = self.mask_dict[self.direction]
         # self.mask_image = self.mask.to_surface()
-        self.mask_direction: str = self.direction
+        self.mask_direction: gc.Direction = self.direction
 
         # Special power up?
         self.is_amphibious: bool = False
@@ -148,13 +208,6 @@ class Tank(pygame.sprite.Sprite):
         if self.is_spawning:
             self.update_spawning_animation()
             self.stop_spawning_animation()
-            return
-
-        if (
-            self.is_paralyzed and
-            pygame.time.get_ticks() - self.paralysis_timer >= self.paralysis
-        ):
-            self.is_paralyzed = False
 
     def draw(self, window: Surface) -> None:
         """
@@ -178,41 +231,37 @@ class Tank(pygame.sprite.Sprite):
 
         return pos
 
-    def move(self, direction: str) -> None:
+    def move(self, direction: gc.Direction) -> None:
         """
         Moves the tank in the given direction.
         """
         if not self.is_active:
             return
 
-        self.direction = direction
+        if direction != self.direction:
+            self.direction = direction
+            self.set_frames()
 
         if self.is_paralyzed:
-            self.image = (
-                self.tank_images[f'Tank_{self.tank_level}']
-                [self.color]
-                [self.direction]
-                [self.frame_index]
-            )
             return
 
         match direction:
-            case 'Up':
+            case gc.Direction.UP:
                 self.pos_y -= self.tank_speed
                 self.pos_x = self.align_tank_movement_to_grid(self.pos_x)
                 if self.pos_y < gc.SCREEN_BORDER_TOP:
                     self.pos_y = gc.SCREEN_BORDER_TOP
-            case 'Down':
+            case gc.Direction.DOWN:
                 self.pos_y += self.tank_speed
                 self.pos_x = self.align_tank_movement_to_grid(self.pos_x)
                 if self.pos_y + self.height > gc.SCREEN_BORDER_BOTTOM:
                     self.pos_y = gc.SCREEN_BORDER_BOTTOM - self.height
-            case 'Left':
+            case gc.Direction.LEFT:
                 self.pos_x -= self.tank_speed
                 self.pos_y = self.align_tank_movement_to_grid(self.pos_y)
                 if self.pos_x < gc.SCREEN_BORDER_LEFT:
                     self.pos_x = gc.SCREEN_BORDER_LEFT
-            case 'Right':
+            case gc.Direction.RIGHT:
                 self.pos_x += self.tank_speed
                 self.pos_y = self.align_tank_movement_to_grid(self.pos_y)
                 if self.pos_x + self.width > gc.SCREEN_BORDER_RIGHT:
@@ -235,6 +284,9 @@ class Tank(pygame.sprite.Sprite):
         # Check for tank collisions with Phoenix
         self.check_tank_on_phoenix_collision()
 
+        # Update the tank position in the spatial hash
+        self.tank_group.refresh(self)
+
     def draw_spawn_star(self, window) -> None:
         """
         Draws the spawn star on the screen.
@@ -257,34 +309,19 @@ class Tank(pygame.sprite.Sprite):
 
     def update_spawning_animation(self) -> None:
         """
-        Update the spawning star animation, if the required amount of
-        time for each image has passed.
-        """
-        animation_time = pygame.time.get_ticks() - self.spawn_anim_timer
-        if animation_time >= gc.SPAWN_ANIM_TIME:
-            self.animate_spawn_star()
-
-    def animate_spawn_star(self) -> None:
-        """
-        Cycles through the spawn star images to emulate a spawning icon.
+        Shows the current image of the spawn star animation, which
+        cycles through the spawn star images to emulate a spawning icon.
         """
-        self.frame_index += 1
-        self.frame_index = self.frame_index % len(self.spawn_images)
-        self.spawn_image = self.spawn_images[f'star_{self.frame_index}']
-        self.spawn_anim_timer = pygame.time.get_ticks()
+        self.spawn_image = self.spawn_images[self.spawn_track.frame]
 
     def stop_spawning_animation(self) -> None:
         """
         If total spawn time has passed, defeats the spawning animation
         and the tank sprite enters the game.
         """
-        spawn_time = pygame.time.get_ticks() - self.spawn_timer
+        spawn_time = self.game.clock.get_ticks() - self.spawn_timer
         if spawn_time > gc.TOTAL_SPAWN_TIME:
-            colliding_sprites: List = pygame.sprite.spritecollide(
-                self,
-                self.tank_group,
-                False
-            )
+            colliding_sprites: List = self.tank_group.spritecollide(self)
             is_our_current_tank: bool = len(colliding_sprites) == 1
             if is_our_current_tank:
                 self.frame_index = 0
@@ -293,23 +330,27 @@ class Tank(pygame.sprite.Sprite):
             else:
                 self.check_tank_on_spawn_star_collision(colliding_sprites)
 
+    def set_frames(self) -> None:
+        """
+        Picks the animation frames for the current tank level, color and
+        direction, and shows the current one.
+
+        NOTE: Must be called whenever any of the three changes, so the
+        movement animation can step through the frames without looking
+        them up in the image table every tick.
+        """
+        self.frames = (
+            self.tank_images[self.tank_level][self.color][self.direction]
+        )
+        self.image = self.frames[self.frame_index]
+
     def update_tank_movement_animation(self) -> None:
         """
         Simulates the tank moving.
         """
-        self.frame_index += 1
-        image_list_length = len(
-            self.tank_images[f'Tank_{self.tank_level}']
-            [self.color]
-            [self.direction]
-        )
-        self.frame_index = self.frame_index % image_list_length
-        self.image = (
-            self.tank_images[f'Tank_{self.tank_level}']
-            [self.color]
-            [self.direction]
-            [self.frame_index]
-        )
+        frames = self.frames
+        self.frame_index = (self.frame_index + 1) % len(frames)
+        self.image = frames[self.frame_index]
         if self.mask_direction != self.direction:
             self.mask_direction = self.direction
             self.mask = self.mask_dict[self.mask_direction]
@@ -325,11 +366,7 @@ class Tank(pygame.sprite.Sprite):
         the collision list and the current tank object will be colliding
         with itself.
         """
-        tank_collision_list = pygame.sprite.spritecollide(
-            self,
-            self.tank_group,
-            False
-        )
+        tank_collision_list = self.tank_group.spritecollide(self)
 
         if len(tank_collision_list) == 1:
             return  # The current tank is just colliding with itself!
@@ -338,42 +375,59 @@ class Tank(pygame.sprite.Sprite):
             if tank == self or tank.is_spawning:
                 continue  # Skip if it's the current tank
 
-            self._handle_tank_collisions(tank)
+            self._handle_tank_collisions(tank.rect)
 
     def check_tank_on_obstacle_collision(self) -> None:
-        obstacle_collision = pygame.sprite.spritecollide(
-            self,
-            self.groups['impassable_tiles'],
-            False
+        """
+        Checks the tank against the tile occupancy grid, so only the
+        grid cells under the tank are visited, instead of the whole
+        impassable tiles group.
+        """
+        if not self.is_enemy and self.is_amphibious:
+            blocking_codes = (gc.GRID_BRICK, gc.GRID_STEEL)
+        else:
+            blocking_codes = (gc.GRID_BRICK, gc.GRID_STEEL, gc.GRID_WATER)
+
+        obstacle_rect = self.game.tile_grid.get_blocking_rect(
+            self.rect,
+            blocking_codes
         )
-        for obstacle in obstacle_collision:
-            if (
-                obstacle in self.groups['water_tiles'] and
-                not self.is_enemy and
-                self.is_amphibious
-            ):
-                continue
-            self._handle_tank_collisions(obstacle)
+        if obstacle_rect:
+            self._handle_tank_collisions(obstacle_rect)
 
-    def _handle_tank_collisions(self, obj) -> None:
+    def _handle_tank_collisions(self, obj_rect: Rect) -> None:
         """
         Utility method that abstracts both tank-on-tank and
         tank-on-obstacle collision logic (which are separated into
         their respective functions in the original code).
 
         In any case, figures out where's the collision and handles it.
+
+        NOTE: For obstacles, the rectangle passed in bounds all of the
+        blocking tiles under the tank. Snapping to its edge gives the
+        same result as snapping to each obstacle tile in turn.
         """
-        if self.direction == 'Right' and self.rect.right >= obj.rect.left:
-            self.rect.right = obj.rect.left
+        direction = self.direction
+        if (
+            direction == gc.Direction.RIGHT and
+            self.rect.right >= obj_rect.left
+        ):
+            self.rect.right = obj_rect.left
             self.pos_x = self.rect.x
-        elif self.direction == 'Left' and self.rect.left <= obj.rect.right:
-            self.rect.left = obj.rect.right
+        elif (
+            direction == gc.Direction.LEFT and
+            self.rect.left <= obj_rect.right
+        ):
+            self.rect.left = obj_rect.right
             self.pos_x = self.rect.x
-        elif self.direction == 'Up' and self.rect.top <= obj.rect.bottom:
-            self.rect.top = obj.rect.bottom
+        elif direction == gc.Direction.UP and self.rect.top <= obj_rect.bottom:
+            self.rect.top = obj_rect.bottom
             self.pos_y = self.rect.y
-        elif self.direction == 'Down' and self.rect.bottom >= obj.rect.top:
-            self.rect.bottom = obj.rect.top
+        elif (
+            direction == gc.Direction.DOWN and
+            self.rect.bottom >= obj_rect.top
+        ):
+            self.rect.bottom = obj_rect.top
             self.pos_y = self.rect.y
 
     def check_tank_on_spawn_star_collision(
@@ -403,12 +457,10 @@ class Tank(pygame.sprite.Sprite):
         if self.bullet_sum >= self.bullet_limit:
             return
 
-        Bullet(
-            self.assets,
-            self.groups,
+        self.game.pools['bullets'].acquire(
             self,
             self.rect.center,
-            self.direction,
+            self.direction
         )
         self.assets.fire_sound_channel.play(self.assets.fire_sound)
         self.bullet_sum += 1
@@ -420,7 +472,20 @@ class Tank(pygame.sprite.Sprite):
         """
         self.paralysis = paralysis_time
         self.is_paralyzed = True
-        self.paralysis_timer = pygame.time.get_ticks()
+        if self.paralysis_timer is not None:
+            self.paralysis_timer.cancel()
+        self.paralysis_timer = self.game.timers.schedule(
+            paralysis_time,
+            self.end_paralysis
+        )
+
+    def end_paralysis(self) -> None:
+        self.is_paralyzed = False
+
+    def kill(self) -> None:
+        if self.paralysis_timer is not None:
+            self.paralysis_timer.cancel()
+        super().kill()
 
     def destroy_tank(self) -> None:
         """
@@ -430,9 +495,7 @@ class Tank(pygame.sprite.Sprite):
 
         if self.tank_health <= 0:
             self.kill()
-            Explosion(
-                self.assets,
-                self.groups,
+            self.game.pools['explosion'].acquire(
                 self.rect.center,
                 5,
                 self.score
@@ -445,25 +508,19 @@ class Tank(pygame.sprite.Sprite):
 
         # Destroying special-type tanks!
         if self.tank_health == 3:
-            self.color = 'Green'
+            self.color = gc.TankColor.GREEN
         elif self.tank_health == 2:
-            self.color = 'Gold'
+            self.color = gc.TankColor.GOLD
         elif self.tank_health == 1:
-            self.color = 'Silver'
+            self.color = gc.TankColor.SILVER
+        self.set_frames()
 
-    def get_tank_masks(self) -> dict[str, pygame.Mask]:
+    def get_tank_masks(self) -> tuple[pygame.Mask, ...]:
         """
-        Creates and returns a dictionary of tank masks for all
-        directions.
+        Returns the tank masks for all directions, as found in the mask
+        table built by GameAssets for the current tank level.
         """
-        images = {
-            direction: pygame.mask.from_surface(
-                self.tank_images[f'Tank_{self.tank_level}'][self.color]
-                [direction][0]
-            )
-            for direction in ['Up', 'Down', 'Left', 'Right']
-        }
-        return images
+        return self.assets.tank_masks[self.tank_level]
 
 
 class PlayerTank(Tank):
@@ -479,14 +536,30 @@ class PlayerTank(Tank):
     use of OOP's inheritance.
     """
 
+    __slots__ = (
+        'lives',
+        'is_dead',
+        'is_game_over',
+        'scores',
+        'has_shield_at_start',
+        'has_shield',
+        'shield_time_limit',
+        'shield_timer',
+        'shield_images',
+        'shield_track',
+        'shield_image',
+        'shield_rect',
+        'movement_sound'
+    )
+
     def __init__(
             self,
             game,
             assets,
             groups,
             position: tuple,
-            direction: str,
-            color: str = 'Silver',
+            direction: gc.Direction,
+            color: gc.TankColor = gc.TankColor.SILVER,
             tank_level: int = 0,
             ) -> None:
 
@@ -517,12 +590,11 @@ class PlayerTank(Tank):
         self.has_shield_at_start: bool = True
         self.has_shield: bool = False
         self.shield_time_limit: int = 5_000  # milliseconds
-        self.shield_timer: int = pygame.time.get_ticks()
-        self.shield_images: dict[str, Surface] = self.assets.shield_images
-        self.shield_image_index: int = 0
-        self.shield_animation_timer: int = pygame.time.get_ticks()
+        self.shield_timer: int = self.game.clock.get_ticks()
+        self.shield_images: tuple[Surface, ...] = self.assets.shield_images
+        self.shield_track = self.game.animations.tracks['shield']
         self.shield_image: Surface = self.shield_images[
-            f'shield_{self.shield_image_index + 1}'
+            self.shield_track.frame
         ]
         self.shield_rect: Rect = self.shield_image.get_rect(
             topleft=(self.rect.topleft)
@@ -544,7 +616,7 @@ class PlayerTank(Tank):
         if self.is_dead or self.is_game_over:
             return
 
-        if self.color == 'Gold':
+        if self.color == gc.TankColor.GOLD:
             self.set_control_keys(
                 key_pressed,
                 up_key=pygame.K_w,
@@ -553,7 +625,7 @@ class PlayerTank(Tank):
                 right_key=pygame.K_d
             )
 
-        if self.color == 'Green':
+        if self.color == gc.TankColor.GREEN:
             self.set_control_keys(
                 key_pressed,
                 up_key=pygame.K_UP,
@@ -565,24 +637,21 @@ class PlayerTank(Tank):
     def update(self) -> None:
         if self.is_game_over:
             return
+        now = self.game.clock.get_ticks()
         # Tank is done spawning in, startup shield must be activated
         if not self.is_spawning:
             if self.has_shield_at_start:
-                self.shield_timer = pygame.time.get_ticks()
+                self.shield_timer = now
                 self.has_shield_at_start = False
                 self.has_shield = True
             # Shield is currently active, shield image animations
             if self.has_shield:
-                if pygame.time.get_ticks() - self.shield_animation_timer >= 50:
-                    self.shield_image_index += 1
-                    self.shield_animation_timer = pygame.time.get_ticks()
-                self.shield_image_index = self.shield_image_index % 2
                 self.shield_image = self.shield_images[
-                    f'shield_{self.shield_image_index + 1}'
+                    self.shield_track.frame
                 ]
                 self.shield_rect.topleft = self.rect.topleft
                 # Check if the shield timer has run out
-                current_time = pygame.time.get_ticks() - self.shield_time_limit
+                current_time = now - self.shield_time_limit
                 if current_time >= self.shield_timer:
                     self.has_shield = False
         super().update()
@@ -594,7 +663,7 @@ class PlayerTank(Tank):
         if self.has_shield and not self.is_spawning:
             window.blit(self.shield_image, self.shield_rect)
 
-    def move(self, direction: str) -> None:
+    def move(self, direction: gc.Direction) -> None:
         if self.is_spawning:
             return
         self.assets.movement_sound_channel.play(self.movement_sound)
@@ -626,13 +695,13 @@ class PlayerTank(Tank):
         in the original game.
         """
         if key_pressed[up_key]:
-            self.move('Up')
+            self.move(gc.Direction.UP)
         elif key_pressed[down_key]:
-            self.move('Down')
+            self.move(gc.Direction.DOWN)
         elif key_pressed[left_key]:
-            self.move('Left')
+            self.move(gc.Direction.LEFT)
         elif key_pressed[right_key]:
-            self.move('Right')
+            self.move(gc.Direction.RIGHT)
 
     def destroy_tank(self) -> None:
         if self.has_shield:
@@ -644,23 +713,13 @@ class PlayerTank(Tank):
             self.tank_level = 0
             self.power = 1
             self.is_amphibious = False
-            self.image = (
-                self.tank_images[f'Tank_{self.tank_level}']
-                [self.color]
-                [self.direction]
-                [self.frame_index]
-            )
+            self.set_frames()
             self.rect = self.image.get_rect(topleft=(self.pos_x, self.pos_y))
+            self.tank_group.refresh(self)
             self.mask_dict = self.get_tank_masks()
             self.mask = self.mask_dict[self.direction]
             return
-        Explosion(
-                self.assets,
-                self.groups,
-                self.rect.center,
-                5,
-                0
-            )
+        self.game.pools['explosion'].acquire(self.rect.center, 5, 0)
         self.assets.explosion_sound_channel.play(
             self.assets.explosion_sound
         )
@@ -682,24 +741,26 @@ class PlayerTank(Tank):
         statement.
         """
         self.tank_group.add(self)
+        self.game.updates.register('all_tanks', self)
         self.is_spawning = True
         self.is_active = False
         self.has_shield_at_start = True
-        self.direction = 'Up'
+        # The paralysis timer is gone with the last stage
+        self.is_paralyzed = False
+        self.paralysis_timer = None
+        self.direction = gc.Direction.UP
         self.pos_x, self.pos_y = position
-        self.image = (
-            self.tank_images[f'Tank_{self.tank_level}']
-            [self.color][self.direction][self.frame_index]
-        )
+        self.set_frames()
         self.rect.topleft = (self.pos_x, self.pos_y)
+        self.tank_group.refresh(self)
         self.scores.clear()
 
     def respawn_tank(self) -> None:
         self.is_spawning = True
         self.is_active = False
         self.has_shield_at_start = True
-        self.spawn_timer = pygame.time.get_ticks()
-        self.direction = 'Up'
+        self.spawn_timer = self.game.clock.get_ticks()
+        self.direction = gc.Direction.UP
         self.tank_level = 0
         self.power = 1
         self.is_amphibious = False
@@ -707,11 +768,9 @@ class PlayerTank(Tank):
         self.bullet_speed = (gc.TANK_SPEED * (3 * self.bullet_speed_modifier))
         self.bullet_limit = 1
         self.pos_x, self.pos_y = self.spawn_pos
-        self.image = (
-            self.tank_images[f'Tank_{self.tank_level}']
-            [self.color][self.direction][self.frame_index]
-        )
+        self.set_frames()
         self.rect.topleft = (self.pos_x, self.pos_y)
+        self.tank_group.refresh(self)
         self.mask_dict = self.get_tank_masks()
         self.mask = self.mask_dict[self.direction]
         self.is_dead = False
@@ -722,14 +781,22 @@ class EnemyTank(Tank):
     Blueprint specifically for AI-controlled enemy tanks.
     """
 
+    __slots__ = (
+        'time_between_shots',
+        'is_reloaded',
+        'shot_timer',
+        'movement_directions',
+        'change_direction_timer'
+    )
+
     def __init__(
             self,
             game,
             assets,
             groups,
             position: tuple[int, int],
-            direction: str,
-            color: str = 'Silver',
+            direction: gc.Direction,
+            color: gc.TankColor = gc.TankColor.SILVER,
             tank_level: int = 0,
             is_enemy: bool = True
             ) -> None:
@@ -746,43 +813,14 @@ class EnemyTank(Tank):
         )
 
         self.time_between_shots: int = random.choice([300, 600, 900])
-        self.shot_timer: int = pygame.time.get_ticks()
-
-        self.directional_rects: dict[str, MyRect] = {
-            'Left': MyRect(
-                self.pos_x - (self.width // 2),
-                self.pos_y,
-                self.width // 2,
-                self.height
-            ),
-            'Right': MyRect(
-                self.pos_x + self.width,
-                self.pos_y,
-                self.width // 2,
-                self.height
-            ),
-            'Up': MyRect(
-                self.pos_x,
-                self.pos_y - (self.height // 2),
-                self.width,
-                self.height // 2
-            ),
-            'Down': MyRect(
-                self.pos_x,
-                self.pos_y + self.height,
-                self.width,
-                self.height // 2
-            ),
-        }
+        self.is_reloaded: bool = False
+        self.shot_timer: Timer = self.game.timers.schedule(
+            self.time_between_shots,
+            self.reload
+        )
 
         self.movement_directions: list = []
-        self.change_direction_timer: int = pygame.time.get_ticks()
-        self.game_screen_rect: MyRect = MyRect(
-            gc.GAME_SCREEN['pos_x'],
-            gc.GAME_SCREEN['pos_y'],
-            gc.GAME_SCREEN['width'],
-            gc.GAME_SCREEN['height'],
-        )
+        self.change_direction_timer: int = self.game.clock.get_ticks()
 
     def update(self) -> None:
         super().update()
@@ -795,65 +833,79 @@ class EnemyTank(Tank):
     def draw(self, window: Surface) -> None:
         super().draw(window)
         # To visualize and debug the available directions in runtime
-        # for value in self.directional_rects.values():
-        #     pygame.draw.rect(window, gc.RGB_GREEN, value.rect, 2)
+        # for value in self.get_directional_rects().values():
+        #     pygame.draw.rect(window, gc.RGB_GREEN, value, 2)
 
     def fire(self) -> None:
         if self.is_paralyzed:
             return
-        current_time = pygame.time.get_ticks()
-        if (
-            self.bullet_sum < self.bullet_limit and
-            current_time - self.shot_timer >= self.time_between_shots
-        ):
+        if self.is_reloaded and self.bullet_sum < self.bullet_limit:
             self.shoot()
-            self.shot_timer = pygame.time.get_ticks()
+            self.is_reloaded = False
+            self.shot_timer = self.game.timers.schedule(
+                self.time_between_shots,
+                self.reload
+            )
 
-    def move(self, direction: str) -> None:
-        super().move(direction)
-        self.directional_rects['Left'].rect.update(
-            self.pos_x - (self.width // 2),
-            self.pos_y,
-            self.width // 2,
-            self.height
-        )
-        self.directional_rects['Right'].rect.update(
-            self.pos_x + self.width,
-            self.pos_y,
-            self.width // 2,
-            self.height
-        )
-        self.directional_rects['Up'].rect.update(
-            self.pos_x,
-            self.pos_y - (self.height // 2),
-            self.width,
-            self.height // 2
-        )
-        self.directional_rects['Down'].rect.update(
-            self.pos_x,
-            self.pos_y + self.height,
-            self.width,
-            self.height // 2
-        )
+    def reload(self) -> None:
+        """
+        Lets the tank fire again, once the time between shots has passed
+        since the last one.
+        """
+        self.is_reloaded = True
+
+    def kill(self) -> None:
+        self.shot_timer.cancel()
+        super().kill()
+
+    def get_directional_rects(self) -> dict[gc.Direction, Rect]:
+        """
+        Returns the rectangles placed next to each side of the tank,
+        which are used to probe the available movement directions.
+        """
+        half_width, half_height = self.width // 2, self.height // 2
+        return {
+            gc.Direction.LEFT: Rect(
+                self.pos_x - half_width,
+                self.pos_y,
+                half_width,
+                self.height
+            ),
+            gc.Direction.RIGHT: Rect(
+                self.pos_x + self.width,
+                self.pos_y,
+                half_width,
+                self.height
+            ),
+            gc.Direction.UP: Rect(
+                self.pos_x,
+                self.pos_y - half_height,
+                self.width,
+                half_height
+            ),
+            gc.Direction.DOWN: Rect(
+                self.pos_x,
+                self.pos_y + self.height,
+                self.width,
+                half_height
+            ),
+        }
 
     def select_movement_direction(self) -> None:
         """
         Recreates the computer-controlled movement for enemy tanks.
         """
         movement_directions_copy: list = self.movement_directions.copy()
-        if pygame.time.get_ticks() - self.change_direction_timer <= 750:
+        if self.game.clock.get_ticks() - self.change_direction_timer <= 750:
             return
 
         # FIXME: Lots of boilerplate code and nested conditionals below!
         # Check for collision detection
-        for key, value in self.directional_rects.items():
+        for key, value in self.get_directional_rects().items():
             # Make sure the rect is within the game screen
-            if pygame.Rect.contains(self.game_screen_rect.rect, value):
+            if GAME_SCREEN_RECT.contains(value):
                 # Check for any collision with impassable tiles
-                obstacle = pygame.sprite.spritecollideany(
-                    value,
-                    self.groups['impassable_tiles']
-                )
+                obstacle = self.game.tile_grid.get_first_tile(value)
                 if not obstacle:
                     # Check if direction is already in directions list
                     if key not in movement_directions_copy:
@@ -862,7 +914,7 @@ class EnemyTank(Tank):
                     # If there's collision, first check rect is fully
                     # contained by obstacle
                     if (
-                        value.rect.contains(obstacle.rect) and
+                        value.contains(obstacle.rect) and
                         key in movement_directions_copy
                     ):
                         movement_directions_copy.remove(key)
@@ -873,10 +925,7 @@ class EnemyTank(Tank):
                         ):
                             movement_directions_copy.remove(key)
                 # Check if there's a tank-on-tank collision
-                tank = pygame.sprite.spritecollideany(
-                    value,
-                    self.groups['all_tanks']
-                )
+                tank = self.tank_group.rectcollideany(value)
                 if tank:
                     if key in movement_directions_copy:
                         movement_directions_copy.remove(key)
@@ -891,19 +940,22 @@ class EnemyTank(Tank):
             self.movement_directions = movement_directions_copy.copy()
             if len(self.movement_directions) > 0:
                 self.direction = random.choice(self.movement_directions)
-            self.change_direction_timer = pygame.time.get_ticks()
+                self.set_frames()
+            self.change_direction_timer = self.game.clock.get_ticks()
 
 
 class SpecialTank(EnemyTank):
 
+    __slots__ = ('flash_track', 'is_special')
+
     def __init__(
             self,
             game,
             assets,
             groups,
             position: tuple[int, int],
-            direction: str,
-            color: str = 'Silver',
+            direction: gc.Direction,
+            color: gc.TankColor = gc.TankColor.SILVER,
             tank_level: int = 0,
             is_enemy: bool = True
             ) -> None:
@@ -919,7 +971,7 @@ class SpecialTank(EnemyTank):
             is_enemy
         )
 
-        self.color_swap_timer: int = pygame.time.get_ticks()
+        self.flash_track = self.game.animations.tracks['special_flash']
         self.is_special: bool = True
 
     def update(self) -> None:
@@ -928,9 +980,14 @@ class SpecialTank(EnemyTank):
         """
         super().update()
         if self.is_special:
-            if pygame.time.get_ticks() - self.color_swap_timer >= 100:
-                self.color = 'Special' if self.color == 'Silver' else 'Silver'
-                self.color_swap_timer = pygame.time.get_ticks()
+            color = (
+                gc.TankColor.SPECIAL
+                if self.flash_track.frame
+                else gc.TankColor.SILVER
+            )
+            if color != self.color:
+                self.color = color
+                self.set_frames()
 
     def destroy_tank(self) -> None:
         if self.is_special:
@@ -2,55 +2,86 @@ import pygame
 from pygame.surface import Surface
 from pygame.rect import Rect
 
-from scores import ScoreBanner
-
 
 class Explosion(pygame.sprite.Sprite):
 
-    def __init__(
-            self,
-            assets,
-            groups,
-            position: tuple[int, int],
-            explode_type: int = 1,
-            score: int = 100
-            ) -> None:
+    __slots__ = (
+        'game',
+        'assets',
+        'groups',
+        'explosion_group',
+        'explode_type',
+        'position',
+        'frame_index',
+        'images',
+        'image',
+        'rect',
+        'track',
+        'start_step',
+        'score',
+        'pool'
+    )
+
+    def __init__(self, game, assets, groups, pool) -> None:
+        """
+        Creates a blank explosion. Explosions are pooled by the Game
+        object, so they're brought to life by reset(), through the
+        pool's acquire(), and taken out of the game by release().
+        """
         super().__init__()
 
+        self.game = game
         self.assets = assets
         self.groups = groups
+        self.pool = pool
         self.explosion_group = self.groups['explosion']
+
+        self.images: dict[str, Surface] = self.assets.explosions_images
+        self.track = self.game.animations.tracks['explosion']
+
+    def reset(
+            self,
+            position: tuple[int, int],
+            explode_type: int = 1,
+            score: int = 100
+            ) -> None:
         self.explosion_group.add(self)
+        self.game.updates.register('explosion', self)
 
         self.explode_type: int = explode_type
 
         self.position: tuple[int, int] = position
         self.frame_index: int = 1
-        self.images: dict[str, Surface] = self.assets.explosions_images
         self.image: Surface = self.images['explode_1']
         self.rect: Rect = self.image.get_rect(center=self.position)
 
-        self.animation_timer: int = pygame.time.get_ticks()
+        # Explosions count their frames on the shared explosion track
+        self.start_step: int = self.track.steps
 
         self.score: int = score
 
+    def release(self) -> None:
+        """
+        Takes the explosion out of the game and gives it back to the
+        pool.
+        """
+        self.kill()
+        self.pool.release(self)
+
     def update(self) -> None:
-        if pygame.time.get_ticks() - self.animation_timer >= 100:
-            self.frame_index += 1
+        frame_index = self.track.steps - self.start_step + 1
+        if frame_index != self.frame_index:
+            self.frame_index = frame_index
             if self.frame_index >= len(self.images):
-                self.kill()
+                self.release()
                 if self.score == 0:
                     return
-                ScoreBanner(
-                    self.assets,
-                    self.groups,
-                    self.position,
-                    self.score
-                )
+                self.game.pools['scores'].acquire(self.position, self.score)
+                return
             # Differentiating between a small and a large explosion
             if self.explode_type == 1 and self.frame_index > 3:
-                self.kill()
-            self.animation_timer = pygame.time.get_ticks()
+                self.release()
+                return
             self.image: Surface = self.images[f'explode_{self.frame_index}']
             self.rect: Rect = self.image.get_rect(center=self.position)
 
@@ -6,7 +6,12 @@ import game_config as gc
 
 class Fade:
 
-    def __init__(self, game, assets, speed: int = 5) -> None:
+    def __init__(
+            self,
+            game,
+            assets,
+            speed: float = gc.FADE_SPEED
+            ) -> None:
         self.game = game
         self.assets = assets
 
@@ -18,7 +23,7 @@ class Fade:
         self.is_fade_in = True
         self.is_fade_out = False
         self.transition = False
-        self.timer = pygame.time.get_ticks()
+        self.timer = self.game.clock.get_ticks()
 
         self.top_rect = pygame.Rect(
             0,
@@ -85,10 +90,10 @@ class Fade:
                 self.is_fade_in = False
                 self.is_fade_out = False
                 self.transition = True
-                self.timer = pygame.time.get_ticks()
+                self.timer = self.game.clock.get_ticks()
 
         elif self.transition:
-            if pygame.time.get_ticks() - self.timer >= 1_000:
+            if self.game.clock.get_ticks() - self.timer >= 1_000:
                 self.is_fade_in = False
                 self.is_fade_out = True
                 self.transition = False
@@ -127,11 +132,11 @@ class Fade:
 
     def make_y_coord_fade(
             self,
-            y_coord: int,
+            y_coord: float,
             start_pos: int,
             end_pos: int,
-            speed: int
-            ) -> int:
+            speed: float
+            ) -> float:
         """
         Accepts the Y-coordinate of the fade rectangles, and updates
         their positions to the end position.
@@ -160,20 +165,10 @@ class Fade:
         )
         surface.fill(gc.RGB_GREY)
         surface.blit(self.images['stage'], (0, 0))
-        # Adding one digit if stage number < 10
-        if self.level < 10:
-            surface.blit(
-                self.images['num_0'],
-                (self.stage_pic_width + self.num_pic_width, 0)
-            )
-        else:
-            surface.blit(
-                self.images[f'num_{str(self.level)[0]}'],
-                (self.stage_pic_width + self.num_pic_width, 0)
-            )
+        # Adding a leading zero if stage number < 10
         surface.blit(
-            self.images[f'num_{str(self.level)[-1]}'],
-            (self.stage_pic_width + (self.num_pic_width * 2), 0)
+            self.assets.glyph_cache.render_number(self.level, 'hud', 2),
+            (self.stage_pic_width + self.num_pic_width, 0)
         )
 
         return surface
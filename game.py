@@ -1,16 +1,31 @@
 import random
+from functools import lru_cache, partial
 
 import pygame
+from pygame.rect import Rect
 from pygame.surface import Surface
 
 import game_config as gc
 from game_hud import GameHUD
+from ammunition import Bullet, resolve_bullet_collisions
+from animation_clock import AnimationClock
 from characters import PlayerTank, EnemyTank, SpecialTank
-from tile import BrickTile, SteelTile, ForestTile, IceTile, WaterTile
+from tile import BrickTile, SteelTile
 from fade_animation import Fade
+from explosions import Explosion
+from game_clock import GameClock
 from phoenix import Phoenix
+from pools import ObjectPool
+from renderer import GameRenderer
+from terrain_layer import TerrainLayer
+from scores import ScoreBanner
+from stage_prototype import StagePrototype
+from tile_grid import TileGrid
+from timer_wheel import Timer, TimerWheel
+from update_registry import UpdateRegistry
 from screens.score_screen import ScoreScreen
 from screens.game_over import GameOver
+from spatial_hash import SpatialHashGroup
 
 
 class Game:
@@ -33,12 +48,19 @@ class Game:
         # Important files
         self.main = main
         self.assets = assets
+        self.is_headless: bool = self.main.is_headless
+
+        # Virtual clock for every timer in the game (see GameClock), the
+        # animations shared by the sprites, and the gameplay timers
+        self.clock = GameClock()
+        self.animations = AnimationClock(self.clock, gc.ANIMATION_TRACKS)
+        self.timers = TimerWheel(self.clock)
 
         # Object groups
         self.groups = {
             'ice_tiles': pygame.sprite.Group(),
             'water_tiles': pygame.sprite.Group(),
-            'all_tanks': pygame.sprite.Group(),
+            'all_tanks': SpatialHashGroup(),
             'player_tanks': pygame.sprite.Group(),
             'bullets': pygame.sprite.Group(),
             'destructable_tiles': pygame.sprite.Group(),
@@ -50,6 +72,30 @@ class Game:
             'scores': pygame.sprite.Group()
         }
 
+        # Entities with per-tick behaviour, by update phase, in update
+        # order (phases are named after their sprite groups)
+        self.updates = UpdateRegistry((
+            'all_tanks',
+            'bullets',
+            'explosion',
+            'power_ups',
+            'scores'
+        ))
+
+        # Object pools for the short-lived sprites, named after their
+        # sprite groups (see ObjectPool)
+        self.pools: dict[str, ObjectPool] = {
+            'bullets': ObjectPool(
+                partial(Bullet, self.assets, self.groups)
+            ),
+            'explosion': ObjectPool(
+                partial(Explosion, self, self.assets, self.groups)
+            ),
+            'scores': ObjectPool(
+                partial(ScoreBanner, self, self.assets, self.groups)
+            )
+        }
+
         # Player attributes
         self.is_player_1_active = is_player_1_active
         self.player_1_score: int = 0
@@ -60,14 +106,28 @@ class Game:
         # Game HUD
         self.hud = GameHUD(self, self.assets)
 
+        # Pre-rendered map tiles (never drawn in headless mode), and the
+        # game screen renderer
+        self.terrain: TerrainLayer | None = (
+            None if self.is_headless else TerrainLayer(self)
+        )
+        self.renderer = GameRenderer(self)
+
+        # Impassable tiles occupancy, for collision detection
+        self.tile_grid = TileGrid()
+
         # Level information
         self.level_num: int = 1
         self.is_level_complete = False
         self.level_transition_timer = None  # mehtod to be dev soon!
         self.data = self.main.levels
+        # Most recently played stages, compiled, by level index
+        self._get_stage_prototype = lru_cache(gc.STAGE_CACHE_SIZE)(
+            self._compile_stage
+        )
 
         # Level fade
-        self.fade = Fade(self, self.assets, 10)
+        self.fade = Fade(self, self.assets)
 
         # Stage score screen
         self.score_screen = ScoreScreen(self, self.assets)
@@ -82,8 +142,8 @@ class Game:
                 self.assets,
                 self.groups,
                 position=gc.PLAYER_1_POS,
-                direction='Up',
-                color='Gold'
+                direction=gc.Direction.UP,
+                color=gc.TankColor.GOLD
             )
 
         if self.is_player_2_active:
@@ -92,23 +152,25 @@ class Game:
                 self.assets,
                 self.groups,
                 position=gc.PLAYER_2_POS,
-                direction='Up',
-                color='Green'
+                direction=gc.Direction.UP,
+                color=gc.TankColor.GREEN
             )
 
         # Number of enemy tanks
         self.enemies: int = 20
-        self.enemy_tank_spawn_timer: int = gc.TANK_SPAWNING_TIME
+        # NOTE: The spawn timer starts in the past, so the first enemy
+        # tank spawns as soon as the stage begins.
+        self.enemy_tank_spawn_timer: int = -gc.TANK_SPAWNING_TIME
         self.enemy_spawn_positions: list[tuple[int, int]] = [
             gc.ENEMY_POS_1, gc.ENEMY_POS_2, gc.ENEMY_POS_3
         ]
 
-        # Load the stage
-        self.create_new_stage()
-
         # Fortify power up
         self.is_base_fortified: bool = False
-        self.fortify_timer: int = pygame.time.get_ticks()
+        self.fortify_timer: Timer | None = None
+
+        # Load the stage
+        self.create_new_stage()
 
         # Game active or game over
         self.is_active: bool = True
@@ -117,17 +179,10 @@ class Game:
 
     def input(self) -> None:
         """
-        Handles input events for the game when it's running.
+        Handles input events for the game when it's running, once per
+        rendered frame. The player controls are read on every tick
+        instead (see read_controls).
         """
-        key_pressed = pygame.key.get_pressed()
-
-        if self.is_player_1_active:
-            self.player_1.input(key_pressed)
-
-        if self.is_player_2_active:
-            self.player_2.input(key_pressed)
-
-        # Pygame event handler
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.main.run = False
@@ -137,6 +192,24 @@ class Game:
                 if event.key == pygame.K_ESCAPE:
                     self.is_active = False
 
+                # Keyboard shortcuts for the window size (F1, F2...), on
+                # the native render path only
+                if (
+                    pygame.K_F1 <= event.key <
+                    pygame.K_F1 + gc.MAX_OUTPUT_SCALE
+                ):
+                    self.main.set_output_scale(event.key - pygame.K_F1 + 1)
+
+                # Pause (P), and single ticks while paused (period)
+                if event.key == pygame.K_p:
+                    self.clock.toggle_pause()
+                elif event.key == pygame.K_PERIOD:
+                    self.step_once()
+
+                # Firing, like movement, is off while the game is paused
+                if self.clock.is_paused:
+                    continue
+
                 # dbg
                 if event.key == pygame.K_SPACE:
                     if self.player_1.is_active:
@@ -147,8 +220,50 @@ class Game:
                     if self.player_2.is_active:
                         self.player_2.shoot()
 
+    def read_controls(self) -> None:
+        """
+        Moves the player tanks by the keys held down, once per
+        simulation tick, so they move at the same pace whatever the
+        frame rate.
+        """
+        if self.clock.is_paused:
+            return
+
+        key_pressed = pygame.key.get_pressed()
+
+        if self.is_player_1_active:
+            self.player_1.input(key_pressed)
+
+        if self.is_player_2_active:
+            self.player_2.input(key_pressed)
+
     def update(self) -> None:
-        self.hud.update()
+        if self.clock.is_paused:
+            return
+        self._update_tick()
+
+    def step_once(self) -> None:
+        """
+        Runs a single simulation tick while the game is paused, moving
+        the game clock forward by a tick time, so the timers stay in step
+        with everything else.
+        """
+        if not self.clock.is_paused:
+            return
+        self.renderer.save_positions()
+        self.clock.step()
+        self._update_tick()
+
+    def _update_tick(self) -> None:
+        """
+        Runs every update phase of a simulation tick.
+        """
+        if self.is_headless:
+            # NOTE: Nothing is ever drawn, so neither is the HUD composed
+            # nor are the tile grid changes kept for the renderer.
+            self.tile_grid.changed_rects.clear()
+        else:
+            self.hud.update()
 
         if self.game_over_screen.is_active:
             self.game_over_screen.update()
@@ -157,7 +272,7 @@ class Game:
             self.fade.update()
             if not self.fade.is_fade_active:
                 for tank in self.groups['all_tanks']:
-                    tank.spawn_timer = pygame.time.get_ticks()
+                    tank.spawn_timer = self.clock.get_ticks()
             return
 
         if not self.is_game_over:
@@ -172,6 +287,7 @@ class Game:
                     self.player_2.is_game_over and
                     self.game_over_screen.is_active
                 ):
+                    self.updates.unregister(*self.groups['all_tanks'])
                     self.groups['all_tanks'].empty()
                     self.is_game_over = True
                     self.assets.game_over_sound_channel.play(
@@ -181,6 +297,7 @@ class Game:
                     return
             elif self.is_player_1_active and not self.is_player_2_active:
                 if self.player_1.is_game_over:
+                    self.updates.unregister(*self.groups['all_tanks'])
                     self.groups['all_tanks'].empty()
                     self.is_game_over = True
                     self.assets.game_over_sound_channel.play(
@@ -196,16 +313,13 @@ class Game:
             self.create_stage_transition(True)
             return
 
-        if self.is_base_fortified:
-            if pygame.time.get_ticks() - self.fortify_timer >= 10_000:
-                self.apply_fortify(start=False, end=True)
-                self.is_base_fortified = False
-
-        for k in self.groups.keys():
-            if k == 'player_tanks':
+        self.timers.update()
+        self.animations.update()
+        for phase in self.updates.phases:
+            if phase == 'bullets':
+                self._update_bullets()
                 continue
-            for item in self.groups[k]:
-                item.update()
+            self.updates.update(phase)
 
         self.spawn_enemy_tanks()
 
@@ -225,7 +339,7 @@ class Game:
 
         if self.enemies_killed <= 0 and not self.level_complete:
             self.level_complete = True
-            self.level_transition_timer = pygame.time.get_ticks()
+            self.level_transition_timer = self.clock.get_ticks()
 
         if self.level_complete:
             """
@@ -235,15 +349,28 @@ class Game:
             had a power up and it was nearby, the buffer allows the
             player to catch that power up before the level truly ends!
             """
-            time_buffer = pygame.time.get_ticks() - self.level_transition_timer
+            time_buffer = self.clock.get_ticks() - self.level_transition_timer
             if time_buffer >= gc.TRANSITION_TIMER:
                 self.create_stage_transition(is_game_over=False)
                 # self.level_num += 1
                 # self.create_new_stage()
 
-    def draw(self, window: Surface) -> None:
+    def draw(
+            self,
+            window: Surface,
+            alpha: float = 1.0
+            ) -> list[Rect] | None:
+        """
+        Draws the game on the given window object, through the dirty
+        rectangles renderer, with the moving sprites interpolated by the
+        given alpha (see GameRenderer.draw). Returns the list of areas
+        repainted, or None if the whole window has been.
         """
-        Draws the given window object on the screen.
+        return self.renderer.draw(window, alpha)
+
+    def draw_screen(self, window: Surface) -> None:
+        """
+        Draws the whole game screen on the given window object.
         """
         self.hud.draw(window)
 
@@ -251,13 +378,8 @@ class Game:
             self.score_screen.draw(window)
             return
 
-        for k in self.groups.keys():
-            if k == 'impassable_tiles':
-                continue  # lets bullets be drawn above water!
-            are_there_tanks: bool = k == 'all_tanks' or k == 'player_tanks'
-            if self.fade.is_fade_active and are_there_tanks:
-                continue
-            for item in self.groups[k]:
+        for group in self.get_drawing_groups():
+            for item in group:
                 item.draw(window)
 
         if self.fade.is_fade_active:
@@ -266,9 +388,34 @@ class Game:
         if self.game_over_screen.is_active:
             self.game_over_screen.draw(window)
 
+    def get_drawing_groups(self) -> list[pygame.sprite.AbstractGroup]:
+        """
+        Returns the sprite groups to be drawn, in drawing order.
+
+        NOTE: The ice, brick, steel and forest tiles are not drawn one
+        by one, but through the pre-rendered terrain (see TerrainLayer).
+        """
+        groups: list[pygame.sprite.AbstractGroup] = []
+        for k in self.groups.keys():
+            if k == 'impassable_tiles':
+                continue  # lets bullets be drawn above water!
+            if k == 'destructable_tiles':
+                continue  # already on the terrain ground
+            if k == 'ice_tiles':
+                groups.append(self.terrain.ground_group)
+                continue
+            if k == 'forest_tiles':
+                groups.append(self.terrain.overlay_group)
+                continue
+            are_there_tanks: bool = k == 'all_tanks' or k == 'player_tanks'
+            if self.fade.is_fade_active and are_there_tanks:
+                continue
+            groups.append(self.groups[k])
+        return groups
+
     def create_stage_transition(self, is_game_over: bool) -> None:
         if not self.score_screen.is_active:
-            self.score_screen.timer = pygame.time.get_ticks()
+            self.score_screen.timer = self.clock.get_ticks()
             if self.is_player_1_active:
                 self.score_screen.player_1_score = self.player_1_score
                 self.score_screen.player_1_enemies_killed = sorted(
@@ -280,33 +427,42 @@ class Game:
                     self.player_2.scores
                 )
             self.score_screen.update_basic_info(self.top_score, self.level_num)
+            if not is_game_over:
+                # Compile the next stage while the score screen is on
+                next_level_num = (self.level_num + 1) % len(self.data)
+                self._get_stage_prototype(next_level_num - 1)
         self.score_screen.is_active = True
         self.score_screen.update(is_game_over)
 
     def change_level(self, player_1_score, player_2_score) -> None:
         self.level_num += 1
         # We don't want our number of stages to surpass the actual list!
-        self.level_num = self.level_num % len(self.data.level_data)
+        self.level_num = self.level_num % len(self.data)
         self.player_1_score = player_1_score
         self.player_2_score = player_2_score
         self.create_new_stage()
 
     def create_new_stage(self) -> None:
         self._reset_sprite_groups()
+        self.renderer.invalidate()
+        self.animations.reset()
 
-        self.current_level_data = self.data.level_data[self.level_num - 1]
+        prototype = self._get_stage_prototype(self.level_num - 1)
         self.enemies = random.choice([16, 17, 18, 19, 20])
         self.enemies = 20  # remember if you edit: 20 is the standard
         self.enemies_killed = self.enemies
 
-        self.load_level_data(self.current_level_data)
+        prototype.instantiate(self)
+        if not self.is_headless:
+            self.terrain.build(prototype)
         self.phoenix = Phoenix(self, self.assets, self.groups)
         self.level_complete = False
 
         self.assets.game_start_sound.play()
 
         self.fade.level = self.level_num
-        self.fade.stage_image = self.fade.create_stage_image()
+        if not self.is_headless:
+            self.fade.stage_image = self.fade.create_stage_image()
         self.fade.is_fade_active = True
 
         self.generate_spawn_queue()
@@ -318,64 +474,16 @@ class Game:
         if self.is_player_2_active:
             self.player_2.spawn_on_new_stage(gc.PLAYER_2_POS)
 
-    def load_level_data(self, level) -> None:
+    def _compile_stage(self, index: int) -> StagePrototype:
         """
-        Decodes the level data found in its CSV file.
+        Compiles the level with the given (zero-based) index into a
+        stage prototype.
         """
-        self.grid = []
-        for i, row in enumerate(level):
-            line = []
-            for j, tile in enumerate(row):
-                position = (
-                    gc.SCREEN_BORDER_LEFT + (j * gc.IMAGE_SIZE // 2),
-                    gc.SCREEN_BORDER_TOP + (i * gc.IMAGE_SIZE // 2)
-                )
-                tile_id = int(tile)
-
-                if tile_id < 0:
-                    line.append(' ')
-                elif tile_id == gc.ID_BRICK:
-                    line.append(f'{tile}')
-                    map_tile = BrickTile(
-                        position,
-                        self.groups['destructable_tiles'],
-                        self.assets.brick_tiles
-                    )
-                    self.groups['impassable_tiles'].add(map_tile)
-                elif tile_id == gc.ID_STEEL:
-                    line.append(f'{tile}')
-                    map_tile = SteelTile(
-                        position,
-                        self.groups['destructable_tiles'],
-                        self.assets.steel_tiles
-                    )
-                    self.groups['impassable_tiles'].add(map_tile)
-                elif tile_id == gc.ID_FOREST:
-                    line.append(f'{tile}')
-                    map_tile = ForestTile(
-                        position,
-                        self.groups['forest_tiles'],
-                        self.assets.forest_tiles
-                    )
-                elif tile_id == gc.ID_ICE:
-                    line.append(f'{tile}')
-                    map_tile = IceTile(
-                        position,
-                        self.groups['ice_tiles'],
-                        self.assets.ice_tiles
-                    )
-                elif tile_id == gc.ID_WATER:
-                    line.append(f'{tile}')
-                    map_tile = WaterTile(
-                        position,
-                        self.groups['water_tiles'],
-                        self.assets.water_tiles
-                    )
-                    self.groups['impassable_tiles'].add(map_tile)
-                elif tile_id == gc.ID_FLAG:
-                    line.append(f'{tile}')
-
-            self.grid.append(line)
+        return StagePrototype(
+            self.data.get_level(index),
+            self.assets,
+            self.is_headless
+        )
 
     def generate_spawn_queue(self) -> None:
         """
@@ -388,14 +496,14 @@ class Game:
 
         for lvl, ratio in enumerate(self.spawn_queue_ratios):
             for i in range(int(round(self.enemies * (ratio / 100)))):
-                self.spawn_queue.append(f'level_{lvl}')
+                self.spawn_queue.append(gc.EnemyTier(lvl))
         random.shuffle(self.spawn_queue)
 
     def spawn_enemy_tanks(self) -> None:
         if self.enemies == 0:
             return
 
-        spawn_time = pygame.time.get_ticks() - self.enemy_tank_spawn_timer
+        spawn_time = self.clock.get_ticks() - self.enemy_tank_spawn_timer
         if spawn_time >= gc.TANK_SPAWNING_TIME:
             position = self.enemy_spawn_positions[self.spawn_pos_index % 3]
             tank_level = gc.TANK_CRITERIA[
@@ -410,8 +518,8 @@ class Game:
                     self.assets,
                     self.groups,
                     position,
-                    'Down',
-                    'Silver',
+                    gc.Direction.DOWN,
+                    gc.TankColor.SILVER,
                     tank_level
                 )
             else:
@@ -420,8 +528,8 @@ class Game:
                     self.assets,
                     self.groups,
                     position,
-                    'Down',
-                    'Silver',
+                    gc.Direction.DOWN,
+                    gc.TankColor.SILVER,
                     tank_level
                 )
             self._reset_enemy_tank_spawn_timer()
@@ -431,20 +539,60 @@ class Game:
         Utility method for cleaning the spawn_enemy_tanks() original
         code. It just do what the function name says. :P
         """
-        self.enemy_tank_spawn_timer = pygame.time.get_ticks()
+        self.enemy_tank_spawn_timer = self.clock.get_ticks()
         self.spawn_pos_index += 1
         self.spawn_queue_index += 1
         self.enemies -= 1
 
+    def _update_bullets(self) -> None:
+        """
+        Utility method for updating the bullets in three passes: first
+        all of them move, then the bullet on bullet collisions of the
+        whole tick are resolved at once, and finally the bullets still
+        alive run the rest of their collision checks.
+        """
+        bullets = self.updates.get_entities('bullets')
+        for bullet in bullets:
+            bullet.move()
+        resolve_bullet_collisions(bullets)
+        for bullet in bullets:
+            if bullet.alive():
+                bullet.check_collisions()
+
     def _reset_sprite_groups(self) -> None:
         """
         Utility method for cleaning the create_new_stage() original
         code. It just resets the various sprite groups back to zero.
+
+        NOTE: The sprites emptied out here aren't killed, so their timers
+        are cancelled by clearing the whole timer wheel. What the player
+        tank and fortify timers would have undone is reset right away
+        instead (see also PlayerTank.spawn_on_new_stage).
         """
         for k, v in self.groups.items():
             if k == 'player_tanks':
                 continue
             v.empty()
+            if k in self.pools:
+                self.pools[k].release_all()
+        self.updates.empty()
+        self.timers.clear()
+        self.is_base_fortified = False
+        self.fortify_timer = None
+
+    def get_pool_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Returns the statistics of every object pool, by pool name.
+        """
+        return {k: v.get_stats() for k, v in self.pools.items()}
+
+    def end_fortify(self) -> None:
+        """
+        Takes the fortify power up away from the Phoenix base, once its
+        time is over.
+        """
+        self.apply_fortify(start=False, end=True)
+        self.is_base_fortified = False
 
     def apply_fortify(self, *, start: bool = True, end: bool = False) -> None:
         """
@@ -501,7 +649,8 @@ class Game:
                 map_tile = SteelTile(
                     position,
                     self.groups['destructable_tiles'],
-                    self.assets.steel_tiles
+                    self.assets.steel_tiles,
+                    self.tile_grid
                 )
                 self.groups['impassable_tiles'].add(map_tile)
         elif end:
@@ -518,6 +667,7 @@ class Game:
                 map_tile = BrickTile(
                     position,
                     self.groups['destructable_tiles'],
-                    self.assets.brick_tiles
+                    self.assets.brick_tiles,
+                    self.tile_grid
                 )
                 self.groups['impassable_tiles'].add(map_tile)
@@ -1,18 +1,137 @@
-import copy
+import glob
+import time
 import typing
+import weakref
 
 import pygame
 
 import game_config as gc
+from asset_cache import AssetCache
+from glyph_cache import GlyphCache
+
+
+class SilentSound:
+    """
+    Stands in for both the Pygame Sound and Channel objects when the game
+    runs without a mixer (i.e. in headless mode). Every call does nothing.
+    """
+
+    def play(self, *args, **kwargs) -> None:
+        pass
+
+    def set_volume(self, *args) -> None:
+        pass
 
 
 class GameAssets:
     """
     Represents objects such as images and sounds for the game.
+
+    NOTE: In headless mode there's neither a display nor a mixer, so the
+    images are not converted to the display format and the sounds are
+    replaced by SilentSound objects.
     """
 
-    def __init__(self) -> None:
-        # Start screen images
+    def __init__(
+            self,
+            is_headless: bool = False,
+            is_staged: bool = False
+            ) -> None:
+        self.is_headless = is_headless
+
+        # Spritesheets at their original size, keyed by their scaled
+        # version, and the images scaled down since, kept only as long as
+        # their scaled version is (see the native render path in
+        # NativeCanvas)
+        self.native_sheets: dict[pygame.Surface, pygame.Surface] = {}
+        self.native_images: weakref.WeakKeyDictionary = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Images and sounds decoded on the first launch (see AssetCache)
+        self.image_cache = AssetCache(
+            'images',
+            glob.glob('./assets/img/*.png')
+        )
+        self.sound_cache: AssetCache | None = None
+        if not self.is_headless:
+            self.sound_cache = AssetCache(
+                'sounds',
+                glob.glob('./assets/sounds/*.ogg'),
+                pygame.mixer.get_init()
+            )
+
+        # Loading steps, tagged with the asset group they belong to. The
+        # steps of each group are run in order (see load and load_next)
+        self.pending_steps: list[tuple[str, typing.Callable[[], None]]] = [
+            ('start_screen', self._load_start_screen_images),
+            ('sprites', self._load_spritesheets),
+            ('sprites', self._load_character_images),
+            ('sprites', self._create_collision_masks),
+            ('sprites', self._load_game_images),
+            ('sprites', self._load_tile_images),
+            ('sprites', self._load_number_images),
+            ('scoresheet', self._load_scoresheet_images),
+            ('sounds', self._load_sounds)
+        ]
+
+        # The start screen images are needed right away, and so is
+        # everything else, unless it's loaded later on (see Main)
+        self.load('start_screen')
+        if not is_staged:
+            self.load_all()
+
+    def load(self, *groups: str) -> None:
+        """
+        Loads right away the given asset groups, if they're still pending.
+        """
+        for step in [s for s in self.pending_steps if s[0] in groups]:
+            self._run_step(step)
+
+    def load_all(self) -> None:
+        """
+        Loads right away all the pending asset groups.
+        """
+        while self.pending_steps:
+            self._run_step(self.pending_steps[0])
+
+    def load_next(self, time_budget: float) -> None:
+        """
+        Loads the pending steps in order, until the given time budget (in
+        milliseconds) is used up. At least one step is always loaded.
+        """
+        start = time.perf_counter()
+        while self.pending_steps:
+            self._run_step(self.pending_steps[0])
+            if (time.perf_counter() - start) * 1000 >= time_budget:
+                break
+
+    def is_loaded(self, *groups: str) -> bool:
+        """
+        Whether the given asset groups (or all of them) are loaded.
+        """
+        return not any(
+            not groups or group in groups
+            for group, _ in self.pending_steps
+        )
+
+    def _run_step(self, step: tuple[str, typing.Callable[[], None]]) -> None:
+        """
+        Runs a loading step. After the last one, anything decoded for the
+        first time is saved for the next launch.
+        """
+        self.pending_steps.remove(step)
+        step[1]()
+
+        if not self.pending_steps:
+            self.image_cache.save()
+            if self.sound_cache:
+                self.sound_cache.save()
+
+    def _load_start_screen_images(self) -> None:
+        """
+        Loads the images shown on the start screen.
+        """
         self.start_screen = self._load_image(
             filename='start_screen',
             resize=True,
@@ -26,36 +145,66 @@ class GameAssets:
             height=gc.IMAGE_SIZE
         )
 
-        # Spritesheet images
+    def _load_spritesheets(self) -> None:
+        """
+        Loads and scales up the spritesheets.
+        """
         spritesheet_filenames = [
             'battle_city',
             'numbers_black_white',
             'numbers_black_orange'
         ]
         self.spritesheet_images: dict[str, pygame.Surface] = {
-            image: self._load_image(image)
+            image: self._load_spritesheet(image)
             for image in spritesheet_filenames
         }
 
-        # Images related to the characters
+    def _load_character_images(self) -> None:
+        """
+        Cuts out the tank, bullet, shield and spawn star sprites.
+        """
         self.tank_images = self._load_all_tank_sprites()
-        self.bullet_images = self._get_specified_sprites(
-            self.spritesheet_images['battle_city'],
-            gc.BULLETS,
-            gc.RGB_BLACK,
+        # NOTE: The animated sprites are kept in tuples, indexed by
+        # direction (see gc.Direction) or by animation frame.
+        self.bullet_images: tuple[pygame.Surface, ...] = tuple(
+            self._get_specified_sprites(
+                self.spritesheet_images['battle_city'],
+                gc.BULLETS,
+                gc.RGB_BLACK,
+            ).values()
         )
-        self.shield_images = self._get_specified_sprites(
-            self.spritesheet_images['battle_city'],
-            gc.SHIELD,
-            gc.RGB_BLACK,
+        self.shield_images: tuple[pygame.Surface, ...] = tuple(
+            self._get_specified_sprites(
+                self.spritesheet_images['battle_city'],
+                gc.SHIELD,
+                gc.RGB_BLACK,
+            ).values()
         )
-        self.spawn_star_images = self._get_specified_sprites(
-            self.spritesheet_images['battle_city'],
-            gc.SPAWN_STAR,
-            gc.RGB_BLACK,
+        self.spawn_star_images: tuple[pygame.Surface, ...] = tuple(
+            self._get_specified_sprites(
+                self.spritesheet_images['battle_city'],
+                gc.SPAWN_STAR,
+                gc.RGB_BLACK,
+            ).values()
+        )
+
+    def _create_collision_masks(self) -> None:
+        """
+        Creates the collision masks, shared by all the tanks and bullets.
+        """
+        self.tank_masks = self._create_tank_masks()
+        self.bullet_masks: tuple[pygame.Mask, ...] = tuple(
+            pygame.mask.from_surface(image) for image in self.bullet_images
+        )
+        self.bullet_hitboxes: tuple[pygame.Rect, ...] = tuple(
+            mask.get_bounding_rects()[0] for mask in self.bullet_masks
         )
 
-        # Game-related images
+    def _load_game_images(self) -> None:
+        """
+        Cuts out the power up, flag, explosion, score, HUD and context
+        sprites.
+        """
         self.power_up_images = self._get_specified_sprites(
             self.spritesheet_images['battle_city'],
             gc.POWER_UPS,
@@ -90,7 +239,10 @@ class GameAssets:
             gc.RGB_BLACK,
         )
 
-        # Tile images
+    def _load_tile_images(self) -> None:
+        """
+        Cuts out the map tile sprites.
+        """
         self.brick_tiles = self._get_specified_sprites(
             self.spritesheet_images['battle_city'],
             gc.MAP_TILES['bricks'],
@@ -117,7 +269,10 @@ class GameAssets:
             gc.RGB_BLACK,
         )
 
-        # Number images
+    def _load_number_images(self) -> None:
+        """
+        Cuts out the number sprites and sets up the number renderer.
+        """
         self.numbers_black_white = self._get_specified_sprites(
             self.spritesheet_images['numbers_black_white'],
             gc.NUMBERS,
@@ -129,7 +284,20 @@ class GameAssets:
             gc.RGB_BLACK,
         )
 
-        # Scoresheet images
+        # Number renderer shared by the HUD, fade and score screen
+        self.glyph_cache = GlyphCache({
+            'white': self.numbers_black_white,
+            'orange': self.numbers_black_orange,
+            'hud': {
+                digit: self.hud_images[f'num_{digit}']
+                for digit in range(10)
+            }
+        })
+
+    def _load_scoresheet_images(self) -> None:
+        """
+        Loads the score screen images.
+        """
         scoresheet_filenames = [
             'hi-score',
             'arrow',
@@ -144,183 +312,147 @@ class GameAssets:
             for image in scoresheet_filenames
         }
 
-        # Game sounds
+    def _load_sounds(self) -> None:
+        """
+        Loads the game sounds and gets their channels.
+        """
         # Start sound
-        self.game_start_sound = pygame.mixer.Sound(
-            'assets/sounds/game_start.ogg'
-        )
+        self.game_start_sound = self._load_sound('game_start')
 
         # Player movement sound
-        self.movement_sound = pygame.mixer.Sound(
-            'assets/sounds/background_player.ogg'
-        )
+        self.movement_sound = self._load_sound('background_player')
         self.movement_sound.set_volume(0.7)
-        self.movement_sound_channel = pygame.mixer.Channel(0)
+        self.movement_sound_channel = self._get_sound_channel(0)
 
         # Enemy movement sound
-        self.enemy_movement_sound = pygame.mixer.Sound(
-            'assets/sounds/background.ogg'
-        )
+        self.enemy_movement_sound = self._load_sound('background')
         self.enemy_movement_sound.set_volume(1)
-        self.enemy_movement_sound_channel = pygame.mixer.Channel(1)
+        self.enemy_movement_sound_channel = self._get_sound_channel(1)
 
         # Fire sound
-        self.fire_sound = pygame.mixer.Sound(
-            'assets/sounds/fire.ogg'
-        )
-        self.fire_sound_channel = pygame.mixer.Channel(2)
+        self.fire_sound = self._load_sound('fire')
+        self.fire_sound_channel = self._get_sound_channel(2)
 
         # Brick sound
-        self.brick_sound = pygame.mixer.Sound(
-            'assets/sounds/brick.ogg'
-        )
-        self.brick_sound_channel = pygame.mixer.Channel(3)
+        self.brick_sound = self._load_sound('brick')
+        self.brick_sound_channel = self._get_sound_channel(3)
 
         # Steel sound
-        self.steel_sound = pygame.mixer.Sound(
-            'assets/sounds/steel.ogg'
-        )
-        self.steel_sound_channel = pygame.mixer.Channel(4)
+        self.steel_sound = self._load_sound('steel')
+        self.steel_sound_channel = self._get_sound_channel(4)
 
         # Explosion sound
-        self.explosion_sound = pygame.mixer.Sound(
-            'assets/sounds/explosion.ogg'
-        )
-        self.explosion_sound_channel = pygame.mixer.Channel(5)
+        self.explosion_sound = self._load_sound('explosion')
+        self.explosion_sound_channel = self._get_sound_channel(5)
 
         # Bonus sound
-        self.bonus_sound = pygame.mixer.Sound(
-            'assets/sounds/bonus.ogg'
-        )
-        self.bonus_sound_channel = pygame.mixer.Channel(6)
+        self.bonus_sound = self._load_sound('bonus')
+        self.bonus_sound_channel = self._get_sound_channel(6)
 
         # Game over sound
-        self.game_over_sound = pygame.mixer.Sound(
-            'assets/sounds/game_over.ogg'
-        )
+        self.game_over_sound = self._load_sound('game_over')
         self.game_over_sound.set_volume(0.67)
-        self.game_over_sound_channel = pygame.mixer.Channel(7)
+        self.game_over_sound_channel = self._get_sound_channel(7)
 
         # Score sound
-        self.score_sound = pygame.mixer.Sound(
-            'assets/sounds/score.ogg'
-        )
+        self.score_sound = self._load_sound('score')
         self.score_sound.set_volume(0.67)
         # self.score_sound_channel = pygame.mixer.Channel(7)
 
-    def _load_all_tank_sprites(self) -> dict[str, dict[str, dict[str, list]]]:
+    def _load_all_tank_sprites(self) -> tuple:
         """
-        Loads all the tank sprites from the spritesheet and
-        puts them into the blank tank dictionary.
+        Loads all the tank sprites from the spritesheet, into a read-only
+        table indexed by tank level, color and direction (see
+        gc.TankColor and gc.Direction), which holds the animation frames
+        of each tank.
         """
-        tanks = self._create_tank_dict()
+        tanks: list = [
+            [[[] for _ in gc.Direction] for _ in gc.TankColor]
+            for _ in range(gc.TANK_LEVELS)
+        ]
 
         for row in range(16):
             for col in range(16):
                 surface = self._create_tank_surface(row, col)
                 level = self._sort_tanks_into_levels(row)
-                group = self._sort_tanks_into_groups(row, col)
+                color = self._sort_tanks_into_colors(row, col)
                 direction = self._sort_tanks_by_direction(col)
-                tanks[level][group][direction].append(surface)
+                tanks[level][color][direction].append(surface)
 
-        return tanks
+        return tuple(
+            tuple(
+                tuple(tuple(frames) for frames in colors)
+                for colors in level
+            )
+            for level in tanks
+        )
 
-    def _create_tank_dict(self) -> dict[str, dict[str, dict[str, list]]]:
-        """
-        Creates a base dictionary which will consequently be filled
-        with tank sprites from the spritesheet.
+    def _create_tank_masks(self) -> tuple:
         """
-        directions = {
-            direction: []
-            for direction in ['Up', 'Down', 'Left', 'Right']
-        }
-        groups = {
-            group: copy.deepcopy(directions)
-            for group in ['Gold', 'Silver', 'Green', 'Special']
-        }
-        tanks = {
-            f'Tank_{tank}': copy.deepcopy(groups)
-            for tank in range(8)
-        }
-        return tanks
+        Creates the read-only table of tank masks, indexed by tank level
+        and direction, out of the first animation frame of each sprite.
 
-    def _create_tank_surface(self, row: int, col: int) -> pygame.Surface:
+        NOTE: The four colors of a level share the same shape, so the
+        masks are built from the Silver sprites only.
         """
-        Extracts a tank sprite from the spritesheet and then converts it
-        into a Pygame Surface object, based on the given row and column
-        values.
-        """
-        surface = pygame.Surface((gc.SPRITE_SIZE, gc.SPRITE_SIZE))
-        surface.fill(gc.RGB_BLACK)
-        surface.blit(
-            source=self.spritesheet_images['battle_city'],
-            dest=(0, 0),
-            area=(
-                col * gc.SPRITE_SIZE,
-                row * gc.SPRITE_SIZE,
-                gc.SPRITE_SIZE,
-                gc.SPRITE_SIZE
+        return tuple(
+            tuple(
+                pygame.mask.from_surface(frames[0])
+                for frames in colors[gc.TankColor.SILVER]
             )
-        )
-        surface.set_colorkey(gc.RGB_BLACK)
-        surface = self._resize_sprite(
-            surface,
-            gc.SPRITE_SCALE,
-            gc.SPRITE_SCALE,
-            True
+            for colors in self.tank_images
         )
 
-        return surface
+    def _create_tank_surface(self, row: int, col: int) -> pygame.Surface:
+        """
+        Extracts a tank sprite from the spritesheet, based on the given
+        row and column values.
+        """
+        return self._get_image(
+            self.spritesheet_images['battle_city'],
+            col * gc.SPRITE_SIZE,
+            row * gc.SPRITE_SIZE,
+            gc.SPRITE_SIZE,
+            gc.SPRITE_SIZE,
+            gc.RGB_BLACK
+        )
 
-    def _sort_tanks_into_levels(self, row: int) -> str:
+    def _sort_tanks_into_levels(self, row: int) -> int:
         """
         Sorts the tanks according to their given row in the spritesheet.
 
-        If the row number being passed is higher than seven,
-        the % operator converts it back down to within the 0 to 7 range
-        and return the level from the tank's level dictionary.
+        If the row number being passed is higher than seven, the %
+        operator converts it back down to within the 0 to 7 range.
         """
-        tank_levels = {
-            level: f'Tank_{level}'
-            for level in range(8)
-        }
-
-        return tank_levels[row % 8]
+        return row % gc.TANK_LEVELS
 
-    def _sort_tanks_into_groups(
-            self,
-            row: int,
-            col: int
-            ) -> typing.Literal['Gold', 'Green', 'Silver', 'Special']:
+    def _sort_tanks_into_colors(self, row: int, col: int) -> gc.TankColor:
         """
         Sorts each tank sprite into its proper color group, according
         to its row and column position.
         """
         if (0 <= row <= 7) and (0 <= col <= 7):
-            return 'Gold'
+            return gc.TankColor.GOLD
         elif (8 <= row <= 15) and (0 <= col <= 7):
-            return 'Green'
+            return gc.TankColor.GREEN
         elif (0 <= row <= 7) and (8 <= col <= 15):
-            return 'Silver'
+            return gc.TankColor.SILVER
         else:
-            return 'Special'
+            return gc.TankColor.SPECIAL
 
-    def _sort_tanks_by_direction(
-            self,
-            col: int
-            ) -> typing.Literal['Up', 'Left', 'Down', 'Right']:
+    def _sort_tanks_by_direction(self, col: int) -> gc.Direction:
         """
         Sorts each tank sprite by direction, according to its column
         position.
         """
         if (col % 8 <= 1):
-            return 'Up'
+            return gc.Direction.UP
         elif (col % 8 <= 3):
-            return 'Left'
+            return gc.Direction.LEFT
         elif (col % 8 <= 5):
-            return 'Down'
+            return gc.Direction.DOWN
         else:
-            return 'Right'
+            return gc.Direction.RIGHT
 
     def _resize_sprite(
             self,
@@ -337,7 +469,50 @@ class GameAssets:
             return pygame.transform.scale(surface, (width, height))
 
         w, h = surface.get_size()
-        return pygame.transform.scale(surface, (width * w, height * h))
+        scaled = pygame.transform.scale(surface, (width * w, height * h))
+        self.native_sheets[scaled] = surface
+        return scaled
+
+    def get_native_image(self, image: pygame.Surface) -> pygame.Surface:
+        """
+        Returns the given scaled image at the original size of the art.
+
+        Sprites are cut out of the matching spritesheet at its original
+        size, the first time they're needed. Images composed at runtime
+        (e.g. the HUD or the terrain layer) are scaled down instead, and
+        kept until they're forgotten or thrown away.
+        """
+        native = self.native_images.get(image)
+        if native is not None:
+            return native
+
+        w, h = image.get_size()
+        scale = gc.SPRITE_SCALE
+        parent = image.get_parent()
+        native_sheet = self.native_sheets.get(parent) if parent else None
+        if native_sheet is not None:
+            x, y = image.get_offset()
+            native = native_sheet.subsurface(
+                x // scale,
+                y // scale,
+                w // scale,
+                h // scale
+            )
+            colorkey = image.get_colorkey()
+            if colorkey:
+                native.set_colorkey(colorkey, pygame.RLEACCEL)
+        else:
+            native = pygame.transform.scale(image, (w // scale, h // scale))
+
+        self.native_images[image] = native
+        return native
+
+    def forget_native_image(self, image: pygame.Surface) -> None:
+        """
+        Drops the scaled-down copy of an image that has been drawn on,
+        so it's scaled down again the next time it's needed.
+        """
+        self.native_images.pop(image, None)
 
     def _load_image(
             self,
@@ -352,22 +527,93 @@ class GameAssets:
         parameters.
 
         NOTE: All images must be in the "assets/img/" folder and
-        be in PNG format in order to work!
+        be in PNG format in order to work! Decoded images are kept in
+        the image cache.
         """
-        try:
-            path = f'./assets/img/{filename}.png'
-            image = pygame.image.load(path).convert_alpha()
-        except FileNotFoundError as e:
-            print(f'File {filename}.png not found: {e}')
+        cached = self.image_cache.get(filename)
+        if cached:
+            entry, data = cached
+            image = pygame.image.frombytes(
+                bytes(data),
+                tuple(entry['size']),
+                'RGBA'
+            )
+        else:
+            try:
+                path = f'./assets/img/{filename}.png'
+                image = pygame.image.load(path)
+                self.image_cache.add(
+                    filename,
+                    pygame.image.tobytes(image, 'RGBA'),
+                    size=image.get_size()
+                )
+            except FileNotFoundError as e:
+                print(f'File {filename}.png not found: {e}')
+
+        if not self.is_headless:
+            image = image.convert_alpha()
 
         if resize:
             image = self._resize_sprite(image, width, height)
 
         return image
 
+    def _load_spritesheet(self, filename: str) -> pygame.Surface:
+        """
+        Loads a spritesheet, flattened on a black background and scaled
+        up once, so that every sprite is just a view of it (see
+        _get_image). The sheet at its original size is kept among the
+        native images.
+        """
+        image = self._load_image(filename)
+        sheet = pygame.Surface(image.get_size())
+        sheet.fill(gc.RGB_BLACK)
+        sheet.blit(image, (0, 0))
+        if not self.is_headless:
+            sheet = sheet.convert()
+
+        return self._resize_sprite(
+            sheet,
+            gc.SPRITE_SCALE,
+            gc.SPRITE_SCALE,
+            True
+        )
+
+    def _load_sound(self, filename: str) -> pygame.mixer.Sound | SilentSound:
+        """
+        Loads a sound and returns it as a Pygame Sound object, or as a
+        SilentSound object in headless mode. Decoded sounds are kept in
+        the sound cache.
+
+        NOTE: All sounds must be in the "assets/sounds/" folder and
+        be in OGG format in order to work!
+        """
+        if self.is_headless:
+            return SilentSound()
+
+        cached = self.sound_cache.get(filename)
+        if cached:
+            return pygame.mixer.Sound(buffer=cached[1])
+
+        sound = pygame.mixer.Sound(f'assets/sounds/{filename}.ogg')
+        self.sound_cache.add(filename, sound.get_raw())
+        return sound
+
+    def _get_sound_channel(
+            self,
+            channel_id: int
+            ) -> pygame.mixer.Channel | SilentSound:
+        """
+        Returns the Pygame Channel object for the given ID, or a
+        SilentSound object in headless mode.
+        """
+        if self.is_headless:
+            return SilentSound()
+        return pygame.mixer.Channel(channel_id)
+
     def _get_specified_sprites(
             self,
-            spritesheet: dict[str, pygame.Surface],
+            spritesheet: pygame.Surface,
             sprite_coord_dict: (dict[str, dict[str, int]] |
                                 dict[str, dict[str, dict[str, int]]]),
             color: tuple[int, int, int],
@@ -394,7 +640,7 @@ class GameAssets:
 
     def _get_image(
             self,
-            spritesheet: dict[str, pygame.Surface],
+            spritesheet: pygame.Surface,
             pos_x: int,
             pos_y: int,
             width: int,
@@ -403,20 +649,21 @@ class GameAssets:
             transparent: bool = True
             ) -> pygame.Surface:
         """
-        Gets a sprite from a given spritesheet.
+        Gets a sprite from a given (scaled) spritesheet, as a subsurface
+        sharing its pixels. The given color is used as the transparent
+        color key, RLE accelerated, unless the sprite is not transparent.
+
+        NOTE: Sprites must never be drawn on, since that would change
+        the spritesheet itself.
         """
-        surface = pygame.Surface((width, height))
-        surface.fill(color)
-        surface.blit(spritesheet, (0, 0), (pos_x, pos_y, width, height))
+        surface = spritesheet.subsurface(
+            pos_x * gc.SPRITE_SCALE,
+            pos_y * gc.SPRITE_SCALE,
+            width * gc.SPRITE_SCALE,
+            height * gc.SPRITE_SCALE
+        )
 
         if transparent:
-            surface.set_colorkey(color)
-
-        surface = self._resize_sprite(
-            surface,
-            gc.SPRITE_SCALE,
-            gc.SPRITE_SCALE,
-            True
-        )
+            surface.set_colorkey(color, pygame.RLEACCEL)
 
         return surface
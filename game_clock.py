@@ -0,0 +1,72 @@
+import game_config as gc
+
+
+class GameClock:
+    """
+    Represents the virtual clock owned by the Game object.
+
+    Every timer in the simulation asks this clock for the current time,
+    instead of reading the wall clock through pygame.time.get_ticks().
+    The clock only moves forward when it's told to, a tick time per
+    simulation tick, so it can be paused or stepped manually.
+
+    The time scale is the number of simulation ticks run per tick of
+    real time (see Main.update and HeadlessMain.step). So, the game is
+    fast-forwarded as a whole, movement included, and not just its
+    timers.
+
+    NOTE: The real time accounted for a single frame is capped by
+    gc.MAX_FRAME_TIME (see Main.update). So, if a frame stalls (e.g. while
+    dragging the window), the timers won't fire all at once as a catch-up
+    burst.
+    """
+
+    def __init__(self, time_scale: float = 1.0) -> None:
+        self.ticks: float = 0.0  # milliseconds
+        self.is_paused: bool = False
+        self.time_scale = time_scale
+
+    @property
+    def time_scale(self) -> float:
+        return self._time_scale
+
+    @time_scale.setter
+    def time_scale(self, value: float) -> None:
+        if not gc.MIN_TIME_SCALE <= value <= gc.MAX_TIME_SCALE:
+            raise ValueError(
+                f'Time scale must be between {gc.MIN_TIME_SCALE} and '
+                f'{gc.MAX_TIME_SCALE}, got {value}'
+            )
+        self._time_scale = value
+
+    def get_ticks(self) -> int:
+        """
+        Returns the virtual time in milliseconds, just like
+        pygame.time.get_ticks() does for the wall clock.
+        """
+        return int(self.ticks)
+
+    def update(self) -> None:
+        """
+        Moves the clock forward by a single tick time, unless it's
+        paused.
+        """
+        if self.is_paused:
+            return
+        self.ticks += gc.TICK_TIME
+
+    def step(self, elapsed: float = gc.TICK_TIME) -> None:
+        """
+        Moves the clock forward manually, even when it's paused (see
+        Game.step_once).
+        """
+        self.ticks += elapsed
+
+    def pause(self) -> None:
+        self.is_paused = True
+
+    def resume(self) -> None:
+        self.is_paused = False
+
+    def toggle_pause(self) -> None:
+        self.is_paused = not self.is_paused
@@ -3,6 +3,8 @@ Main game settings file.
 """
 
 
+from enum import IntEnum
+
 from utilities import get_object_position_and_size
 
 
@@ -27,6 +29,22 @@ does change, then these items would change along with it.
 SCREEN_WIDTH = 16 * IMAGE_SIZE   # px
 SCREEN_HEIGHT = 14 * IMAGE_SIZE  # px
 
+# Native render path, which draws the game screen at the resolution of
+# the original art (256x224) and scales it up once per frame
+RENDER_NATIVE = False
+NATIVE_WIDTH = SCREEN_WIDTH // SPRITE_SCALE    # px
+NATIVE_HEIGHT = SCREEN_HEIGHT // SPRITE_SCALE  # px
+OUTPUT_SCALE = SPRITE_SCALE  # window size, in native pixels
+MAX_OUTPUT_SCALE = 6
+
+# Baked asset cache, rebuilt whenever the assets or this file change
+# (see AssetCache)
+ASSET_CACHE_DIR = '.asset_cache'
+ASSET_CACHE_VERSION = 1
+
+# Time spent loading assets on each frame of the start screen
+ASSET_LOAD_BUDGET = 4  # milliseconds
+
 GAME_SCREEN = get_object_position_and_size(
     pos_x=IMAGE_SIZE,
     pos_y=IMAGE_SIZE // 2,
@@ -41,11 +59,51 @@ SCREEN_BORDER_TOP = GAME_SCREEN['pos_y']
 SCREEN_BORDER_RIGHT = GAME_SCREEN['width'] + SCREEN_BORDER_LEFT
 SCREEN_BORDER_BOTTOM = GAME_SCREEN['height'] + SCREEN_BORDER_TOP
 
-SCREEN_SCROLL_SPEED = 5
+# Tile occupancy grid, made of quarter map tiles (see TileGrid)
+GRID_CELL_SIZE = SPRITE_SIZE  # px
+GRID_COLS = GAME_SCREEN['width'] // GRID_CELL_SIZE
+GRID_ROWS = GAME_SCREEN['height'] // GRID_CELL_SIZE
+
+GRID_EMPTY = 0
+GRID_BRICK = 1
+GRID_STEEL = 2
+GRID_WATER = 3
 
 TRANSITION_TIMER = 3000  # milliseconds
 
-FPS = 60
+# Rendered frames per second (at most), and simulation ticks per second.
+# Frames are drawn more often than ticks are run, with the moving sprites
+# interpolated in between (see RENDER_INTERPOLATION), and the simulation
+# runs at the same pace whatever the frame rate (see Main.update)
+FPS = 120
+TICK_RATE = 60
+TICK_TIME = 1000 / TICK_RATE  # milliseconds
+# Every speed in the game is given in pixels per tick of the original
+# 60 Hz game, and scaled to the actual tick time by SPEED_SCALE, so the
+# game runs at the same pace whatever the tick rate
+REFERENCE_TICK_TIME = 1000 / 60  # milliseconds
+SPEED_SCALE = TICK_TIME / REFERENCE_TICK_TIME
+# Ticks run at most per rendered frame. The game only slows down when it
+# falls further behind than that
+MAX_TICKS_PER_FRAME = 6
+
+# Screen animation speeds (in px per reference tick, see SPEED_SCALE)
+SCREEN_SCROLL_SPEED = 5 * SPEED_SCALE
+FADE_SPEED = 10 * SPEED_SCALE
+GAME_OVER_SCROLL_SPEED = 10 * SPEED_SCALE
+SCORE_BANNER_SPEED = 1 * SPEED_SCALE
+
+# Whether the moving sprites are drawn in between their positions on the
+# last two ticks, as far as the frame is into the next tick. Sprites
+# moving further than the maximum distance in a tick (e.g. a respawning
+# tank) are drawn where they are
+RENDER_INTERPOLATION = True
+MAX_INTERPOLATION_DISTANCE = 32  # px
+
+# Game clock settings
+MIN_TIME_SCALE = 0.25
+MAX_TIME_SCALE = 32
+MAX_FRAME_TIME = 100  # milliseconds
 
 RGB_BLACK = (0, 0, 0)
 RGB_RED = (255, 0, 0)
@@ -53,13 +111,29 @@ RGB_GREY = (99, 99, 99)
 RGB_GREEN = (0, 255, 0)
 
 # Tank variables
-TANK_SPEED = IMAGE_SIZE // SPRITE_SIZE
+# px per reference tick (see SPEED_SCALE). Bullets go 3 times as fast
+TANK_SPEED = IMAGE_SIZE // SPRITE_SIZE * SPEED_SCALE
 
 TANK_PARALYSIS = 2000    # milliseconds
 
 SPAWN_ANIM_TIME = 50     # milliseconds
 TOTAL_SPAWN_TIME = 2000  # milliseconds
 
+# Shared animation tracks, with their frame time (milliseconds) and
+# number of frames (see AnimationClock)
+ANIMATION_TRACKS: dict[str, tuple[int, int]] = {
+    'water': (500, 2),
+    'spawn_star': (SPAWN_ANIM_TIME, 4),
+    'shield': (50, 2),
+    'special_flash': (100, 2),
+    'explosion': (100, 5)
+}
+
+# Timer wheel settings (see TimerWheel). The lowest level ticks every
+# millisecond, so 4 levels of 64 slots cover deadlines up to ~4.6 hours
+TIMER_WHEEL_SLOTS = 64  # must be a power of two
+TIMER_WHEEL_LEVELS = 4
+
 ENEMY_TANK_SPAWNS = [
     (0, 0), (0, 1), (1, 0), (1, 1),      # enemy spawn 1
     (12, 0), (12, 1), (13, 0), (13, 1),  # enemy spawn 2
@@ -114,8 +188,55 @@ PHOENIX_POSITION = (
     SCREEN_BORDER_TOP + IMAGE_SIZE // 2 * 24
 )
 
-TANK_CRITERIA: dict[str, dict[str, int | float]] = {
-    'level_0': {
+class Direction(IntEnum):
+    """
+    Tank and bullet directions, in the order of the tank sprites on the
+    spritesheet. Sprite, mask and movement tables are indexed by them.
+    """
+    UP = 0
+    LEFT = 1
+    DOWN = 2
+    RIGHT = 3
+
+
+# Unit (x, y) vector of each direction
+DIRECTION_VECTORS: tuple[tuple[int, int], ...] = (
+    (0, -1),
+    (-1, 0),
+    (0, 1),
+    (1, 0)
+)
+
+
+class TankColor(IntEnum):
+    """
+    Tank colors, in the order of the tank sprite blocks on the
+    spritesheet (Player 1 is Gold, and Player 2 is Green).
+    """
+    GOLD = 0
+    GREEN = 1
+    SILVER = 2
+    SPECIAL = 3
+
+
+class EnemyTier(IntEnum):
+    """
+    Enemy tank tiers, which index the TANK_CRITERIA table and the spawn
+    queue ratios.
+    """
+    BASIC = 0
+    FAST = 1
+    POWER = 2
+    ARMOR = 3
+
+
+# Tank levels, one per row of tank sprites: 0 to 3 for the player tank
+# upgrades, and 4 to 7 for the enemy tiers
+TANK_LEVELS = 8
+
+# Enemy tank criteria, per tier (see EnemyTier)
+TANK_CRITERIA: tuple[dict[str, int | float], ...] = (
+    {
         'image': 4,
         'health': 1,
         'speed': 0.5,
@@ -123,7 +244,7 @@ TANK_CRITERIA: dict[str, dict[str, int | float]] = {
         'power': 1,
         'score': 100
     },
-    'level_1': {
+    {
         'image': 5,
         'health': 1,
         'speed': 1,
@@ -131,7 +252,7 @@ TANK_CRITERIA: dict[str, dict[str, int | float]] = {
         'power': 1,
         'score': 200
     },
-    'level_2': {
+    {
         'image': 6,
         'health': 1,
         'speed': 0.5,
@@ -139,7 +260,7 @@ TANK_CRITERIA: dict[str, dict[str, int | float]] = {
         'power': 2,
         'score': 300
     },
-    'level_3': {
+    {
         'image': 7,
         'health': 4,
         'speed': 0.5,
@@ -147,7 +268,7 @@ TANK_CRITERIA: dict[str, dict[str, int | float]] = {
         'power': 2,
         'score': 400
     }
-}
+)
 
 # Tank spawn queue ratios (calculated by Harry)
 TANK_SPAWN_QUEUE = {
@@ -239,13 +360,13 @@ BULLETS = {
         pos_x=(
             (
                 (SPRITE_SIZE * 20)
-                if direction == 'Up'
+                if direction == Direction.UP
                 else (SPRITE_SIZE * 21)
             )
-            if direction in ['Up', 'Down']
+            if direction in (Direction.UP, Direction.DOWN)
             else (
                 (SPRITE_SIZE * 20) + 8
-                if direction == 'Left'
+                if direction == Direction.LEFT
                 else (SPRITE_SIZE * 21) + 8
             )
         ),
@@ -253,7 +374,7 @@ BULLETS = {
         width=(SPRITE_SIZE // 2),
         height=(SPRITE_SIZE // 2)
     )
-    for direction in ['Up', 'Left', 'Down', 'Right']
+    for direction in Direction
 }
 
 MAP_TILES = {
@@ -416,6 +537,9 @@ HUD_INFO = {
     )
 }
 
+# Number of number images kept by the glyph cache (see GlyphCache)
+GLYPH_CACHE_SIZE = 128
+
 NUMBERS = {
     0: get_object_position_and_size(
         pos_x=0,
@@ -502,3 +626,23 @@ ID_FOREST = 483
 ID_ICE = 484
 ID_WATER = 533
 ID_FLAG = 999
+
+# Number of parsed levels kept by the level data (see LevelData)
+LEVEL_CACHE_SIZE = 8
+
+# Number of compiled stages kept by the game (see StagePrototype). Each
+# one holds up to two pre-rendered surfaces as big as the game screen.
+STAGE_CACHE_SIZE = 4
+
+# Binary level pack settings (see level_pack.py). Each tile is stored as
+# its index in LEVEL_PACK_TILE_IDS, so it fits in a single byte
+LEVEL_SIZE = GAME_SCREEN['width'] // (IMAGE_SIZE // 2)  # 26 map tiles
+LEVEL_PACK_TILE_IDS = (
+    -1,  # empty
+    ID_BRICK,
+    ID_STEEL,
+    ID_FOREST,
+    ID_ICE,
+    ID_WATER,
+    ID_FLAG
+)
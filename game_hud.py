@@ -7,13 +7,37 @@ import game_config as gc
 class GameHUD:
     """
     Blueprint for the game HUD object.
+
+    NOTE: The whole HUD is composed on a single opaque surface, the size
+    of the screen, which is only composed again when any of its figures
+    changes (see update()). Drawing the HUD is then just one blit.
     """
 
     def __init__(self, game, assets) -> None:
         self.game = game
         self.assets = assets
         self.images = self.assets.hud_images
+        self.glyphs = self.assets.glyph_cache
         self.hud_overlay = self.generate_hud_overlay_screen()
+        self.life_icon: Surface = pygame.transform.rotate(
+            self.images['life'],
+            180
+        )
+
+        # Composed HUD, and the screen area where its figures are shown
+        self.hud_surface: Surface = Surface(
+            (gc.SCREEN_WIDTH, gc.SCREEN_HEIGHT)
+        )
+        self.panel_rect: pygame.Rect = pygame.Rect(
+            gc.INFO_PANEL_X,
+            0,
+            gc.SCREEN_WIDTH - gc.INFO_PANEL_X,
+            gc.SCREEN_HEIGHT
+        )
+        self.is_dirty: bool = True
+
+        # Number of enemies still remaining to spawn
+        self.enemies: int = 0
 
         # Player 1 lives and display
         self.is_player_1_active: bool = False
@@ -38,7 +62,9 @@ class GameHUD:
 
     def update(self) -> None:
         # Update the number of enemies still remaining to spawn
-        self.enemies = self.game.enemies
+        if self.enemies != self.game.enemies:
+            self.enemies = self.game.enemies
+            self.is_dirty = True
 
         # Update the number of player lives available
         self.is_player_1_active = self.game.is_player_1_active
@@ -51,6 +77,7 @@ class GameHUD:
                 self.player_1_lives,
                 self.is_player_1_active
             )
+            self.is_dirty = True
 
         self.is_player_2_active = self.game.is_player_2_active
         if (
@@ -62,16 +89,33 @@ class GameHUD:
                 self.player_2_lives,
                 self.is_player_2_active
             )
+            self.is_dirty = True
 
         # Update the stage number image
         if self.level != self.game.level_num:
             self.level = self.game.level_num
             self.level_image = self.display_stage_number(self.level)
+            self.is_dirty = True
 
     def draw(self, window: Surface) -> None:
         """
-        Draws the HUD elements on the screen.
+        Draws the HUD on the screen, composing it first if needed.
+
+        NOTE: The HUD surface is opaque, so it also paints the game
+        screen area black.
+        """
+        if self.is_dirty:
+            self.compose_hud(self.hud_surface)
+            self.assets.forget_native_image(self.hud_surface)
+            self.is_dirty = False
+
+        window.blit(self.hud_surface, (0, 0))
+
+    def compose_hud(self, window: Surface) -> None:
+        """
+        Draws the HUD elements on the given surface.
         """
+        window.fill(gc.RGB_BLACK)
         window.blit(
             self.hud_overlay,
             (0, 0)
@@ -159,37 +203,20 @@ class GameHUD:
             surface.blit(self.images['grey_square'], (gc.IMAGE_SIZE // 2, 0))
             return surface
 
-        if player_lives < 10:
-            image = pygame.transform.rotate(self.images['life'], 180)
-        else:
-            num = str(player_lives)[0]
-            image = self.images[f'num_{num}']
+        if player_lives >= 10:
+            return self.glyphs.render_number(player_lives, 'hud', 2)
 
-        surface.blit(image, (0, 0))
-        num = str(player_lives)[-1]
-        image_2 = self.images[f'num_{num}']
-        surface.blit(image_2, (gc.IMAGE_SIZE // 2, 0))
+        surface.blit(self.life_icon, (0, 0))
+        surface.blit(
+            self.glyphs.render_number(player_lives, 'hud'),
+            (gc.IMAGE_SIZE // 2, 0)
+        )
 
         return surface
 
     def display_stage_number(self, level: int) -> Surface:
         """
-        Generates the stage level image, according to the level number
+        Returns the stage level image, according to the level number
         passed in.
         """
-        width, height = gc.IMAGE_SIZE, gc.IMAGE_SIZE // 2
-        surface = Surface((width, height))
-        surface.fill(gc.RGB_BLACK)
-
-        if level < 10:
-            image_1 = self.images['num_0']
-        else:
-            num = str(level)[0]
-            image_1 = self.images[f'num_{num}']
-
-        surface.blit(image_1, (0, 0))
-        num = str(level)[-1]
-        image_2 = self.images[f'num_{num}']
-        surface.blit(image_2, (gc.IMAGE_SIZE // 2, 0))
-
-        return surface
+        return self.glyphs.render_number(level, 'hud', 2)
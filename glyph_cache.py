@@ -0,0 +1,64 @@
+import functools
+
+from pygame.surface import Surface
+
+import game_config as gc
+
+
+class GlyphCache:
+    """
+    Renders numbers out of the digit images (glyphs) of a palette, and
+    keeps the most recently used ones in an LRU cache, keyed by value,
+    palette and width. It's shared by the HUD, the stage fade and the
+    score screen.
+
+    NOTE: The very same surface is handed out on every cache hit, so
+    callers must only blit it, never draw on it.
+    """
+
+    def __init__(
+            self,
+            palettes: dict[str, dict[int, Surface]],
+            max_size: int = gc.GLYPH_CACHE_SIZE
+            ) -> None:
+        self.palettes: dict[str, dict[int, Surface]] = palettes
+        self._render_number_cached = functools.lru_cache(max_size)(
+            self._render_number
+        )
+
+    def render_number(
+            self,
+            value: int,
+            palette: str,
+            width: int = 0
+            ) -> Surface:
+        """
+        Returns an image of the given number, in the given palette,
+        padded with zeros on the left up to the given number of digits.
+        """
+        return self._render_number_cached(value, palette, width)
+
+    def get_stats(self) -> dict[str, int | float]:
+        """
+        Returns the number of cache hits and misses, the hit rate and
+        the number of images currently cached.
+        """
+        info = self._render_number_cached.cache_info()
+        calls = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'hit_rate': info.hits / calls if calls else 0.0,
+            'size': info.currsize
+        }
+
+    def _render_number(self, value: int, palette: str, width: int) -> Surface:
+        glyphs = self.palettes[palette]
+        digits = str(value).zfill(width)
+        glyph_width, glyph_height = glyphs[0].get_size()
+
+        surface = Surface((glyph_width * len(digits), glyph_height))
+        surface.fill(gc.RGB_BLACK)
+        for index, digit in enumerate(digits):
+            surface.blit(glyphs[int(digit)], (glyph_width * index, 0))
+        return surface
@@ -0,0 +1,164 @@
+"""
+Headless simulation mode.
+
+Runs the game without a window, a mixer or any per-frame rendering, and
+steps the simulation as fast as the CPU allows. It's meant for batch
+and CI jobs, e.g.:
+
+    python headless.py --ticks 10000 --players 2
+"""
+
+
+import argparse
+import random
+import time
+
+import game_config as gc
+from game import Game
+from game_assets import GameAssets
+from levels import LevelData
+
+
+class HeadlessMain:
+    """
+    Stands in for the Main object when the game runs headless.
+
+    NOTE: Neither Game.input() nor Game.draw() are ever called here, so
+    the player tanks just stay idle while the enemy tanks do their job.
+    """
+
+    def __init__(
+            self,
+            levels: LevelData | None = None,
+            is_player_1_active: bool = True,
+            is_player_2_active: bool = False
+            ) -> None:
+
+        self.run: bool = True
+        self.is_headless: bool = True
+
+        # Simulation ticks due but not run yet (see step)
+        self.accumulator: float = 0.0
+
+        self.assets: GameAssets = GameAssets(is_headless=True)
+        self.levels: LevelData = (
+            levels if levels is not None else LevelData()
+        )
+
+        self.game: Game = Game(
+            self,
+            self.assets,
+            is_player_1_active=is_player_1_active,
+            is_player_2_active=is_player_2_active
+        )
+
+    def step(self, ticks: int = 1) -> int:
+        """
+        Runs the given number of ticks of real time, each one moving the
+        game clock forward by a single tick time. At a time scale other
+        than 1, as many more (or fewer) simulation ticks are run, as the
+        Main object would. Returns the number of simulation ticks
+        actually run, which may be less if the game ends first.
+        """
+        run: int = 0
+        for _ in range(ticks):
+            self.accumulator += self.game.clock.time_scale
+            while self.accumulator >= 1:
+                if not self.run or not self.game.is_active:
+                    return run
+                self.accumulator -= 1
+                self.game.clock.update()
+                self.game.update()
+                run += 1
+        return run
+
+    def pause(self) -> None:
+        """
+        Pauses the game, so the ticks run by step() leave it as it is.
+        """
+        self.game.clock.pause()
+
+    def resume(self) -> None:
+        self.game.clock.resume()
+
+    def step_once(self) -> None:
+        """
+        Runs a single simulation tick while the game is paused.
+        """
+        self.game.step_once()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Battle City headless run')
+    parser.add_argument('--ticks', type=int, default=10_000)
+    parser.add_argument('--players', type=int, choices=[1, 2], default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument(
+        '--levels',
+        default='levels',
+        help='directory of CSV levels, or level pack, to play'
+    )
+    parser.add_argument(
+        '--time-scale',
+        type=float,
+        default=1.0,
+        help='simulation ticks run per tick given in --ticks '
+             f'({gc.MIN_TIME_SCALE} to {gc.MAX_TIME_SCALE})'
+    )
+    parser.add_argument(
+        '--pool-stats',
+        action='store_true',
+        help='print the object pool statistics at the end'
+    )
+    parser.add_argument(
+        '--update-stats',
+        action='store_true',
+        help='print the entities in the update registry at the end'
+    )
+    parser.add_argument(
+        '--timer-stats',
+        action='store_true',
+        help='print the timer wheel statistics at the end'
+    )
+    parser.add_argument(
+        '--glyph-stats',
+        action='store_true',
+        help='print the glyph cache statistics at the end'
+    )
+    args = parser.parse_args()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    simulation = HeadlessMain(
+        LevelData(args.levels),
+        is_player_2_active=args.players == 2
+    )
+    simulation.game.clock.time_scale = args.time_scale
+
+    start = time.perf_counter()
+    ticks = simulation.step(args.ticks)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f'{ticks} ticks in {elapsed:.2f} s '
+        f'({ticks / elapsed:,.0f} ticks/s), '
+        f'stage {simulation.game.level_num}'
+    )
+
+    if args.pool_stats:
+        for name, stats in simulation.game.get_pool_stats().items():
+            print(f'{name}: {stats}')
+
+    if args.update_stats:
+        print(f'updates: {simulation.game.updates.get_counts()}')
+
+    if args.timer_stats:
+        print(f'timers: {simulation.game.timers.get_stats()}')
+
+    if args.glyph_stats:
+        print(f'glyphs: {simulation.assets.glyph_cache.get_stats()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+"""
+Binary level pack format, plus converters to and from the CSV levels.
+
+A level pack holds any number of levels in a single file:
+
+    - Header: magic bytes, format version, level size and level count.
+    - Index: one entry per level, with the offset of its tiles and their
+    content hash.
+    - Tiles: LEVEL_SIZE x LEVEL_SIZE signed bytes per level, each one
+    being the index of the tile ID in LEVEL_PACK_TILE_IDS.
+
+Identical levels are stored only once, and share the same offset.
+
+Usage:
+    python level_pack.py pack levels levels.pack
+    python level_pack.py unpack levels.pack levels
+    python level_pack.py info levels.pack
+"""
+
+
+import argparse
+import array
+import csv
+import hashlib
+import mmap
+import os
+import struct
+
+import game_config as gc
+
+
+MAGIC = b'BCLP'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHI')     # magic, version, level size, count
+INDEX_ENTRY = struct.Struct('<I16s')  # offset, hash
+
+LEVEL_BYTES = gc.LEVEL_SIZE * gc.LEVEL_SIZE
+
+TILE_CODES: dict[int, int] = {
+    tile_id: code for code, tile_id in enumerate(gc.LEVEL_PACK_TILE_IDS)
+}
+
+
+class LevelPack:
+    """
+    Gives random access to the levels of a level pack, which is mapped
+    into memory instead of being read as a whole.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        with open(path, 'rb') as file:
+            self.data: mmap.mmap = mmap.mmap(
+                file.fileno(),
+                0,
+                access=mmap.ACCESS_READ
+            )
+
+        if len(self.data) < HEADER.size:
+            self.close()
+            raise ValueError(f'{path} is not a valid level pack')
+        magic, version, size, self.count = HEADER.unpack_from(self.data)
+        if magic != MAGIC or version != VERSION or size != gc.LEVEL_SIZE:
+            self.close()
+            raise ValueError(f'{path} is not a valid level pack')
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> 'LevelPack':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.data.close()
+
+    def get_level(self, index: int) -> list[list[int]]:
+        """
+        Returns the level with the given (zero-based) index, as rows of
+        tile IDs.
+
+        NOTE: The tiles are checked against the content hash stored in
+        the index, so a damaged pack raises ValueError instead of
+        loading a garbled level.
+        """
+        offset, level_hash = self._get_index_entry(index)
+        data = self.data[offset:offset + LEVEL_BYTES]
+        if hash_level(data) != level_hash:
+            raise ValueError(f'Level {index} of {self.path} is corrupted')
+        return decode_level(data)
+
+    def get_level_hash(self, index: int) -> bytes:
+        """
+        Returns the content hash of the level with the given index.
+        """
+        return self._get_index_entry(index)[1]
+
+    def _get_index_entry(self, index: int) -> tuple[int, bytes]:
+        if not 0 <= index < self.count:
+            raise IndexError(f'Level {index} not in {self.path}')
+        return INDEX_ENTRY.unpack_from(
+            self.data,
+            HEADER.size + index * INDEX_ENTRY.size
+        )
+
+
+def encode_level(level: list[list[int]], name: str = 'level') -> bytes:
+    """
+    Packs the rows of tile IDs of a level into bytes. Raises ValueError,
+    with the given level name, if the level is not the right size or has
+    unknown tile IDs.
+
+    NOTE: Any rows beyond the level size (e.g. the trailing empty row of
+    the CSV levels) are left out.
+    """
+    rows = level[:gc.LEVEL_SIZE]
+    if (
+        len(rows) != gc.LEVEL_SIZE or
+        any(len(row) != gc.LEVEL_SIZE for row in rows)
+    ):
+        raise ValueError(
+            f'{name}: levels must be {gc.LEVEL_SIZE}x{gc.LEVEL_SIZE} tiles'
+        )
+    codes: list[int] = []
+    for row_index, row in enumerate(rows):
+        for col_index, tile in enumerate(row):
+            code = TILE_CODES.get(int(tile))
+            if code is None:
+                raise ValueError(
+                    f'{name}: unknown tile ID {tile} at row {row_index}, '
+                    f'column {col_index}'
+                )
+            codes.append(code)
+    return array.array('b', codes).tobytes()
+
+
+def decode_level(data: bytes) -> list[list[int]]:
+    """
+    Unpacks the bytes of a level into rows of tile IDs. Raises ValueError
+    if there are too few (or too many) bytes, or unknown tile codes.
+    """
+    tile_ids = gc.LEVEL_PACK_TILE_IDS
+    if len(data) != LEVEL_BYTES:
+        raise ValueError(
+            f'Levels must be {LEVEL_BYTES} bytes long, not {len(data)}'
+        )
+    codes = array.array('b', data)
+    # NOTE: Negative codes would index tile_ids from the end
+    if min(codes) < 0 or max(codes) >= len(tile_ids):
+        raise ValueError('Unknown tile code in level')
+    return [
+        [tile_ids[code] for code in codes[i:i + gc.LEVEL_SIZE]]
+        for i in range(0, LEVEL_BYTES, gc.LEVEL_SIZE)
+    ]
+
+
+def hash_level(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def write_level_pack(
+        path: str,
+        levels: list[list[list[int]]],
+        names: list[str] | None = None
+        ) -> None:
+    """
+    Writes the given levels to a level pack. The level names (e.g. their
+    file names) are only used in the error messages.
+    """
+    index: list[bytes] = []
+    tiles: list[bytes] = []
+    offsets: dict[bytes, int] = {}  # by content hash
+    tiles_offset = HEADER.size + len(levels) * INDEX_ENTRY.size
+
+    if names is None:
+        names = [f'level {index + 1}' for index in range(len(levels))]
+    for level, name in zip(levels, names):
+        data = encode_level(level, name)
+        level_hash = hash_level(data)
+        if level_hash not in offsets:
+            offsets[level_hash] = tiles_offset + len(tiles) * LEVEL_BYTES
+            tiles.append(data)
+        index.append(INDEX_ENTRY.pack(offsets[level_hash], level_hash))
+
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, gc.LEVEL_SIZE, len(levels)))
+        file.write(b''.join(index))
+        file.write(b''.join(tiles))
+
+
+def read_csv_level(path: str) -> list[list[int]]:
+    """
+    Reads a level from a CSV file, as rows of tile IDs.
+    """
+    with open(path, newline='') as file:
+        return [
+            [int(tile) for tile in row]
+            for row in csv.reader(file, delimiter=',')
+            if row
+        ]
+
+
+def write_csv_level(path: str, level: list[list[int]]) -> None:
+    """
+    Writes a level to a CSV file, in the format of the game levels.
+    """
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file, delimiter=',', lineterminator='\n')
+        writer.writerows(level)
+
+
+def get_csv_level_paths(directory: str) -> list[str]:
+    """
+    Returns the paths of the CSV levels in the given directory, sorted by
+    file name.
+    """
+    return [
+        os.path.join(directory, filename)
+        for filename in sorted(os.listdir(directory))
+        if filename.endswith('.csv')
+    ]
+
+
+def pack_csv_directory(directory: str, path: str) -> int:
+    """
+    Packs all the CSV levels of the given directory, sorted by file name,
+    into a level pack. Returns the number of levels packed.
+    """
+    paths = get_csv_level_paths(directory)
+    levels = [read_csv_level(csv_path) for csv_path in paths]
+    write_level_pack(path, levels, paths)
+    return len(levels)
+
+
+def unpack_to_csv_directory(path: str, directory: str) -> int:
+    """
+    Writes every level of a level pack as a CSV file, named as the game
+    levels are. Returns the number of levels unpacked.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with LevelPack(path) as pack:
+        for index in range(len(pack)):
+            write_csv_level(
+                os.path.join(directory, f'BattleCityLevel{index + 1:02d}.csv'),
+                pack.get_level(index)
+            )
+        return len(pack)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Battle City level packs')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    pack_parser = commands.add_parser('pack', help='CSV levels to a pack')
+    pack_parser.add_argument('directory')
+    pack_parser.add_argument('pack')
+
+    unpack_parser = commands.add_parser('unpack', help='pack to CSV levels')
+    unpack_parser.add_argument('pack')
+    unpack_parser.add_argument('directory')
+
+    info_parser = commands.add_parser('info', help='show the pack contents')
+    info_parser.add_argument('pack')
+
+    args = parser.parse_args()
+
+    try:
+        run_command(args)
+    except ValueError as error:
+        parser.exit(1, f'{parser.prog}: error: {error}\n')
+
+
+def run_command(args: argparse.Namespace) -> None:
+    if args.command == 'pack':
+        count = pack_csv_directory(args.directory, args.pack)
+        print(f'{count} levels packed into {args.pack}')
+    elif args.command == 'unpack':
+        count = unpack_to_csv_directory(args.pack, args.directory)
+        print(f'{count} levels unpacked into {args.directory}')
+    else:
+        with LevelPack(args.pack) as pack:
+            print(f'{len(pack)} levels, {os.path.getsize(args.pack)} bytes')
+            for index in range(len(pack)):
+                print(f'{index + 1:>4}  {pack.get_level_hash(index).hex()}')
+
+
+if __name__ == '__main__':
+    main()
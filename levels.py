@@ -1,33 +1,87 @@
-import os
 import csv
+import functools
+import os
 
 from pathlib import Path
 
+import game_config as gc
+from level_pack import LevelPack, get_csv_level_paths, read_csv_level
+
 
 class LevelData:
     """
     Represents the object which manages the actual level data for the
     game or the level editor.
+
+    The levels come either from a directory of CSV files or from a level
+    pack (see level_pack.py). Only a sorted index of the level files (or
+    of the pack levels) is built up front. Each level is parsed the first
+    time it's needed, and the most recently used ones are kept in an LRU
+    cache. Levels inserted from the level editor are kept in memory
+    instead.
+
+    NOTE: There's a single instance, owned by Main and shared by the game
+    and the level editor.
     """
 
-    def __init__(self) -> None:
-        self.level_data = self.load()
-
-    def load(self) -> list:
-        game_stages = []
-        for stage in os.listdir('levels'):
-            # Check if stage file is a CSV one
-            if not stage.endswith('csv'):
-                continue
-            level_data = [[] for i in range(27)]
-            with open(f'levels/{stage}', newline='') as f:
-                reader = csv.reader(f, delimiter=',')
-                for i, row in enumerate(reader):
-                    for j, tile in enumerate(row):
-                        level_data[i].append(int(tile))
-            game_stages.append(level_data)
-
-        return game_stages
+    def __init__(
+            self,
+            path: str = 'levels',
+            cache_size: int = gc.LEVEL_CACHE_SIZE
+            ) -> None:
+        # Each level is either the path to its CSV file, its index in the
+        # level pack, or the level itself if it was inserted from the
+        # level editor
+        self.index: list[str | int | list[list[int]]]
+        # NOTE: The pack stays mapped into memory while the game runs
+        self.pack: LevelPack | None = None
+        if os.path.isfile(path):
+            self.pack = LevelPack(path)
+            self.index = list(range(len(self.pack)))
+        else:
+            self.index = get_csv_level_paths(path)
+        self._read_level_cached = functools.lru_cache(cache_size)(
+            self._read_level
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get_level(self, index: int) -> list[list[int]]:
+        """
+        Returns the level with the given (zero-based) index, as rows of
+        tile IDs.
+
+        NOTE: Parsed levels are shared, so they must not be modified.
+        """
+        level = self.index[index]
+        if isinstance(level, (str, int)):
+            return self._read_level_cached(level)
+        return level
+
+    def insert_level(self, index: int, level: list[list[int]]) -> None:
+        """
+        Inserts a level (e.g. one created in the level editor) at the
+        given index, without saving it.
+        """
+        self.index.insert(index, level)
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        Returns the number of cache hits and misses, and the number of
+        levels currently parsed.
+        """
+        info = self._read_level_cached.cache_info()
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize
+        }
+
+    def _read_level(self, level: str | int) -> list[list[int]]:
+        if isinstance(level, int):
+            return self.pack.get_level(level)
+        return read_csv_level(level)
 
     def save(self, level_data: list) -> None:
         """
@@ -1,4 +1,9 @@
+import argparse
+import math
+import time
+
 import pygame
+from pygame.rect import Rect
 from pygame.surface import Surface
 from pygame.time import Clock
 
@@ -7,6 +12,7 @@ from game import Game
 from game_assets import GameAssets
 from screens.level_editor import LevelEditor
 from levels import LevelData
+from native_canvas import NativeCanvas
 from screens.start_screen import StartScreen
 
 
@@ -15,26 +21,53 @@ class Main:
     Everything starts here.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+            self,
+            render_native: bool = gc.RENDER_NATIVE,
+            output_scale: int = gc.OUTPUT_SCALE,
+            levels_path: str = 'levels'
+            ) -> None:
+        self.start_time: float = time.perf_counter()
+
         pygame.init()
         pygame.mixer.init()
 
         # A good game starts with some display settings
+        self.render_native: bool = render_native
+        self.output_scale: int = self._clamp_output_scale(output_scale)
         self.screen: Surface = pygame.display.set_mode(
-            (gc.SCREEN_WIDTH, gc.SCREEN_HEIGHT)
+            self._get_window_size()
         )
         pygame.display.set_caption('Battle City Clone')
 
         # A clock is needed to regulate the speed of the game...
-        # ...in order to standarize the game performance.
+        # ...in order to standarize the game performance. The real time
+        # not yet simulated is kept in the accumulator (see update)
         self.clock: Clock = Clock()
+        self.accumulator: float = 0.0
 
         # A simple check for the main game loop
         self.run: bool = True
 
-        # All the assets and data for the game
-        self.assets: GameAssets = GameAssets()
-        self.levels: LevelData = LevelData()
+        # The game is played on a window (see headless.py otherwise)
+        self.is_headless: bool = False
+
+        # All the assets and data for the game. Only the start screen is
+        # loaded here, and the rest on the following frames (see load)
+        self.assets: GameAssets = GameAssets(is_staged=True)
+        self.levels_path: str = levels_path
+        self.levels: LevelData | None = None
+        self.is_loading: bool = True
+        self.is_first_frame: bool = True
+
+        # Canvases for the native render path: the game screen is drawn
+        # at native resolution, and everything else at full size, then
+        # both are scaled to the window
+        self.native_canvas: NativeCanvas | None = None
+        self.full_canvas: Surface | None = None
+        if self.render_native:
+            self.native_canvas = NativeCanvas(self.assets, self.output_scale)
+            self.full_canvas = Surface((gc.SCREEN_WIDTH, gc.SCREEN_HEIGHT))
 
         # Game start screen object and check
         self.start_screen: StartScreen = StartScreen(self, self.assets)
@@ -88,15 +121,50 @@ class Main:
 
     def update(self) -> None:
         """
-        Handles all the game updates, which in turn will update all of
-        the objects within.
+        Runs as many simulation ticks as fit in the real time elapsed
+        since the last frame, at a fixed rate of gc.TICK_RATE ticks per
+        second. The time left over is carried on to the next frame.
+
+        While the game is on, the real time is scaled by the game clock
+        time scale, so the game is fast-forwarded (or slowed down) by
+        running more (or fewer) ticks.
+
+        NOTE: Under load, the ticks due are caught up on the next frame,
+        so frames are skipped rather than the game slowed down, unless
+        more than gc.MAX_TICKS_PER_FRAME (times the time scale) are due.
+        That time is dropped.
         """
-        self.clock.tick(gc.FPS)
+        elapsed: int = self.clock.tick(gc.FPS)
 
+        if self.is_loading and not self.is_first_frame:
+            self.load()
+
+        time_scale: float = (
+            self.game.clock.time_scale if self.is_game_on else 1.0
+        )
+        max_ticks: int = math.ceil(gc.MAX_TICKS_PER_FRAME * time_scale)
+        self.accumulator += min(elapsed, gc.MAX_FRAME_TIME) * time_scale
+        ticks: int = 0
+        while self.accumulator >= gc.TICK_TIME:
+            if ticks == max_ticks:
+                self.accumulator = 0.0
+                break
+            self.tick()
+            self.accumulator -= gc.TICK_TIME
+            ticks += 1
+
+    def tick(self) -> None:
+        """
+        Handles all the game updates for a single simulation tick, which
+        in turn will update all of the objects within.
+        """
         if self.is_start_screen_active:
             self.start_screen.update()
 
         if self.is_game_on:
+            self.game.renderer.save_positions()
+            self.game.clock.update()
+            self.game.read_controls()
             self.game.update()
 
         if self.game and not self.game.is_active:
@@ -118,25 +186,134 @@ class Main:
         """
         Handles all of the screen updates, drawing all of the images to
         the screen and ensuring the screen is refreshed with each cycle.
+
+        NOTE: The game repaints its own background, and just the areas
+        that have changed, so only those are sent to the display.
         """
-        self.screen.fill(gc.RGB_BLACK)  # Overall background
+        if (
+            self.native_canvas and
+            self.is_game_on and
+            not self.game.renderer.is_screen_covered()
+        ):
+            self.draw_native()
+            return
+
+        dirty_rects: list[Rect] | None = None
+        window: Surface = self.full_canvas or self.screen
+
+        if not self.is_game_on:
+            window.fill(gc.RGB_BLACK)  # Overall background
 
         if self.is_start_screen_active:
-            self.start_screen.draw(self.screen)
+            self.start_screen.draw(window)
 
         if self.is_game_on:
-            self.game.draw(self.screen)
+            dirty_rects = self.game.draw(window, self.get_alpha())
 
         if self.is_level_editor_on:
-            self.level_creator.draw(self.screen)
+            self.level_creator.draw(window)
+
+        if self.full_canvas:
+            pygame.transform.scale(
+                self.full_canvas,
+                self.screen.get_size(),
+                self.screen
+            )
+            dirty_rects = None
+
+        if dirty_rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(dirty_rects)
+
+        if self.is_first_frame:
+            self.is_first_frame = False
+            self._report_time('First frame')
+
+    def draw_native(self) -> None:
+        """
+        Draws the game screen at native resolution, and then scales it
+        up to the window in one go.
+        """
+        dirty_rects = self.game.draw(self.native_canvas, self.get_alpha())
+        self.native_canvas.present(self.screen)
 
-        pygame.display.update()
+        if dirty_rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update([
+                self.native_canvas.to_output(rect) for rect in dirty_rects
+            ])
+
+    def get_alpha(self) -> float:
+        """
+        Returns how far the frame is into the next simulation tick (from
+        0 to 1), for the moving sprites to be drawn interpolated.
+        """
+        if not gc.RENDER_INTERPOLATION:
+            return 1.0
+        return min(self.accumulator / gc.TICK_TIME, 1.0)
+
+    def load(self, *groups: str) -> None:
+        """
+        Loads the given asset groups right away, or else the pending
+        assets that fit in this frame. The levels are loaded last.
+        """
+        if groups:
+            self.assets.load(*groups)
+        else:
+            self.assets.load_next(gc.ASSET_LOAD_BUDGET)
+
+        if self.levels is None and (groups or self.assets.is_loaded()):
+            self.levels = LevelData(self.levels_path)
+
+        if (
+            self.is_loading and
+            self.levels is not None and
+            self.assets.is_loaded()
+        ):
+            self.is_loading = False
+            self._report_time('Everything loaded')
+
+    def _report_time(self, event: str) -> None:
+        elapsed = (time.perf_counter() - self.start_time) * 1000
+        print(f'{event} after {elapsed:.0f} ms')
+
+    def set_output_scale(self, scale: int) -> None:
+        """
+        Resizes the window to the given multiple of the native resolution.
+        Only available on the native render path.
+        """
+        if not self.native_canvas:
+            return
+
+        self.output_scale = self._clamp_output_scale(scale)
+        self.native_canvas.output_scale = self.output_scale
+        self.screen = pygame.display.set_mode(self._get_window_size())
+        if self.game:
+            self.game.renderer.invalidate()
+
+    def _clamp_output_scale(self, scale: int) -> int:
+        return max(1, min(scale, gc.MAX_OUTPUT_SCALE))
+
+    def _get_window_size(self) -> tuple[int, int]:
+        """
+        Returns the window size, which is fixed unless the game is drawn
+        at native resolution.
+        """
+        if not self.render_native:
+            return gc.SCREEN_WIDTH, gc.SCREEN_HEIGHT
+        return (
+            gc.NATIVE_WIDTH * self.output_scale,
+            gc.NATIVE_HEIGHT * self.output_scale
+        )
 
     def start_new_game(self, player_1: bool, player_2: bool) -> None:
         """
         This method is called from the start screen, and then starts
         the game.
         """
+        self.load('sprites', 'scoresheet', 'sounds')
         self.is_game_on = True
         self.game = Game(
             self,
@@ -151,13 +328,35 @@ class Main:
         This method is called from the start screen, and then starts
         the level editor.
         """
+        self.load('sprites')
         self.is_level_editor_on = True
         self.level_creator = LevelEditor(self, self.assets)
         self.is_start_screen_active = False
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Battle City Clone')
+    parser.add_argument(
+        '--native',
+        action='store_true',
+        default=gc.RENDER_NATIVE,
+        help='draw the game screen at native resolution and scale it up'
+    )
+    parser.add_argument(
+        '--scale',
+        type=int,
+        default=gc.OUTPUT_SCALE,
+        help='window size, as a multiple of the native resolution '
+             '(with --native only)'
+    )
+    parser.add_argument(
+        '--levels',
+        default='levels',
+        help='directory of CSV levels, or level pack, to play'
+    )
+    args = parser.parse_args()
+
     # Start the game already!!
-    battle_city: Main = Main()
+    battle_city: Main = Main(args.native, args.scale, args.levels)
     battle_city.run_game()
     pygame.quit()
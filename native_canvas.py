@@ -0,0 +1,77 @@
+import math
+
+import pygame
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+import game_config as gc
+
+
+class NativeCanvas:
+    """
+    Stands in for the window while the game screen is drawn, so that
+    everything is drawn at the resolution of the original art (256x224)
+    and scaled up to the window just once per frame.
+
+    Sprites keep drawing themselves as usual, with their scaled images and
+    positions, and the canvas swaps them for the original images and the
+    matching native positions.
+
+    NOTE: Only blit, fill and set_clip are supported, which is all the
+    game screen needs. The screens drawing anything else (e.g. the stage
+    fade) are drawn on a full size surface instead (see Main).
+    """
+
+    def __init__(self, assets, output_scale: int = gc.OUTPUT_SCALE) -> None:
+        self.assets = assets
+        self.scale: int = gc.SPRITE_SCALE
+        self.output_scale: int = output_scale
+
+        self.surface: Surface = Surface((gc.NATIVE_WIDTH, gc.NATIVE_HEIGHT))
+        self.surface.fill(gc.RGB_BLACK)
+
+    def blit(self, source: Surface, dest) -> None:
+        self.surface.blit(
+            self.assets.get_native_image(source),
+            (int(dest[0]) // self.scale, int(dest[1]) // self.scale)
+        )
+
+    def fill(self, color, rect: Rect | None = None) -> None:
+        if rect is None:
+            self.surface.fill(color)
+        else:
+            self.surface.fill(color, self.to_native(rect))
+
+    def set_clip(self, rect: Rect | None) -> None:
+        self.surface.set_clip(rect and self.to_native(rect))
+
+    def to_native(self, rect: Rect) -> Rect:
+        """
+        Returns the native area covering the given screen area.
+        """
+        left = rect.left // self.scale
+        top = rect.top // self.scale
+        return Rect(
+            left,
+            top,
+            math.ceil(rect.right / self.scale) - left,
+            math.ceil(rect.bottom / self.scale) - top
+        )
+
+    def to_output(self, rect: Rect) -> Rect:
+        """
+        Returns the window area covering the given screen area.
+        """
+        native = self.to_native(rect)
+        return Rect(
+            native.x * self.output_scale,
+            native.y * self.output_scale,
+            native.width * self.output_scale,
+            native.height * self.output_scale
+        )
+
+    def present(self, window: Surface) -> None:
+        """
+        Scales the canvas up to the whole window.
+        """
+        pygame.transform.scale(self.surface, window.get_size(), window)
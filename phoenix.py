@@ -8,7 +8,7 @@ from pygame.surface import Surface
 from pygame.rect import Rect
 
 import game_config as gc
-from explosions import Explosion
+from timer_wheel import Timer
 
 
 class Phoenix(pygame.sprite.Sprite):
@@ -22,23 +22,20 @@ class Phoenix(pygame.sprite.Sprite):
         self.group['phoenix'].add(self)
 
         self.is_active: bool = True
-        self.timer: int = pygame.time.get_ticks()
+        # Game over delay, once the Phoenix is destroyed
+        self.timer: Timer | None = None
 
         self.images: dict[str, Surface] = self.assets.flag_images
         self.image: Surface = self.images['Phoenix_Alive']
         self.rect: Rect = self.image.get_rect(topleft=gc.PHOENIX_POSITION)
 
-    def update(self) -> None:
-        if not self.is_active and pygame.time.get_ticks() - self.timer >= 750:
-            self._declare_game_over()
-
     def draw(self, window: Surface) -> None:
         window.blit(self.image, self.rect)
 
     def _declare_game_over(self):
         """
-        Utility method for cleaning the update() one, to give a easily-
-        readable idea.
+        Declares game over for the active players, some time after the
+        Phoenix is destroyed.
         """
         if self.game.is_player_1_active:
             self.game.player_1.is_game_over = True
@@ -50,9 +47,11 @@ class Phoenix(pygame.sprite.Sprite):
         Destroys the player base.
         """
         self.is_active = False
-        Explosion(self.assets, self.group, self.rect.center, 5, 0)
+        self.game.pools['explosion'].acquire(self.rect.center, 5, 0)
         self.assets.explosion_sound_channel.play(
             self.assets.explosion_sound
         )
         self.image: Surface = self.images['Phoenix_Destroyed']
-        self.timer: int = pygame.time.get_ticks()
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer = self.game.timers.schedule(750, self._declare_game_over)
@@ -0,0 +1,73 @@
+from typing import Callable
+
+
+class ObjectPool:
+    """
+    Keeps a stock of reusable objects of the same type, so short-lived
+    sprites (e.g. bullets or explosions) don't have to be created and
+    thrown away all the time.
+
+    The factory is called with the pool itself as its only argument, so
+    the new object knows where to go back when it's released. Every
+    pooled object must provide a reset() method, which receives the
+    arguments given to acquire() and brings the object back to life.
+
+    NOTE: Releasing an object which is not in use does nothing, so an
+    object that is destroyed twice in the same frame is never handed
+    out twice.
+    """
+
+    def __init__(self, factory: Callable) -> None:
+        self.factory: Callable = factory
+        self.free: list = []
+        self.in_use: set = set()
+
+        # Pool statistics
+        self.created: int = 0
+        self.acquired: int = 0
+        self.released: int = 0
+
+    def acquire(self, *args, **kwargs):
+        """
+        Returns a free object (or a brand new one, if there's none),
+        reset with the given arguments.
+        """
+        if self.free:
+            item = self.free.pop()
+        else:
+            item = self.factory(self)
+            self.created += 1
+        self.acquired += 1
+        self.in_use.add(item)
+        item.reset(*args, **kwargs)
+        return item
+
+    def release(self, item) -> None:
+        """
+        Gives the object back to the pool, to be reused later on.
+        """
+        if item not in self.in_use:
+            return
+        self.in_use.remove(item)
+        self.free.append(item)
+        self.released += 1
+
+    def release_all(self) -> None:
+        """
+        Gives back every object in use at once, e.g. when their sprite
+        groups are emptied on a new stage.
+        """
+        self.released += len(self.in_use)
+        self.free.extend(self.in_use)
+        self.in_use.clear()
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the number of objects created, reused, in use and free.
+        """
+        return {
+            'created': self.created,
+            'reused': self.acquired - self.created,
+            'in_use': len(self.in_use),
+            'free': len(self.free)
+        }
@@ -5,7 +5,7 @@ from pygame.rect import Rect
 from pygame.surface import Surface
 
 import game_config as gc
-from scores import ScoreBanner
+from timer_wheel import Timer
 
 
 class PowerUp(pygame.sprite.Sprite):
@@ -17,11 +17,16 @@ class PowerUp(pygame.sprite.Sprite):
         self.assets = assets
         self.groups = groups
         self.groups['power_ups'].add(self)
+        self.game.updates.register('power_ups', self)
 
         self.power_up_images: dict[str, Surface] = self.assets.power_up_images
 
         self.power_up: str = self.select_power_up_randomly()
-        self.power_up_timer: int = pygame.time.get_ticks()
+        # The power up goes away if not catched in time
+        self.power_up_timer: Timer = self.game.timers.schedule(
+            5_000,
+            self.kill
+        )
 
         self.x_coord: int = random.randint(
             gc.SCREEN_BORDER_LEFT,
@@ -38,10 +43,6 @@ class PowerUp(pygame.sprite.Sprite):
         )
 
     def update(self) -> None:
-        if pygame.time.get_ticks() - self.power_up_timer >= 5_000:
-            self.kill()
-            # return
-
         player_tank = pygame.sprite.spritecollideany(
             self,
             self.groups['player_tanks']
@@ -68,14 +69,18 @@ class PowerUp(pygame.sprite.Sprite):
     def draw(self, window: Surface) -> None:
         window.blit(self.image, self.rect)
 
+    def kill(self) -> None:
+        self.power_up_timer.cancel()
+        super().kill()
+
     def _assign_score_to_player_tank(self, player_tank) -> None:
         """
         Utility method for cleaning the scoring functionality to player
         tanks when a power up is catched.
         """
-        if player_tank.color == 'Gold':
+        if player_tank.color == gc.TankColor.GOLD:
             self.game.player_1_score += 500
-        elif player_tank.color == 'Green':
+        elif player_tank.color == gc.TankColor.GREEN:
             self.game.player_2_score += 500
 
     def select_power_up_randomly(self) -> str:
@@ -83,7 +88,7 @@ class PowerUp(pygame.sprite.Sprite):
         return random.choice(power_ups)
 
     def collect_power_up(self) -> None:
-        ScoreBanner(self.assets, self.groups, self.rect.center, '500')
+        self.game.pools['scores'].acquire(self.rect.center, '500')
         self.assets.bonus_sound_channel.play(
             self.assets.bonus_sound
         )
@@ -166,12 +171,7 @@ class PowerUp(pygame.sprite.Sprite):
         if player.tank_level >= 3:
             player.tank_level = 3
             player.tank_health += 1
-        player.image = (
-            player.tank_images[f'Tank_{player.tank_level}']
-            [player.color]
-            [player.direction]
-            [player.frame_index]
-        )
+        player.set_frames()
         player.mask_dict = player.get_tank_masks()
         player.mask = player.mask_dict[player.direction]
 
@@ -180,5 +180,10 @@ class PowerUp(pygame.sprite.Sprite):
         Fortify the Phoenix base against enemy tanks' attacks!
         """
         self.game.is_base_fortified = True
-        self.game.fortify_timer = pygame.time.get_ticks()
+        if self.game.fortify_timer is not None:
+            self.game.fortify_timer.cancel()
+        self.game.fortify_timer = self.game.timers.schedule(
+            10_000,
+            self.game.end_fortify
+        )
         self.game.apply_fortify()
@@ -0,0 +1,262 @@
+import pygame
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+import game_config as gc
+from characters import PlayerTank
+
+
+class GameRenderer:
+    """
+    Draws the game screen, repainting only the areas that have changed
+    since the last frame (dirty rectangles).
+
+    Each frame, the areas to repaint are collected from:
+        - The moving sprites (tanks, bullets, explosions, power ups,
+        score banners and the Phoenix), both where they were on the
+        last frame and where they are now.
+        - The water tiles, whenever the water animation track moves on
+        to its next frame.
+        - The tiles added to or removed from the tile grid (i.e. brick
+        and steel tiles hit by bullets, or the fortified base), which
+        are also rendered again on the terrain layer.
+        - The HUD panel, whenever it has to be composed again.
+
+    Those areas are then redrawn from the background up, in the same
+    order as a full redraw would do, and returned so that only those are
+    sent to the display.
+
+    The tanks and bullets can also be drawn in between their positions
+    on the last two ticks (see draw), so they move smoothly when frames
+    are rendered more often than ticks are run.
+
+    NOTE: The whole screen is still redrawn when the stage fade, the
+    score screen or the game over screen is on, since they cover most
+    of it anyway, and once more right after they're gone.
+    """
+
+    def __init__(self, game) -> None:
+        self.game = game
+        self.groups = self.game.groups
+        self.hud = self.game.hud
+
+        # Sprite groups whose sprites are repainted every frame
+        self.moving_groups: list[pygame.sprite.AbstractGroup] = [
+            self.groups['all_tanks'],
+            self.groups['bullets'],
+            self.groups['phoenix'],
+            self.groups['explosion'],
+            self.groups['power_ups'],
+            self.groups['scores']
+        ]
+
+        # Sprite groups whose sprites are drawn interpolated, and where
+        # their sprites were before the last tick
+        self.interpolated_groups: list[pygame.sprite.AbstractGroup] = [
+            self.groups['all_tanks'],
+            self.groups['bullets']
+        ]
+        self.last_positions: dict = {}
+
+        # Game area, which is never covered by the HUD
+        self.game_screen_rect: Rect = Rect(
+            gc.GAME_SCREEN['pos_x'],
+            gc.GAME_SCREEN['pos_y'],
+            gc.GAME_SCREEN['width'],
+            gc.GAME_SCREEN['height']
+        )
+        self.screen_rect: Rect = Rect(0, 0, gc.SCREEN_WIDTH, gc.SCREEN_HEIGHT)
+
+        # What was on the screen on the last frame
+        self.moving_rects: list[Rect] = []
+        self.water_track = self.game.animations.tracks['water']
+        self.water_frame: int | None = None
+
+        # Whether the next frame must be fully redrawn
+        self.is_invalid: bool = True
+
+    def invalidate(self) -> None:
+        """
+        Forces the next frame to be fully redrawn, e.g. on a new stage.
+        """
+        self.is_invalid = True
+        self.water_frame = None
+
+    def is_screen_covered(self) -> bool:
+        """
+        Whether the stage fade, the score screen or the game over screen
+        is on, so the whole screen has to be redrawn.
+        """
+        return (
+            self.game.fade.is_fade_active or
+            self.game.score_screen.is_active or
+            self.game.game_over_screen.is_active
+        )
+
+    def save_positions(self) -> None:
+        """
+        Remembers where the interpolated sprites are, right before a
+        simulation tick.
+        """
+        self.last_positions = {
+            sprite: sprite.rect.topleft
+            for group in self.interpolated_groups
+            for sprite in group
+        }
+
+    def draw(
+            self,
+            window: Surface,
+            alpha: float = 1.0
+            ) -> list[Rect] | None:
+        """
+        Draws the game on the given window, with the interpolated sprites
+        moved back towards where they were before the last tick, as far
+        as the alpha (the fraction of the next tick already elapsed) is
+        from 1. Returns the list of areas that have been repainted, or
+        None if the whole window has been.
+
+        NOTE: The sprites are put back where they are right after being
+        drawn, so the simulation never sees the interpolated positions.
+        """
+        offsets = self._interpolate(alpha) if alpha < 1 else []
+        try:
+            return self._draw(window)
+        finally:
+            for sprite, (dx, dy) in offsets:
+                self._move_sprite(sprite, -dx, -dy)
+
+    def _draw(self, window: Surface) -> list[Rect] | None:
+        is_screen_covered: bool = self.is_screen_covered()
+        dirty_rects = self._get_dirty_rects()
+
+        if self.is_invalid or is_screen_covered:
+            window.fill(gc.RGB_BLACK)
+            self.game.draw_screen(window)
+            self.is_invalid = is_screen_covered
+            return None
+
+        drawing_groups: list[tuple[list, list[Rect]]] = []
+        for group in self.game.get_drawing_groups():
+            sprites = group.sprites()
+            rects = [self._get_draw_rect(sprite) for sprite in sprites]
+            drawing_groups.append((sprites, rects))
+        for rect in dirty_rects:
+            window.set_clip(rect)
+            if self.game_screen_rect.contains(rect):
+                window.fill(gc.RGB_BLACK, rect)
+            else:
+                self.hud.draw(window)  # opaque, also clears the area
+            for sprites, rects in drawing_groups:
+                for index in rect.collidelistall(rects):
+                    sprites[index].draw(window)
+        window.set_clip(None)
+
+        return dirty_rects
+
+    def _get_dirty_rects(self) -> list[Rect]:
+        """
+        Collects the areas changed since the last frame, and merges the
+        ones overlapping or touching each other.
+        """
+        rects: list[Rect] = self.moving_rects
+        self.moving_rects = [
+            Rect(self._get_draw_rect(sprite))
+            for group in self.moving_groups
+            for sprite in group
+        ]
+        rects.extend(self.moving_rects)
+
+        if self.water_track.frame != self.water_frame:
+            self.water_frame = self.water_track.frame
+            rects.extend(tile.rect for tile in self.groups['water_tiles'])
+
+        tile_grid = self.game.tile_grid
+        self.game.terrain.update(tile_grid.changed_rects)
+        rects.extend(tile_grid.changed_rects)
+        tile_grid.changed_rects.clear()
+
+        if self.hud.is_dirty:
+            rects.append(self.hud.panel_rect)
+
+        return self._merge_rects(rects)
+
+    def _merge_rects(self, rects: list[Rect]) -> list[Rect]:
+        """
+        Returns the given rectangles aligned to the art pixels and
+        clipped to the screen, with the ones overlapping or touching each
+        other joined together.
+        """
+        merged: list[Rect] = []
+        for rect in rects:
+            rect = self._align_rect(rect).clip(self.screen_rect)
+            if not rect:
+                continue
+            index = rect.inflate(2, 2).collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.inflate(2, 2).collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def _align_rect(self, rect: Rect) -> Rect:
+        """
+        Returns the given rectangle grown out to the edges of the art
+        pixels (gc.SPRITE_SCALE screen pixels wide).
+
+        NOTE: The native canvas can only clip to whole art pixels. The
+        interpolated sprites aren't always drawn on the edges of those,
+        so a sprite overlapping the clip area could otherwise be left
+        out of the redraw, if it didn't overlap the area asked for.
+        """
+        scale = gc.SPRITE_SCALE
+        left = rect.left // scale * scale
+        top = rect.top // scale * scale
+        return Rect(
+            left,
+            top,
+            -(-rect.right // scale) * scale - left,
+            -(-rect.bottom // scale) * scale - top
+        )
+
+    def _interpolate(
+            self,
+            alpha: float
+            ) -> list[tuple[pygame.sprite.Sprite, tuple[int, int]]]:
+        """
+        Moves the interpolated sprites back towards their last positions,
+        and returns how far each one has been moved.
+        """
+        offsets = []
+        last_positions = self.last_positions
+        for group in self.interpolated_groups:
+            for sprite in group:
+                last_position = last_positions.get(sprite)
+                if last_position is None:
+                    continue  # new on the last tick
+                dx = last_position[0] - sprite.rect.x
+                dy = last_position[1] - sprite.rect.y
+                if abs(dx) + abs(dy) > gc.MAX_INTERPOLATION_DISTANCE:
+                    continue
+                dx = round(dx * (1 - alpha))
+                dy = round(dy * (1 - alpha))
+                if dx or dy:
+                    self._move_sprite(sprite, dx, dy)
+                    offsets.append((sprite, (dx, dy)))
+        return offsets
+
+    def _move_sprite(self, sprite, dx: int, dy: int) -> None:
+        sprite.rect.move_ip(dx, dy)
+        if isinstance(sprite, PlayerTank):
+            sprite.shield_rect.move_ip(dx, dy)
+
+    def _get_draw_rect(self, sprite) -> Rect:
+        """
+        Returns the area covered by the sprite when drawn.
+
+        NOTE: The player tank shield is only moved along with the tank on
+        the next update, so it may be drawn slightly apart from it.
+        """
+        if isinstance(sprite, PlayerTank):
+            return sprite.rect.union(sprite.shield_rect)
+        return sprite.rect
@@ -2,35 +2,70 @@ import pygame
 from pygame.surface import Surface
 from pygame.rect import Rect
 
+import game_config as gc
+from timer_wheel import Timer
+
 
 class ScoreBanner(pygame.sprite.Sprite):
 
-    def __init__(
-            self,
-            assets,
-            group,
-            position: tuple[int, int],
-            score: int
-            ) -> None:
+    __slots__ = (
+        'game',
+        'assets',
+        'group',
+        'position',
+        'score',
+        'images',
+        'image',
+        'rect',
+        'pos_y',
+        'timer',
+        'pool'
+    )
+
+    def __init__(self, game, assets, group, pool) -> None:
+        """
+        Creates a blank score banner. Banners are pooled by the Game
+        object, so they're brought to life by reset(), through the
+        pool's acquire(), and taken out of the game by release().
+        """
         super().__init__()
 
+        self.game = game
         self.assets = assets
         self.group = group
+        self.pool = pool
+
+        self.images: dict[str, Surface] = self.assets.score_images
+        self.timer: Timer | None = None
+
+    def reset(self, position: tuple[int, int], score: int) -> None:
         self.group['scores'].add(self)
+        self.game.updates.register('scores', self)
 
         self.position: tuple[int, int] = position
         self.score: str = str(score)
 
-        self.images: dict[str, Surface] = self.assets.score_images
         self.image: Surface = self.images[self.score]
         self.rect: Rect = self.image.get_rect(center=self.position)
+        self.pos_y: float = self.rect.y
+
+        # NOTE: A banner given back through the pool's release_all() may
+        # still have its old timer pending, so it's cancelled here.
+        if self.timer is not None:
+            self.timer.cancel()
+        self.timer: Timer = self.game.timers.schedule(1_000, self.release)
 
-        self.timer: int = pygame.time.get_ticks()
+    def release(self) -> None:
+        """
+        Takes the banner out of the game and gives it back to the pool.
+        """
+        self.timer.cancel()
+        self.kill()
+        self.pool.release(self)
 
     def update(self) -> None:
-        self.rect.y -= 1
-        if pygame.time.get_ticks() - self.timer >= 1_000:
-            self.kill()
+        self.pos_y -= gc.SCORE_BANNER_SPEED
+        self.rect.y = self.pos_y
         return super().update()
 
     def draw(self, window: Surface) -> None:
@@ -1,4 +1,3 @@
-import pygame
 from pygame.surface import Surface
 from pygame.rect import Rect
 
@@ -18,13 +17,14 @@ class GameOver:
                 gc.SCREEN_HEIGHT // 2 + self.height // 2,
             )
         self.rect: Rect = self.image.get_rect(center=self.rect_center)
+        self.pos_y: float = self.rect.y
 
-        self.timer: int = pygame.time.get_ticks()
+        self.timer: int = self.game.clock.get_ticks()
         self.is_active: bool = False
 
     def activate(self):
         self.is_active = True
-        self.timer = pygame.time.get_ticks()
+        self.timer = self.game.clock.get_ticks()
 
     def update(self) -> None:
         """
@@ -34,15 +34,16 @@ class GameOver:
 
         if self.rect.y > game_over_position:
             # Move image upwards
-            self.rect.y -= 10
+            self.pos_y -= gc.GAME_OVER_SCROLL_SPEED
+            self.rect.y = self.pos_y
         elif self.rect.y < game_over_position:
             # Stop image in the desired position (screen center)
             self.rect.y = game_over_position
-            self.timer = pygame.time.get_ticks()
+            self.timer = self.game.clock.get_ticks()
 
         if (
             self.rect.y == game_over_position and
-            pygame.time.get_ticks() - self.timer >= 3_000
+            self.game.clock.get_ticks() - self.timer >= 3_000
         ):
             self.is_active = False
             self.game.create_stage_transition(True)
@@ -3,7 +3,6 @@ from typing import KeysView
 import pygame
 
 import game_config as gc
-from levels import LevelData
 
 
 class LevelEditor:
@@ -16,10 +15,7 @@ class LevelEditor:
         self.assets = assets
         self.is_active = True
 
-        self.level_data = LevelData()
-        self.all_levels = []
-        for stage in self.level_data.level_data:
-            self.all_levels.append(stage)
+        self.level_data = self.main.levels
 
         self.overlay_screen = self.draw_screen()
         self.matrix = self.create_level_matrix()
@@ -38,7 +34,9 @@ class LevelEditor:
         self.insert_tile = self.inserts[self.index]
 
         # Icon image as pointer
-        self.icon_image = self.assets.tank_images['Tank_4']['Gold']['Up'][0]
+        self.icon_image = (
+            self.assets.tank_images[4][gc.TankColor.GOLD][gc.Direction.UP][0]
+        )
         self.icon_rect = self.icon_image.get_rect(
             topleft=(gc.SCREEN_BORDER_LEFT, gc.SCREEN_BORDER_TOP)
         )
@@ -194,14 +192,15 @@ class LevelEditor:
         # Save level (NOTE: dev mode! og levels may be overwritten!)
         # if key == pygame.K_RETURN:
         #     self.validate_level()
-        #     self.all_levels.append(self.matrix)
-        #     self.level_data.save(self.all_levels)
-        #     self.main.levels.level_data = self.all_levels
+        #     self.level_data.insert_level(len(self.level_data), self.matrix)
+        #     self.level_data.save([
+        #         self.level_data.get_level(i)
+        #         for i in range(len(self.level_data))
+        #     ])
         #     self.is_active = False
         # Insert level immediately into level list and play new level
         if key == pygame.K_RETURN:
-            self.all_levels.insert(0, self.matrix)
-            self.main.levels.level_data = self.all_levels
+            self.level_data.insert_level(0, self.matrix)
             self.is_active = False
 
     def _define_insert_pattern(self, tile: int) -> list[list[int]]:
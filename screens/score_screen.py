@@ -9,11 +9,9 @@ class ScoreScreen:
     def __init__(self, game, assets) -> None:
         self.game = game
         self.assets = assets
-        self.white_nums: dict[str, Surface] = self.assets.numbers_black_white
-        self.orange_nums: dict[str, Surface] = self.assets.numbers_black_orange
 
         self.is_active = False
-        self.timer: int = pygame.time.get_ticks()
+        self.timer: int = self.game.clock.get_ticks()
         self.score_timer: int = 100  # milliseconds
 
         self.images: dict[str, Surface] = self.assets.scoresheet_images
@@ -59,32 +57,32 @@ class ScoreScreen:
         )
 
     def update(self, is_game_over: bool) -> None:
-        if not pygame.time.get_ticks() - self.timer >= 2_000:
+        if not self.game.clock.get_ticks() - self.timer >= 2_000:
             return
 
         # Player 1
         if (
             len(self.player_1_enemies_killed) > 0 and
-            pygame.time.get_ticks() - self.timer >= 100
+            self.game.clock.get_ticks() - self.timer >= 100
         ):
             score = self.player_1_enemies_killed.pop(0)
             self.update_score(score, 'player_1')
             self.assets.score_sound.play()
-            self.score_timer = pygame.time.get_ticks()
+            self.score_timer = self.game.clock.get_ticks()
             return
 
         # Player 2
         if (
             len(self.player_2_enemies_killed) > 0 and
-            pygame.time.get_ticks() - self.timer >= 100
+            self.game.clock.get_ticks() - self.timer >= 100
         ):
             score = self.player_2_enemies_killed.pop(0)
             self.update_score(score, 'player_2')
             self.assets.score_sound.play()
-            self.score_timer = pygame.time.get_ticks()
+            self.score_timer = self.game.clock.get_ticks()
             return
 
-        if pygame.time.get_ticks() - self.timer >= 4_000:
+        if self.game.clock.get_ticks() - self.timer >= 4_000:
             if is_game_over:
                 self.game.is_active = False
                 return
@@ -205,7 +203,8 @@ class ScoreScreen:
                 )
             # The following for all players
             surface.blit(
-                self.assets.tank_images[f'Tank_{num + 4}']['Silver']['Up'][0],
+                self.assets.tank_images[num + 4][gc.TankColor.SILVER]
+                [gc.Direction.UP][0],
                 (self.score_size * 15, self.score_size * (pos_y - 0.5))
             )
 
@@ -220,27 +219,17 @@ class ScoreScreen:
     def generate_number_image(
             self,
             score: int,
-            number_color: dict[str, Surface]
+            number_color: str
             ) -> Surface:
         """
-        Converts a number into an image.
+        Converts a number into an image, through the shared glyph cache.
         """
-        num = str(score)
-        length = len(num)
-        score_surface = Surface(
-            (self.score_size * length, self.score_size)
-        )
-        for index, number in enumerate(num):
-            score_surface.blit(
-                number_color[int(number)],
-                (self.score_size * index, 0)
-            )
-        return score_surface
+        return self.assets.glyph_cache.render_number(score, number_color)
 
     def update_player_score_images(self) -> None:
         # Player 1
         self.player_1_score_img = self.generate_number_image(
-            self.player_1_score, self.orange_nums
+            self.player_1_score, 'orange'
         )
         self.player_1_score_rect = self.player_1_score_img.get_rect(
             topleft=(
@@ -250,7 +239,7 @@ class ScoreScreen:
         )
         # Player 2
         self.player_2_score_img = self.generate_number_image(
-            self.player_2_score, self.orange_nums
+            self.player_2_score, 'orange'
         )
         self.player_2_score_rect = self.player_2_score_img.get_rect(
             topleft=(
@@ -261,7 +250,7 @@ class ScoreScreen:
 
     def _create_top_score_images(self) -> None:
         self.hi_score_nums_total = self.generate_number_image(
-            self.top_score, self.orange_nums
+            self.top_score, 'orange'
         )
         self.hi_score_nums_rect = self.hi_score_nums_total.get_rect(
             topleft=(self.score_size * 19, self.score_size * 4)
@@ -269,7 +258,7 @@ class ScoreScreen:
 
     def _create_stage_number_images(self) -> None:
         self.stage_num = self.generate_number_image(
-            self.stage, self.white_nums
+            self.stage, 'white'
         )
         self.stage_num_rect = self.stage_num.get_rect(
             topleft=(self.score_size * 19, self.score_size * 6)
@@ -322,7 +311,7 @@ class ScoreScreen:
             tank_num_images[key].append(
                 self.generate_number_image(
                     player_score_values[key][0],
-                    self.white_nums
+                    'white'
                 )
             )
             tank_num_images[key].append(
@@ -335,7 +324,7 @@ class ScoreScreen:
         tank_num_images['total'].append(
             self.generate_number_image(
                 player_score_values['total'],
-                self.white_nums
+                'white'
             )
         )
         tank_num_images['total'].append(
@@ -365,7 +354,7 @@ class ScoreScreen:
             tank_score_images[key].append(
                 self.generate_number_image(
                     player_score_values[key][0],
-                    self.white_nums
+                    'white'
                 )
             )
             tank_score_images[key].append(
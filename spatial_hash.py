@@ -0,0 +1,133 @@
+import pygame
+from pygame.rect import Rect
+
+import game_config as gc
+
+
+class SpatialHashGroup(pygame.sprite.Group):
+    """
+    A sprite group that also buckets its sprites into a uniform grid of
+    IMAGE_SIZE cells (a spatial hash), for a cheap broad phase.
+
+    Instead of checking a sprite against every member of the group, the
+    collision queries below only look at the sprites registered in the
+    cells touched by the given rectangle. Any mask test should then run
+    on those few candidates only.
+
+    NOTE: Sprites are hashed when they're added to the group and
+    unhashed when removed (e.g. through kill()), but a moving sprite must
+    call refresh() after changing its rect, so its cells are updated.
+    """
+
+    def __init__(self, *sprites, cell_size: int = gc.IMAGE_SIZE) -> None:
+        self.cell_size: int = cell_size
+        self.buckets: dict[tuple[int, int], dict] = {}
+        self.sprite_cells: dict = {}
+        self.sprite_order: dict = {}
+        self.order: int = 0
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self.order += 1
+        self.sprite_order[sprite] = self.order
+        self._insert(sprite)
+
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        self._remove(sprite)
+        del self.sprite_order[sprite]
+
+    def refresh(self, sprite) -> None:
+        """
+        Moves the sprite to the cells under its current rectangle, if
+        they've changed since the last time it was hashed.
+        """
+        if sprite not in self.sprite_cells:
+            return
+        if self.sprite_cells[sprite] == self._get_cell_range(sprite.rect):
+            return
+        self._remove(sprite)
+        self._insert(sprite)
+
+    def get_candidates(self, rect: Rect) -> list:
+        """
+        Returns the sprites registered in the cells touched by the given
+        rectangle, in the same order as they were added to the group.
+
+        NOTE: Buckets are in the order their sprites were last hashed,
+        which changes as they move (see refresh), so even a single bucket
+        is sorted. The collision results never depend on the cells a
+        sprite happens to span.
+        """
+        order = self.sprite_order.__getitem__
+        col_start, row_start, col_end, row_end = self._get_cell_range(rect)
+        if col_start == col_end and row_start == row_end:
+            bucket = self.buckets.get((col_start, row_start))
+            return sorted(bucket, key=order) if bucket else []
+
+        candidates: dict = {}
+        for col in range(col_start, col_end + 1):
+            for row in range(row_start, row_end + 1):
+                bucket = self.buckets.get((col, row))
+                if bucket:
+                    candidates.update(bucket)
+        return sorted(candidates, key=order)
+
+    def spritecollide(self, sprite) -> list:
+        """
+        Works like pygame.sprite.spritecollide(sprite, group, False),
+        but only tests the candidates found in the spatial hash.
+        """
+        rect = sprite.rect
+        return [
+            candidate for candidate in self.get_candidates(rect)
+            if rect.colliderect(candidate.rect)
+        ]
+
+    def spritecollideany(self, sprite):
+        """
+        Works like pygame.sprite.spritecollideany(sprite, group), but
+        only tests the candidates found in the spatial hash.
+        """
+        return self.rectcollideany(sprite.rect)
+
+    def rectcollideany(self, rect: Rect):
+        """
+        Returns the first sprite colliding with the given rectangle, or
+        None if there's none.
+        """
+        for candidate in self.get_candidates(rect):
+            if rect.colliderect(candidate.rect):
+                return candidate
+        return None
+
+    def _get_cell_range(self, rect: Rect) -> tuple[int, int, int, int]:
+        """
+        Returns the first and last column and row (both inclusive) of
+        the cells touched by the given rectangle.
+        """
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size
+        )
+
+    def _insert(self, sprite) -> None:
+        cell_range = self._get_cell_range(sprite.rect)
+        self.sprite_cells[sprite] = cell_range
+        col_start, row_start, col_end, row_end = cell_range
+        for col in range(col_start, col_end + 1):
+            for row in range(row_start, row_end + 1):
+                self.buckets.setdefault((col, row), {})[sprite] = None
+
+    def _remove(self, sprite) -> None:
+        col_start, row_start, col_end, row_end = self.sprite_cells.pop(sprite)
+        for col in range(col_start, col_end + 1):
+            for row in range(row_start, row_end + 1):
+                bucket = self.buckets[(col, row)]
+                del bucket[sprite]
+                if not bucket:
+                    del self.buckets[(col, row)]
@@ -0,0 +1,188 @@
+import array
+
+from pygame.surface import Surface
+
+import game_config as gc
+from tile import BrickTile, SteelTile, IceTile, WaterTile
+
+
+class StagePrototype:
+    """
+    A level compiled once into everything needed to set up its stage:
+
+        - The kind (tile ID) and position of every map tile, as arrays.
+        - The collision grid snapshot, i.e. the type code of every grid
+        cell and the number of the tile sitting there.
+        - The pre-rendered ground and overlay terrain surfaces, at the
+        native resolution (there's no overlay if the level has no forest
+        tiles).
+
+    Setting up the stage is then a matter of creating the tile sprites
+    straight from the arrays, copying the snapshot into the tile grid and
+    scaling the terrain surfaces up, instead of decoding the level and
+    adding and rendering each tile one by one.
+
+    NOTE: Prototypes are never modified once compiled, so a stage can be
+    set up from the same prototype as many times as needed. The terrain
+    surfaces are left out in headless mode. Forest tiles get no sprites
+    at all, since they never change and are only drawn through the
+    pre-rendered overlay.
+    """
+
+    def __init__(
+            self,
+            level: list[list[int]],
+            assets,
+            is_headless: bool = False
+            ) -> None:
+        self.assets = assets
+
+        # Map tiles, in level order
+        self.kinds: array.array = array.array('h')
+        self.xs: array.array = array.array('h')
+        self.ys: array.array = array.array('h')
+
+        # Collision grid snapshot: the type code of each cell, and the
+        # number of the tile there (-1 if none)
+        self.cells: bytearray = bytearray(gc.GRID_COLS * gc.GRID_ROWS)
+        self.cell_tiles: array.array = array.array(
+            'h',
+            [-1] * (gc.GRID_COLS * gc.GRID_ROWS)
+        )
+
+        self.ground: Surface | None = None
+        self.overlay: Surface | None = None
+
+        self._compile(level)
+        if not is_headless:
+            self._render()
+
+    def instantiate(self, game) -> None:
+        """
+        Sets up the stage tiles in the game sprite groups and tile grid,
+        which are expected to be empty.
+        """
+        groups = game.groups
+        assets = self.assets
+        tiles: list = []
+
+        # NOTE: The tiles are created without the tile grid, so they don't
+        # add themselves to it, and then the grid is copied as a whole.
+        for kind, x, y in zip(self.kinds, self.xs, self.ys):
+            if kind == gc.ID_BRICK:
+                tile = BrickTile(
+                    (x, y),
+                    groups['destructable_tiles'],
+                    assets.brick_tiles
+                )
+                groups['impassable_tiles'].add(tile)
+                tile.tile_grid = game.tile_grid
+            elif kind == gc.ID_STEEL:
+                tile = SteelTile(
+                    (x, y),
+                    groups['destructable_tiles'],
+                    assets.steel_tiles
+                )
+                groups['impassable_tiles'].add(tile)
+                tile.tile_grid = game.tile_grid
+            elif kind == gc.ID_FOREST:
+                tile = None  # only ever drawn, through the overlay
+            elif kind == gc.ID_ICE:
+                tile = IceTile(
+                    (x, y),
+                    groups['ice_tiles'],
+                    assets.ice_tiles
+                )
+            else:
+                tile = WaterTile(
+                    (x, y),
+                    groups['water_tiles'],
+                    assets.water_tiles,
+                    game.animations.tracks['water']
+                )
+                groups['impassable_tiles'].add(tile)
+                tile.tile_grid = game.tile_grid
+            tiles.append(tile)
+
+        game.tile_grid.restore(
+            self.cells,
+            [tiles[number] if number >= 0 else None
+             for number in self.cell_tiles]
+        )
+
+    def _compile(self, level: list[list[int]]) -> None:
+        """
+        Fills the tile arrays and the collision grid snapshot.
+        """
+        tile_size = gc.IMAGE_SIZE // 2
+        # Grid cells per map tile side
+        span = tile_size // gc.GRID_CELL_SIZE
+        cols = gc.GRID_COLS
+        grid_codes = {
+            gc.ID_BRICK: BrickTile.grid_code,
+            gc.ID_STEEL: SteelTile.grid_code,
+            gc.ID_FOREST: None,
+            gc.ID_ICE: None,
+            gc.ID_WATER: WaterTile.grid_code
+        }
+
+        for i, row in enumerate(level):
+            y = gc.SCREEN_BORDER_TOP + i * tile_size
+            for j, tile in enumerate(row):
+                tile_id = int(tile)
+                if tile_id not in grid_codes:
+                    continue  # empty cell or the flag
+
+                number = len(self.kinds)
+                self.kinds.append(tile_id)
+                self.xs.append(gc.SCREEN_BORDER_LEFT + j * tile_size)
+                self.ys.append(y)
+
+                code = grid_codes[tile_id]
+                width = min(span, cols - j * span)
+                if code is None or width <= 0:
+                    continue
+                cells = bytes((code,)) * width
+                numbers = array.array('h', (number,)) * width
+                for row_index in range(
+                    i * span,
+                    min((i + 1) * span, gc.GRID_ROWS)
+                ):
+                    start = row_index * cols + j * span
+                    self.cells[start:start + width] = cells
+                    self.cell_tiles[start:start + width] = numbers
+
+    def _render(self) -> None:
+        """
+        Pre-renders the ground tiles (ice, bricks and steel) and the
+        overlay tiles (forest), as the terrain layer would, but at the
+        native resolution.
+        """
+        scale = gc.SPRITE_SCALE
+        size = (
+            gc.GAME_SCREEN['width'] // scale,
+            gc.GAME_SCREEN['height'] // scale
+        )
+        self.ground = Surface(size)
+        self.ground.fill(gc.RGB_BLACK)
+        if gc.ID_FOREST in self.kinds:
+            self.overlay = Surface(size)
+            self.overlay.fill(gc.RGB_BLACK)
+
+        get_native_image = self.assets.get_native_image
+        images = {
+            gc.ID_BRICK: (self.ground, self.assets.brick_tiles['small']),
+            gc.ID_STEEL: (self.ground, self.assets.steel_tiles['small']),
+            gc.ID_ICE: (self.ground, self.assets.ice_tiles['small']),
+            gc.ID_FOREST: (self.overlay, self.assets.forest_tiles['small'])
+        }
+        for kind, x, y in zip(self.kinds, self.xs, self.ys):
+            if kind in images:
+                surface, image = images[kind]
+                surface.blit(
+                    get_native_image(image),
+                    (
+                        (x - gc.SCREEN_BORDER_LEFT) // scale,
+                        (y - gc.SCREEN_BORDER_TOP) // scale
+                    )
+                )
@@ -0,0 +1,154 @@
+import pygame
+from pygame.rect import Rect
+from pygame.sprite import Sprite, GroupSingle
+from pygame.surface import Surface
+
+import game_config as gc
+
+
+class TerrainSurface(Sprite):
+    """
+    A whole layer of map tiles, pre-rendered on a single surface that
+    covers the game screen, and drawn like any other sprite.
+    """
+
+    def __init__(self, group: GroupSingle, is_transparent: bool) -> None:
+        super().__init__(group)
+
+        self.rect: Rect = Rect(
+            gc.GAME_SCREEN['pos_x'],
+            gc.GAME_SCREEN['pos_y'],
+            gc.GAME_SCREEN['width'],
+            gc.GAME_SCREEN['height']
+        )
+        self.image: Surface = Surface(self.rect.size)
+        self.image.fill(gc.RGB_BLACK)
+        if is_transparent:
+            self.image.set_colorkey(gc.RGB_BLACK)
+
+    def draw(self, window: Surface) -> None:
+        window.blit(self.image, self.rect)
+
+
+class TerrainLayer:
+    """
+    Keeps the static map tiles pre-rendered, so the terrain costs two
+    blits per frame instead of one per tile.
+
+    The ground tiles (ice, bricks and steel) are baked into the ground
+    surface, drawn below everything else, and the forest tiles into the
+    overlay surface, drawn above the tanks. Both are copied from the
+    stage prototype when a new stage is loaded. Afterwards, only the map
+    cells where a tile has been reshaped, destroyed or placed (e.g. by
+    the fortify power up) are rendered again, as reported by the tile
+    grid. The tiles of each of those cells are looked up in the tile grid
+    (bricks and steel) or in an index built with the stage (ice), so the
+    cost doesn't grow with the number of tiles on the map.
+
+    NOTE: Bricks and steel used to be drawn above the tanks and bullets,
+    but they never overlap each other anyway. Water tiles are animated,
+    so they're still drawn as sprites.
+    """
+
+    def __init__(self, game) -> None:
+        self.game = game
+        self.groups = self.game.groups
+        self.assets = self.game.assets
+
+        # Size of a full map tile, which is the unit for re-rendering
+        self.cell_size: int = gc.IMAGE_SIZE // 2
+
+        # Ice tiles by map cell, to render the ground cells again (the
+        # overlay never changes during a stage)
+        self.ice_tiles: dict[tuple[int, int], Sprite] = {}
+
+        # Terrain surfaces, each one in its own group to be drawn
+        self.ground_group: GroupSingle = GroupSingle()
+        self.ground: TerrainSurface = TerrainSurface(
+            self.ground_group,
+            is_transparent=False
+        )
+        self.overlay_group: GroupSingle = GroupSingle()
+        self.overlay: TerrainSurface = TerrainSurface(
+            self.overlay_group,
+            is_transparent=True
+        )
+
+    def build(self, prototype) -> None:
+        """
+        Scales up both terrain surfaces, already rendered, from the given
+        stage prototype.
+
+        NOTE: The map tiles are scaled up from the original art without
+        any smoothing, so the result is the same as rendering them here.
+        """
+        for terrain, image in (
+            (self.ground, prototype.ground),
+            (self.overlay, prototype.overlay)
+        ):
+            if image:
+                pygame.transform.scale(
+                    image,
+                    terrain.image.get_size(),
+                    terrain.image
+                )
+            else:
+                terrain.image.fill(gc.RGB_BLACK)
+            self.assets.forget_native_image(terrain.image)
+
+        size = self.cell_size
+        x_offset, y_offset = self.ground.rect.topleft
+        self.ice_tiles = {
+            (
+                (tile.rect.x - x_offset) // size,
+                (tile.rect.y - y_offset) // size
+            ): tile
+            for tile in self.groups['ice_tiles']
+        }
+
+    def update(self, changed_rects: list[Rect]) -> None:
+        """
+        Renders again the ground surface cells touched by the given
+        rectangles.
+        """
+        cells: set[tuple[int, int]] = set()
+        size = self.cell_size
+        x_offset, y_offset = self.ground.rect.topleft
+        for rect in changed_rects:
+            for col in range(
+                (rect.left - x_offset) // size,
+                (rect.right - x_offset - 1) // size + 1
+            ):
+                for row in range(
+                    (rect.top - y_offset) // size,
+                    (rect.bottom - y_offset - 1) // size + 1
+                ):
+                    cells.add((col, row))
+
+        for col, row in cells:
+            self._render_cell(col, row)
+
+    def _render_cell(self, col: int, row: int) -> None:
+        """
+        Clears the given map cell of the ground surface, and draws again
+        the tiles found there.
+        """
+        size = self.cell_size
+        x_offset, y_offset = self.ground.rect.topleft
+        cell = Rect(x_offset + col * size, y_offset + row * size, size, size)
+
+        tiles: list = self.game.tile_grid.get_tiles(
+            cell,
+            (gc.GRID_BRICK, gc.GRID_STEEL)
+        )
+        ice_tile = self.ice_tiles.get((col, row))
+        if ice_tile:
+            tiles.append(ice_tile)
+
+        image = self.ground.image
+        image.set_clip(cell.move(-x_offset, -y_offset))
+        image.fill(gc.RGB_BLACK)
+        for tile in tiles:
+            image.blit(tile.image, tile.rect.move(-x_offset, -y_offset))
+        image.set_clip(None)
+        self.assets.forget_native_image(image)
@@ -0,0 +1,191 @@
+"""
+Tests for the bullet on bullet collisions, and for the bullets hitting
+tiles changed earlier in the same tick.
+
+Run with: python -m unittest (or pytest), no display needed.
+"""
+
+
+import os
+import random
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from pygame.rect import Rect  # noqa: E402
+
+import game_config as gc  # noqa: E402
+from ammunition import (  # noqa: E402
+    _get_time_of_impact,
+    resolve_bullet_collisions
+)
+
+
+class FakeBullet:
+    """
+    Stands in for a bullet which has just moved by (dx, dy), with an
+    8x8 hitbox in the middle of its 32x32 rectangle.
+    """
+
+    def __init__(self, x: int, y: int, dx: int, dy: int) -> None:
+        self.hitbox = Rect(12, 12, 8, 8)
+        self.last_rect = Rect(x, y, 32, 32)
+        self.rect = self.last_rect.move(dx, dy)
+        self.is_alive = True
+        self.owner_updates = 0
+
+    def alive(self) -> bool:
+        return self.is_alive
+
+    def update_owner(self) -> None:
+        self.owner_updates += 1
+
+    def release(self) -> None:
+        self.is_alive = False
+
+
+def get_box(bullet: FakeBullet) -> tuple:
+    start = bullet.hitbox.move(bullet.last_rect.topleft)
+    end = bullet.hitbox.move(bullet.rect.topleft)
+    return start.union(end), start, end.topleft, bullet
+
+
+class BulletCollisionTest(unittest.TestCase):
+
+    def test_head_on_bullets_collide_at_high_speed(self) -> None:
+        # They swap places within the tick, never overlapping at its
+        # start or end
+        first = FakeBullet(0, 100, 200, 0)
+        second = FakeBullet(150, 100, -200, 0)
+        self.assertFalse(first.rect.colliderect(second.rect))
+        resolve_bullet_collisions([first, second])
+        self.assertFalse(first.alive())
+        self.assertFalse(second.alive())
+        self.assertEqual(first.owner_updates, 1)
+        self.assertEqual(second.owner_updates, 1)
+
+    def test_vertical_head_on_bullets_collide_too(self) -> None:
+        first = FakeBullet(100, 0, 0, 300)
+        second = FakeBullet(100, 250, 0, -300)
+        resolve_bullet_collisions([second, first])
+        self.assertFalse(first.alive())
+        self.assertFalse(second.alive())
+
+    def test_bullets_in_other_lanes_pass_by(self) -> None:
+        first = FakeBullet(0, 100, 200, 0)
+        second = FakeBullet(150, 110, -200, 0)  # hitboxes 2 px apart
+        crossing = FakeBullet(300, 0, 0, 300)
+        resolve_bullet_collisions([first, second, crossing])
+        self.assertTrue(first.alive())
+        self.assertTrue(second.alive())
+        self.assertTrue(crossing.alive())
+
+    def test_time_of_impact(self) -> None:
+        first = get_box(FakeBullet(0, 100, 100, 0))
+        still = get_box(FakeBullet(60, 100, 0, 0))
+        self.assertAlmostEqual(_get_time_of_impact(first, still), 0.52)
+        self.assertAlmostEqual(_get_time_of_impact(still, first), 0.52)
+
+        overlapping = get_box(FakeBullet(4, 100, 0, 0))
+        self.assertEqual(_get_time_of_impact(first, overlapping), 0.0)
+
+        behind = get_box(FakeBullet(-60, 100, 10, 0))
+        self.assertIsNone(_get_time_of_impact(first, behind))
+
+    def test_earliest_impacts_are_resolved_first(self) -> None:
+        # The first bullet hits the still one at 0.52, and would hit the
+        # last one at 0.77, which would hit the still one at 0.88
+        first = FakeBullet(0, 100, 100, 0)
+        still = FakeBullet(60, 100, 0, 0)
+        last = FakeBullet(200, 100, -150, 0)
+        resolve_bullet_collisions([last, still, first])
+        self.assertFalse(first.alive())
+        self.assertFalse(still.alive())
+        self.assertTrue(last.alive())
+        self.assertEqual(last.owner_updates, 0)
+
+    def test_dead_bullets_are_left_out(self) -> None:
+        first = FakeBullet(0, 100, 200, 0)
+        second = FakeBullet(150, 100, -200, 0)
+        second.is_alive = False
+        resolve_bullet_collisions([first, second])
+        self.assertTrue(first.alive())
+
+
+class BulletGameTest(unittest.TestCase):
+    """
+    Runs real bullets in a headless game, on an otherwise empty map.
+    """
+
+    def setUp(self) -> None:
+        from headless import HeadlessMain
+
+        random.seed(1)
+        self.simulation = HeadlessMain()
+        self.game = self.simulation.game
+        self.simulation.step(200)
+
+        for tile in list(self.game.groups['impassable_tiles']):
+            tile.kill()
+        for tank in list(self.game.groups['all_tanks']):
+            if tank.is_enemy:
+                self.game.updates.unregister(tank)
+                tank.kill()
+
+        self.player = self.game.player_1
+        self.player.bullet_limit = 5
+        self.player.bullet_sum = 0
+
+    def shoot(self, position: tuple, direction: gc.Direction):
+        self.player.bullet_sum += 1
+        return self.game.pools['bullets'].acquire(
+            self.player,
+            position,
+            direction
+        )
+
+    def test_fast_head_on_bullets_collide(self) -> None:
+        x = gc.SCREEN_BORDER_LEFT
+        y = gc.SCREEN_BORDER_TOP + 6 * gc.IMAGE_SIZE
+        first = self.shoot((x + 100, y), gc.Direction.RIGHT)
+        second = self.shoot((x + 220, y), gc.Direction.LEFT)
+        first.speed = second.speed = 150
+        self.game._update_bullets()
+        self.assertFalse(first.alive())
+        self.assertFalse(second.alive())
+        self.assertEqual(self.player.bullet_sum, 0)
+
+    def test_tile_destroyed_earlier_in_the_tick_is_not_hit(self) -> None:
+        from tile import BrickTile
+
+        brick = BrickTile(
+            (
+                gc.SCREEN_BORDER_LEFT + 6 * gc.GRID_CELL_SIZE * 2,
+                gc.SCREEN_BORDER_TOP + 10 * gc.GRID_CELL_SIZE * 2
+            ),
+            self.game.groups['destructable_tiles'],
+            self.game.assets.brick_tiles,
+            self.game.tile_grid
+        )
+        self.game.groups['impassable_tiles'].add(brick)
+
+        # Both bullets reach the brick on the same tick. The first one
+        # (power 2) destroys it, so the second one must fly on
+        self.player.power = 2
+        x = brick.rect.centerx
+        first = self.shoot((x, brick.rect.bottom + 20), gc.Direction.UP)
+        second = self.shoot((x, brick.rect.top - 20), gc.Direction.DOWN)
+        second.power = 1
+        top = second.rect.top
+
+        self.game._update_bullets()
+        self.assertFalse(brick.alive())
+        self.assertFalse(first.alive())
+        self.assertTrue(second.alive())
+        self.assertEqual(second.rect.top, top + second.speed)
+        self.assertEqual(second.obstacles_hit, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests for the binary level packs, and for playing the levels from one.
+
+Run with: python -m unittest (or pytest), no display needed.
+"""
+
+
+import os
+import tempfile
+import unittest
+
+import game_config as gc
+import level_pack
+from level_pack import LevelPack
+from levels import LevelData
+
+
+class LevelPackTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'levels.pack')
+        self.levels = [
+            level_pack.read_csv_level(path)
+            for path in level_pack.get_csv_level_paths('levels')
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_pack_and_unpack_give_the_same_levels(self) -> None:
+        count = level_pack.pack_csv_directory('levels', self.path)
+        self.assertEqual(count, len(self.levels))
+
+        csv_directory = os.path.join(self.directory.name, 'csv')
+        level_pack.unpack_to_csv_directory(self.path, csv_directory)
+        unpacked = [
+            level_pack.read_csv_level(path)
+            for path in level_pack.get_csv_level_paths(csv_directory)
+        ]
+        self.assertEqual(unpacked, self.levels)
+
+        with LevelPack(self.path) as pack:
+            self.assertEqual(
+                [pack.get_level(index) for index in range(len(pack))],
+                self.levels
+            )
+
+    def test_identical_levels_are_stored_once(self) -> None:
+        level_pack.write_level_pack(self.path, [self.levels[0]] * 3)
+        with LevelPack(self.path) as pack:
+            self.assertEqual(len(pack), 3)
+            self.assertEqual(pack.get_level(2), self.levels[0])
+        self.assertEqual(
+            os.path.getsize(self.path),
+            level_pack.HEADER.size + 3 * level_pack.INDEX_ENTRY.size +
+            level_pack.LEVEL_BYTES
+        )
+
+    def test_corrupted_levels_are_rejected(self) -> None:
+        level_pack.write_level_pack(self.path, self.levels[:2])
+        with open(self.path, 'r+b') as file:
+            file.seek(-1, os.SEEK_END)
+            file.write(bytes([len(gc.LEVEL_PACK_TILE_IDS) - 1]))
+        with LevelPack(self.path) as pack:
+            self.assertEqual(pack.get_level(0), self.levels[0])
+            with self.assertRaises(ValueError):
+                pack.get_level(1)
+            with self.assertRaises(IndexError):
+                pack.get_level(2)
+
+    def test_other_files_are_rejected(self) -> None:
+        with open(self.path, 'wb') as file:
+            file.write(b'not a level pack')
+        with self.assertRaises(ValueError):
+            LevelPack(self.path)
+
+    def test_bad_tiles_raise_value_error(self) -> None:
+        size = level_pack.LEVEL_BYTES
+        for data in (b'\x00' * (size - 1), b'\xff' * size, b'\x7f' * size):
+            with self.assertRaises(ValueError):
+                level_pack.decode_level(data)
+
+        level = [list(row) for row in self.levels[0]]
+        level[3][5] = 42
+        with self.assertRaisesRegex(ValueError, 'row 3, column 5'):
+            level_pack.encode_level(level, 'test')
+        with self.assertRaises(ValueError):
+            level_pack.encode_level(level[:-2])
+
+    def test_level_data_reads_a_pack(self) -> None:
+        level_pack.pack_csv_directory('levels', self.path)
+        packed = LevelData(self.path)
+        csv = LevelData('levels')
+        self.assertEqual(len(packed), len(csv))
+        for index in range(len(csv)):
+            self.assertEqual(packed.get_level(index), csv.get_level(index))
+        packed.pack.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the object pools.
+
+Run with: python -m unittest (or pytest), no display needed.
+"""
+
+
+import unittest
+
+from pools import ObjectPool
+
+
+class Item:
+    """
+    Stands in for a pooled sprite, remembering how it was reset.
+    """
+
+    def __init__(self, pool: ObjectPool) -> None:
+        self.pool = pool
+        self.args: tuple = ()
+        self.kwargs: dict = {}
+
+    def reset(self, *args, **kwargs) -> None:
+        self.args = args
+        self.kwargs = kwargs
+
+
+class ObjectPoolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.pool = ObjectPool(Item)
+
+    def test_objects_are_reset_on_acquire(self) -> None:
+        item = self.pool.acquire(1, 2, speed=3)
+        self.assertIs(item.pool, self.pool)
+        self.assertEqual(item.args, (1, 2))
+        self.assertEqual(item.kwargs, {'speed': 3})
+
+    def test_released_objects_are_reused(self) -> None:
+        first = self.pool.acquire()
+        second = self.pool.acquire()
+        self.assertIsNot(first, second)
+        self.pool.release(first)
+        self.assertIs(self.pool.acquire('again'), first)
+        self.assertEqual(first.args, ('again',))
+        self.assertEqual(
+            self.pool.get_stats(),
+            {'created': 2, 'reused': 1, 'in_use': 2, 'free': 0}
+        )
+
+    def test_releasing_twice_hands_out_once(self) -> None:
+        item = self.pool.acquire()
+        self.pool.release(item)
+        self.pool.release(item)
+        self.assertIs(self.pool.acquire(), item)
+        self.assertIsNot(self.pool.acquire(), item)
+        self.assertEqual(self.pool.released, 1)
+
+    def test_objects_from_elsewhere_are_ignored(self) -> None:
+        self.pool.release(Item(self.pool))
+        self.assertEqual(self.pool.get_stats()['free'], 0)
+
+    def test_release_all(self) -> None:
+        items = {self.pool.acquire() for _ in range(3)}
+        self.pool.release_all()
+        self.assertEqual(
+            self.pool.get_stats(),
+            {'created': 3, 'reused': 0, 'in_use': 0, 'free': 3}
+        )
+        self.assertEqual({self.pool.acquire() for _ in range(3)}, items)
+        self.assertEqual(self.pool.get_stats()['created'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
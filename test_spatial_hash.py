@@ -0,0 +1,54 @@
+"""
+Tests for the spatial hash sprite group.
+
+Run with: python -m unittest (or pytest), no display needed.
+"""
+
+
+import unittest
+
+import pygame
+from pygame.rect import Rect
+
+from spatial_hash import SpatialHashGroup
+
+
+class Box(pygame.sprite.Sprite):
+
+    def __init__(self, x: int, y: int) -> None:
+        super().__init__()
+        self.rect = Rect(x, y, 10, 10)
+
+
+class SpatialHashGroupTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.group = SpatialHashGroup(cell_size=64)
+        self.boxes = [Box(8 * i, 8) for i in range(4)]
+        self.group.add(*self.boxes)
+
+    def test_candidates_keep_the_group_order_after_moving(self) -> None:
+        # Moving the first box out and back rehashes it after the others
+        first = self.boxes[0]
+        first.rect.x = 200
+        self.group.refresh(first)
+        first.rect.x = 0
+        self.group.refresh(first)
+
+        one_cell = Rect(0, 0, 40, 40)
+        two_cells = Rect(0, 0, 100, 40)
+        self.assertEqual(self.group.get_candidates(one_cell), self.boxes)
+        self.assertEqual(self.group.get_candidates(two_cells), self.boxes)
+        self.assertEqual(self.group.spritecollide(first), self.boxes[:2])
+
+    def test_removed_sprites_are_unhashed(self) -> None:
+        self.boxes[1].kill()
+        self.assertEqual(
+            self.group.get_candidates(Rect(0, 0, 64, 64)),
+            [self.boxes[0], self.boxes[2], self.boxes[3]]
+        )
+        self.assertEqual(self.group.rectcollideany(Rect(12, 12, 1, 1)), None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Tests for the tile occupancy grid, and the sweeps along it.
+
+Run with: python -m unittest (or pytest), no display needed.
+"""
+
+
+import unittest
+
+from pygame.rect import Rect
+
+import game_config as gc
+from tile_grid import TileGrid
+
+
+CELL = gc.GRID_CELL_SIZE
+LEFT = gc.SCREEN_BORDER_LEFT
+TOP = gc.SCREEN_BORDER_TOP
+
+
+class Tile:
+    """
+    Stands in for a map tile: just a rectangle and a grid type code.
+    """
+
+    def __init__(self, col: int, row: int, code: int, cells: int = 2):
+        self.rect = Rect(
+            LEFT + col * CELL,
+            TOP + row * CELL,
+            cells * CELL,
+            cells * CELL
+        )
+        self.grid_code = code
+
+
+def cell_rect(col: int, row: int, cols: int = 1, rows: int = 1) -> Rect:
+    return Rect(LEFT + col * CELL, TOP + row * CELL, cols * CELL, rows * CELL)
+
+
+class TileGridTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.grid = TileGrid()
+
+    def add(self, col: int, row: int, code: int, cells: int = 2) -> Tile:
+        tile = Tile(col, row, code, cells)
+        self.grid.add_tile(tile)
+        return tile
+
+    def test_tiles_mark_and_clear_their_cells(self) -> None:
+        brick = self.add(4, 6, gc.GRID_BRICK)
+        revision = self.grid.revision
+        self.assertIs(self.grid.get_first_tile(cell_rect(5, 7)), brick)
+        self.assertIsNone(self.grid.get_first_tile(cell_rect(6, 7)))
+
+        self.grid.remove_tile(brick)
+        self.assertIsNone(self.grid.get_first_tile(cell_rect(4, 6, 2, 2)))
+        self.assertGreater(self.grid.revision, revision)
+        self.assertEqual(self.grid.changed_rects, [brick.rect, brick.rect])
+
+        # Removing it twice changes nothing
+        revision = self.grid.revision
+        self.grid.remove_tile(brick)
+        self.assertEqual(self.grid.revision, revision)
+
+    def test_reshaped_tiles_keep_only_their_new_cells(self) -> None:
+        brick = self.add(4, 6, gc.GRID_BRICK)
+        self.grid.remove_tile(brick)
+        brick.rect.height = CELL  # top half left after a hit from below
+        self.grid.add_tile(brick)
+        self.assertIs(self.grid.get_first_tile(cell_rect(4, 6)), brick)
+        self.assertIsNone(self.grid.get_first_tile(cell_rect(4, 7)))
+
+    def test_blocking_rect_joins_the_blocking_tiles_only(self) -> None:
+        self.add(0, 0, gc.GRID_BRICK)
+        self.add(2, 0, gc.GRID_STEEL)
+        self.add(4, 0, gc.GRID_WATER)
+        area = cell_rect(1, 0, 4, 1)
+
+        self.assertEqual(
+            self.grid.get_blocking_rect(area, (gc.GRID_BRICK, gc.GRID_STEEL)),
+            cell_rect(0, 0, 4, 2)
+        )
+        self.assertEqual(
+            self.grid.get_blocking_rect(area, (gc.GRID_WATER,)),
+            cell_rect(4, 0, 2, 2)
+        )
+        self.assertIsNone(
+            self.grid.get_blocking_rect(cell_rect(8, 8), (gc.GRID_BRICK,))
+        )
+
+    def test_rects_off_the_grid_are_clipped(self) -> None:
+        corner = self.add(0, 0, gc.GRID_STEEL)
+        outside = Rect(LEFT - 3 * CELL, TOP - 3 * CELL, 4 * CELL, 4 * CELL)
+        self.assertIs(self.grid.get_first_tile(outside), corner)
+        self.assertEqual(
+            self.grid.get_tiles(outside, (gc.GRID_STEEL,)),
+            [corner]
+        )
+
+    def test_clear_empties_the_grid(self) -> None:
+        self.add(3, 3, gc.GRID_BRICK)
+        self.grid.clear()
+        self.assertIsNone(self.grid.get_first_tile(cell_rect(3, 3)))
+        self.assertEqual(self.grid.changed_rects, [])
+
+
+class TileGridSweepTest(unittest.TestCase):
+
+    hit_codes = (gc.GRID_BRICK, gc.GRID_STEEL)
+
+    def setUp(self) -> None:
+        self.grid = TileGrid()
+        # A bullet sized box, two cells wide, on the left edge
+        self.box = cell_rect(0, 4, 2, 2)
+
+    def add(self, col: int, row: int, code: int) -> Tile:
+        tile = Tile(col, row, code)
+        self.grid.add_tile(tile)
+        return tile
+
+    def sweep(self, dx: int, dy: int, distance: float) -> tuple:
+        return self.grid.sweep(self.box, dx, dy, distance, self.hit_codes)
+
+    def test_stops_where_the_first_tile_is_touched(self) -> None:
+        brick = self.add(10, 4, gc.GRID_BRICK)
+        self.assertEqual(self.sweep(1, 0, 5 * CELL), (5 * CELL, []))
+        # Just touching is not a hit yet
+        self.assertEqual(self.sweep(1, 0, 8 * CELL), (8 * CELL, []))
+        self.assertEqual(self.sweep(1, 0, 8 * CELL + 1), (8 * CELL, [brick]))
+
+    def test_never_tunnels_through_at_high_speed(self) -> None:
+        steel = self.add(10, 4, gc.GRID_STEEL)
+        self.add(20, 4, gc.GRID_BRICK)
+        self.assertEqual(self.sweep(1, 0, 10_000), (8 * CELL, [steel]))
+
+    def test_sweeps_every_direction(self) -> None:
+        self.box = cell_rect(10, 10, 2, 2)
+        left = self.add(4, 10, gc.GRID_BRICK)
+        right = self.add(16, 10, gc.GRID_BRICK)
+        up = self.add(10, 2, gc.GRID_BRICK)
+        down = self.add(10, 20, gc.GRID_BRICK)
+        self.assertEqual(self.sweep(-1, 0, 1_000), (4 * CELL, [left]))
+        self.assertEqual(self.sweep(1, 0, 1_000), (4 * CELL, [right]))
+        self.assertEqual(self.sweep(0, -1, 1_000), (6 * CELL, [up]))
+        self.assertEqual(self.sweep(0, 1, 1_000), (8 * CELL, [down]))
+
+    def test_finds_every_tile_across_the_line_hit(self) -> None:
+        top = self.add(6, 3, gc.GRID_BRICK)
+        bottom = self.add(6, 5, gc.GRID_STEEL)
+        self.add(9, 4, gc.GRID_BRICK)
+        self.assertEqual(self.sweep(1, 0, 1_000), (4 * CELL, [top, bottom]))
+
+    def test_passes_over_other_tiles(self) -> None:
+        self.add(6, 4, gc.GRID_WATER)
+        brick = self.add(12, 4, gc.GRID_BRICK)
+        self.assertEqual(self.sweep(1, 0, 1_000), (10 * CELL, [brick]))
+
+    def test_tiles_already_overlapped_are_hit_at_once(self) -> None:
+        brick = self.add(1, 4, gc.GRID_BRICK)
+        self.assertEqual(self.sweep(1, 0, 3 * CELL), (0, [brick]))
+
+    def test_runs_off_the_grid_without_a_hit(self) -> None:
+        self.assertEqual(self.sweep(-1, 0, 1_000), (1_000, []))
+        self.assertEqual(self.sweep(0, 1, 1_000), (1_000, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Tests for the timer wheel, and for its use by the game across stages.
+
+Run with: python -m unittest (or pytest), no display needed.
+"""
+
+
+import os
+import random
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from timer_wheel import TimerWheel  # noqa: E402
+
+
+class FakeClock:
+    """
+    Stands in for the game clock, moved forward by hand.
+    """
+
+    def __init__(self) -> None:
+        self.ticks: int = 0
+
+    def get_ticks(self) -> int:
+        return self.ticks
+
+
+class TimerWheelTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.wheel = TimerWheel(self.clock)
+        self.fired: list = []
+
+    def advance(self, milliseconds: int) -> None:
+        self.clock.ticks += milliseconds
+        self.wheel.update()
+
+    def test_fires_once_the_deadline_is_reached(self) -> None:
+        self.wheel.schedule(100, self.fired.append, 'a')
+        self.advance(99)
+        self.assertEqual(self.fired, [])
+        self.advance(1)
+        self.assertEqual(self.fired, ['a'])
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_fires_in_deadline_order(self) -> None:
+        delays = [5, 70, 64, 4096, 4095, 1, 300_000, 63]
+        for delay in delays:
+            self.wheel.schedule(delay, self.fired.append, delay)
+        self.advance(300_000)
+        self.assertEqual(self.fired, sorted(delays))
+
+    def test_cascades_down_the_levels(self) -> None:
+        # A level 2 deadline, reached in small steps across slot edges
+        self.wheel.schedule(5_000, self.fired.append, 'a')
+        for _ in range(4_999 // 7):
+            self.advance(7)
+        self.assertEqual(self.fired, [])
+        self.advance(5_000 - self.clock.ticks)
+        self.assertEqual(self.fired, ['a'])
+        self.assertGreater(self.wheel.cascaded, 0)
+
+    def test_keeps_deadlines_past_the_top_level_aside(self) -> None:
+        delay = self.wheel.span + 1_234
+        self.wheel.schedule(delay, self.fired.append, 'a')
+        self.assertEqual(len(self.wheel.overflow), 1)
+        self.advance(delay - 1)
+        self.assertEqual(self.fired, [])
+        self.advance(1)
+        self.assertEqual(self.fired, ['a'])
+
+    def test_fires_overdue_timers_at_once(self) -> None:
+        self.advance(10)
+        self.wheel.schedule(-5, self.fired.append, 'a')
+        self.advance(1)
+        self.assertEqual(self.fired, ['a'])
+
+    def test_cancelled_timers_never_fire(self) -> None:
+        timer = self.wheel.schedule(100, self.fired.append, 'a')
+        self.wheel.schedule(100, self.fired.append, 'b')
+        timer.cancel()
+        timer.cancel()  # twice does nothing
+        self.assertFalse(timer.is_pending)
+        self.assertEqual(len(self.wheel), 1)
+        self.advance(100)
+        self.assertEqual(self.fired, ['b'])
+        timer.cancel()  # after the wheel got there
+        self.assertEqual(len(self.wheel), 0)
+
+    def test_clear_cancels_every_timer(self) -> None:
+        timers = [
+            self.wheel.schedule(delay, self.fired.append, delay)
+            for delay in (1, 100, 10_000, self.wheel.span + 1)
+        ]
+        self.wheel.clear()
+        self.assertEqual(len(self.wheel), 0)
+        self.assertFalse(any(timer.is_pending for timer in timers))
+        self.advance(self.wheel.span * 2)
+        self.assertEqual(self.fired, [])
+        self.assertEqual(self.wheel.get_stats()['scheduled'], 4)
+
+    def test_matches_a_sorted_list(self) -> None:
+        rng = random.Random(1)
+        expected: list = []
+        for _ in range(2_000):
+            if rng.random() < 0.6:
+                deadline = self.clock.ticks + rng.randint(1, 20_000)
+                timer = self.wheel.schedule(
+                    deadline - self.clock.ticks,
+                    self.fired.append,
+                    deadline
+                )
+                if rng.random() < 0.2:
+                    timer.cancel()
+                else:
+                    expected.append(deadline)
+            self.advance(rng.randint(0, 50))
+        self.advance(20_000)
+        self.assertEqual(self.fired, sorted(expected))
+
+
+class GameTimersTest(unittest.TestCase):
+
+    def test_new_stage_cancels_the_pending_timers(self) -> None:
+        from headless import HeadlessMain
+        from power_ups import PowerUp
+
+        random.seed(1)
+        simulation = HeadlessMain()
+        game = simulation.game
+        simulation.step(1_500)
+        enemies = [
+            tank for tank in game.groups['all_tanks'] if tank.is_enemy
+        ]
+        self.assertTrue(enemies)
+        game.player_1.paralyze_tank(60_000)
+        PowerUp(game, game.assets, game.groups).fortify_base()
+        fired: list = []
+        game.timers.schedule(100, fired.append, 'old')
+
+        game.change_level(game.player_1_score, game.player_2_score)
+        self.assertEqual(len(game.timers), 0)
+        self.assertFalse(game.player_1.is_paralyzed)
+        self.assertFalse(game.is_base_fortified)
+        self.assertFalse(
+            any(tank.shot_timer.is_pending for tank in enemies)
+        )
+
+        simulation.step(600)
+        self.assertEqual(fired, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,21 +1,46 @@
-import pygame
 from pygame.surface import Surface
 from pygame.sprite import Sprite, Group
 
-# import game_config as gc
+import game_config as gc
+from tile_grid import TileGrid
 
 
 class TileType(Sprite):
+    """
+    Base class for all the map tiles.
+
+    NOTE: Tiles are by far the most numerous sprites on the screen, so
+    their attributes are kept in slots, and the data shared by every
+    tile of a kind (its name and grid code) lives in the class.
+    """
+
+    __slots__ = (
+        'group',
+        'tile_grid',
+        'images',
+        'image',
+        'rect',
+        'pos_x',
+        'pos_y',
+        'width',
+        'height'
+    )
+
+    # Tile name and type code for the tile occupancy grid
+    name: str = ''
+    grid_code: int = gc.GRID_EMPTY
 
     def __init__(
             self,
             pos: tuple[int, int],
             group: Group,
-            map_tiles: dict[str, Surface]
+            map_tiles: dict[str, Surface],
+            tile_grid: TileGrid | None = None
             ) -> None:
         super().__init__(group)
 
         self.group: Group = group
+        self.tile_grid: TileGrid | None = tile_grid
 
         self.images: dict[str, Surface] = map_tiles
         self.image: Surface
@@ -29,9 +54,18 @@ class TileType(Sprite):
     def draw(self, window: Surface) -> None:
         window.blit(self.image, self.rect)
 
+    def kill(self) -> None:
+        if self.tile_grid:
+            self.tile_grid.remove_tile(self)
+        super().kill()
+
     def _get_rect_and_size(self, position: tuple[int, int]) -> None:
         self.rect = self.image.get_rect(topleft=position)
         self.width, self.height = self.image.get_size()
+        # Keep the occupancy grid in sync with the new tile shape
+        if self.tile_grid:
+            self.tile_grid.remove_tile(self)
+            self.tile_grid.add_tile(self)
 
     def handle_bullet_hit(self, bullet):
         pass
@@ -39,10 +73,14 @@ class TileType(Sprite):
 
 class BrickTile(TileType):
 
-    def __init__(self, pos, group, map_tiles) -> None:
-        super().__init__(pos, group, map_tiles)
+    __slots__ = ('health',)
+
+    name: str = 'Brick'
+    grid_code: int = gc.GRID_BRICK
+
+    def __init__(self, pos, group, map_tiles, tile_grid=None) -> None:
+        super().__init__(pos, group, map_tiles, tile_grid)
 
-        self.name: str = 'Brick'
         self.health: int = 2
 
         self.image: Surface = self.images['small']
@@ -50,7 +88,7 @@ class BrickTile(TileType):
 
     def handle_bullet_hit(self, bullet):
         bullet.update_owner()
-        bullet.kill()
+        bullet.release()
 
         self.health -= 1
         if bullet.power > 1 or self.health <= 0:
@@ -63,22 +101,22 @@ class BrickTile(TileType):
         Utility method for the handle_bullet_hit() one, in order to
         make the code a little more readable.
         """
-        if bullet.direction == 'Left':
+        if bullet.direction == gc.Direction.LEFT:
             self.image = self.images['small_left']
             self._get_rect_and_size(
                 (self.pos_x, self.pos_y)
             )
-        elif bullet.direction == 'Right':
+        elif bullet.direction == gc.Direction.RIGHT:
             self.image = self.images['small_right']
             self._get_rect_and_size(
                 (self.pos_x + self.width // 2, self.pos_y)
             )
-        elif bullet.direction == 'Up':
+        elif bullet.direction == gc.Direction.UP:
             self.image = self.images['small_top']
             self._get_rect_and_size(
                 (self.pos_x, self.pos_y)
             )
-        elif bullet.direction == 'Down':
+        elif bullet.direction == gc.Direction.DOWN:
             self.image = self.images['small_bottom']
             self._get_rect_and_size(
                 (self.pos_x, self.pos_y + self.height // 2)
@@ -87,59 +125,72 @@ class BrickTile(TileType):
 
 class SteelTile(TileType):
 
-    def __init__(self, pos, group, map_tiles) -> None:
-        super().__init__(pos, group, map_tiles)
+    __slots__ = ()
 
-        self.name: str = 'Steel'
+    name: str = 'Steel'
+    grid_code: int = gc.GRID_STEEL
+
+    def __init__(self, pos, group, map_tiles, tile_grid=None) -> None:
+        super().__init__(pos, group, map_tiles, tile_grid)
 
         self.image: Surface = self.images['small']
         self._get_rect_and_size(position=(self.pos_x, self.pos_y))
 
     def handle_bullet_hit(self, bullet):
         bullet.update_owner()
-        bullet.kill()
+        bullet.release()
         if bullet.power > 2:
             self.kill()
 
 
 class ForestTile(TileType):
 
+    __slots__ = ()
+
+    name: str = 'Forest'
+
     def __init__(self, pos, group, map_tiles) -> None:
         super().__init__(pos, group, map_tiles)
 
-        self.name: str = 'Forest'
-
         self.image: Surface = self.images['small']
         self._get_rect_and_size(position=(self.pos_x, self.pos_y))
 
 
 class IceTile(ForestTile):
 
+    __slots__ = ()
+
+    name: str = 'Ice'
+
     def __init__(self, pos, group, map_tiles) -> None:
         super().__init__(pos, group, map_tiles)
 
-        self.name: str = 'Ice'
-
         self.image: Surface = self.images['small']
         self._get_rect_and_size(position=(self.pos_x, self.pos_y))
 
 
 class WaterTile(TileType):
+    """
+    NOTE: Water tiles don't keep an animation timer of their own, their
+    image is always the current frame of the shared water animation
+    track (see AnimationClock).
+    """
 
-    def __init__(self, pos, group, map_tiles) -> None:
-        super().__init__(pos, group, map_tiles)
+    __slots__ = ('track', 'frames')
 
-        self.name: str = 'Water'
+    name: str = 'Water'
+    grid_code: int = gc.GRID_WATER
 
-        self.image: Surface = self.images['small_1']
-        self._get_rect_and_size(position=(self.pos_x, self.pos_y))
+    def __init__(self, pos, group, map_tiles, track, tile_grid=None) -> None:
+        super().__init__(pos, group, map_tiles, tile_grid)
 
-        # For water animation
-        self.frame_index: int = 0
-        self.timer: int = pygame.time.get_ticks()
+        self.track = track
+        self.frames: tuple[Surface, ...] = (
+            self.images['small_1'],
+            self.images['small_2']
+        )
+        self._get_rect_and_size(position=(self.pos_x, self.pos_y))
 
-    def update(self):
-        if pygame.time.get_ticks() - self.timer >= 500:
-            self.frame_index = 1 if self.frame_index == 0 else 0
-            self.timer: int = pygame.time.get_ticks()  # reset timer
-            self.image = self.images[f'small_{self.frame_index + 1}']
+    @property
+    def image(self) -> Surface:
+        return self.frames[self.track.frame]
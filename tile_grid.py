@@ -0,0 +1,243 @@
+from pygame.rect import Rect
+
+import game_config as gc
+
+
+class TileGrid:
+    """
+    Represents the occupancy of the game screen by the impassable tiles
+    (bricks, steel and water).
+
+    The game screen is divided in cells of a quarter of a map tile, so
+    even a brick tile that has been reshaped by a bullet hit fits the
+    grid exactly. Each cell stores a type code (see gc.GRID_*) and a
+    reference to the tile object sitting there.
+
+    NOTE: Tiles keep the grid in sync by themselves: they're added when
+    created, re-added when reshaped and removed when killed. Thus, any
+    collision check against the grid only visits the cells touched by
+    the given rectangle, no matter how many tiles there are on the map.
+
+    The rectangles of the tiles added or removed are also collected in
+    changed_rects, so the renderer knows which parts of the map must be
+    repainted. Whoever reads them must clear the list afterwards. Every
+    change also bumps the grid revision, so anything that has looked the
+    grid up can tell whether it's still the same.
+    """
+
+    def __init__(self) -> None:
+        self.cols: int = gc.GRID_COLS
+        self.rows: int = gc.GRID_ROWS
+        self.cell_size: int = gc.GRID_CELL_SIZE
+        self.offset_x: int = gc.SCREEN_BORDER_LEFT
+        self.offset_y: int = gc.SCREEN_BORDER_TOP
+
+        self.cells: bytearray = bytearray(self.cols * self.rows)
+        self.tiles: list = [None] * (self.cols * self.rows)
+        self.tile_rects: dict = {}
+        self.changed_rects: list[Rect] = []
+        self.revision: int = 0
+
+    def clear(self) -> None:
+        """
+        Empties the whole grid, e.g. before loading a new stage.
+        """
+        self.cells[:] = bytes(len(self.cells))
+        self.tiles = [None] * (self.cols * self.rows)
+        self.tile_rects.clear()
+        self.changed_rects.clear()
+        self.revision += 1
+
+    def restore(self, cells: bytes, tiles: list) -> None:
+        """
+        Replaces the whole grid with the given cell type codes and the
+        tile sitting on each cell (see StagePrototype).
+        """
+        self.cells[:] = cells
+        self.tiles = tiles
+        self.tile_rects = {
+            tile: Rect(tile.rect) for tile in tiles if tile is not None
+        }
+        self.changed_rects.clear()
+        self.revision += 1
+
+    def add_tile(self, tile) -> None:
+        """
+        Marks the cells covered by the tile rectangle with its type.
+        """
+        self.tile_rects[tile] = Rect(tile.rect)
+        self.changed_rects.append(self.tile_rects[tile])
+        self.revision += 1
+        code: int = tile.grid_code
+        col_start, row_start, col_end, row_end = self.get_cell_range(
+            tile.rect
+        )
+        for row in range(row_start, row_end):
+            for index in range(row * self.cols + col_start,
+                               row * self.cols + col_end):
+                self.cells[index] = code
+                self.tiles[index] = tile
+
+    def remove_tile(self, tile) -> None:
+        """
+        Clears the cells previously marked by the given tile, if any.
+        """
+        rect = self.tile_rects.pop(tile, None)
+        if not rect:
+            return
+        self.changed_rects.append(rect)
+        self.revision += 1
+        col_start, row_start, col_end, row_end = self.get_cell_range(rect)
+        for row in range(row_start, row_end):
+            for index in range(row * self.cols + col_start,
+                               row * self.cols + col_end):
+                if self.tiles[index] is tile:
+                    self.cells[index] = gc.GRID_EMPTY
+                    self.tiles[index] = None
+
+    def get_cell_range(self, rect: Rect) -> tuple[int, int, int, int]:
+        """
+        Returns the first column and row, and the last column and row
+        (both exclusive), of the cells overlapped by the given rectangle.
+        The range is clipped to the grid.
+        """
+        size = self.cell_size
+        col_start = max((rect.left - self.offset_x) // size, 0)
+        row_start = max((rect.top - self.offset_y) // size, 0)
+        col_end = min((rect.right - self.offset_x - 1) // size + 1, self.cols)
+        row_end = min((rect.bottom - self.offset_y - 1) // size + 1, self.rows)
+        return col_start, row_start, col_end, row_end
+
+    def get_tiles(self, rect: Rect, codes: tuple[int, ...]) -> list:
+        """
+        Returns the tiles overlapped by the given rectangle whose type is
+        one of the given codes, row by row.
+        """
+        col_start, row_start, col_end, row_end = self.get_cell_range(rect)
+        tiles: list = []
+
+        for row in range(row_start, row_end):
+            base = row * self.cols
+            for index in range(base + col_start, base + col_end):
+                if self.cells[index] not in codes:
+                    continue
+                tile = self.tiles[index]
+                if tile not in tiles:
+                    tiles.append(tile)
+
+        return tiles
+
+    def get_first_tile(self, rect: Rect):
+        """
+        Returns the first tile (row by row) overlapped by the given
+        rectangle, or None if there's none.
+        """
+        col_start, row_start, col_end, row_end = self.get_cell_range(rect)
+
+        for row in range(row_start, row_end):
+            base = row * self.cols
+            for index in range(base + col_start, base + col_end):
+                if self.cells[index] != gc.GRID_EMPTY:
+                    return self.tiles[index]
+
+        return None
+
+    def get_blocking_rect(
+            self,
+            rect: Rect,
+            blocking_codes: tuple[int, ...]
+            ) -> Rect | None:
+        """
+        Returns the bounding rectangle of all the tiles overlapped by the
+        given rectangle whose type is one of the blocking codes, or None
+        if there are no such tiles.
+        """
+        col_start, row_start, col_end, row_end = self.get_cell_range(rect)
+        blocking_rect = None
+
+        for row in range(row_start, row_end):
+            base = row * self.cols
+            for index in range(base + col_start, base + col_end):
+                if self.cells[index] not in blocking_codes:
+                    continue
+                tile_rect = self.tile_rects[self.tiles[index]]
+                if not blocking_rect:
+                    blocking_rect = Rect(tile_rect)
+                else:
+                    blocking_rect.union_ip(tile_rect)
+
+        return blocking_rect
+
+    def sweep(
+            self,
+            rect: Rect,
+            dx: int,
+            dy: int,
+            distance: float,
+            hit_codes: tuple[int, ...]
+            ) -> tuple[float, list]:
+        """
+        Walks the grid cell by cell (a DDA traversal, which along a
+        single axis is just a line of cells at a time) from the given
+        rectangle towards the (dx, dy) direction, up to the given
+        distance.
+
+        Returns the distance travelled until the rectangle touches the
+        first line of cells holding any of the hit codes, and the tiles
+        found across that line. If nothing is hit, the full distance and
+        an empty list are returned.
+
+        NOTE: Only axis-aligned directions are supported (either dx or
+        dy is zero), which is all the tanks and bullets ever need.
+        """
+        size = self.cell_size
+        col_start, row_start, col_end, row_end = self.get_cell_range(rect)
+
+        if dy:
+            # Lines are rows, and the cross-section are the columns
+            cross_start, cross_end, count = col_start, col_end, self.rows
+            if dy < 0:
+                edge = rect.top - self.offset_y
+                first = (rect.bottom - self.offset_y - 1) // size
+                last = int((edge - distance) // size)
+            else:
+                edge = rect.bottom - self.offset_y
+                first = (rect.top - self.offset_y) // size
+                last = int((edge + distance - 1) // size)
+            step = dy
+        else:
+            # Lines are columns, and the cross-section are the rows
+            cross_start, cross_end, count = row_start, row_end, self.cols
+            if dx < 0:
+                edge = rect.left - self.offset_x
+                first = (rect.right - self.offset_x - 1) // size
+                last = int((edge - distance) // size)
+            else:
+                edge = rect.right - self.offset_x
+                first = (rect.left - self.offset_x) // size
+                last = int((edge + distance - 1) // size)
+            step = dx
+
+        for line in range(first, last + step, step):
+            if not 0 <= line < count:
+                continue
+
+            tiles: list = []
+            for cross in range(cross_start, cross_end):
+                index = (
+                    line * self.cols + cross if dy
+                    else cross * self.cols + line
+                )
+                if self.cells[index] in hit_codes:
+                    tile = self.tiles[index]
+                    if tile not in tiles:
+                        tiles.append(tile)
+
+            if tiles:
+                if step < 0:
+                    travel = edge - (line + 1) * size
+                else:
+                    travel = line * size - edge
+                return max(travel, 0), tiles
+
+        return distance, []
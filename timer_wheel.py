@@ -0,0 +1,243 @@
+from typing import Callable
+
+import game_config as gc
+
+
+class Timer:
+    """
+    A callback scheduled on the timer wheel, to be called once its
+    deadline (in game clock milliseconds) is reached.
+    """
+
+    __slots__ = ('deadline', 'callback', 'args', 'wheel')
+
+    def __init__(
+            self,
+            deadline: int,
+            callback: Callable,
+            args: tuple,
+            wheel
+            ) -> None:
+        self.deadline: int = deadline
+        self.callback: Callable | None = callback
+        self.args: tuple = args
+        self.wheel = wheel
+
+    @property
+    def is_pending(self) -> bool:
+        return self.callback is not None
+
+    def cancel(self) -> None:
+        """
+        Stops the timer from firing. Cancelling a timer which has already
+        fired (or been cancelled) does nothing.
+
+        NOTE: The timer stays in its wheel slot until the wheel gets
+        there, but its callback (and whatever it holds) is let go now.
+        """
+        if self.callback is None:
+            return
+        self.callback = None
+        self.args = ()
+        self.wheel.pending -= 1
+
+
+class TimerWheel:
+    """
+    A hierarchical timer wheel owned by the Game object, where the
+    gameplay subsystems schedule their callbacks (paralysis expiry,
+    power up expiry, score banner lifetime...) instead of comparing
+    get_ticks() deltas every tick.
+
+    Each level of the wheel has gc.TIMER_WHEEL_SLOTS slots, and each
+    slot of a level spans as many milliseconds as a whole turn of the
+    level below. A timer goes into the lowest level where its deadline
+    shares the higher digits with the current wheel time, and is moved
+    down a level (cascaded) when the wheel reaches its slot, until it
+    fires from the lowest one. Deadlines past the top level are kept
+    aside until the top level wraps around.
+
+    The wheel jumps straight to the next occupied slot, skipping the
+    empty ones, so advancing it costs about as much as the timers firing
+    (and cascading), whatever the number of timers pending.
+
+    NOTE: Sprites with timers cancel them on kill() (or release(), for
+    pooled ones). The sprites taken out of the game without being killed
+    (i.e. through Group.empty() on a new stage) don't, so the wheel is
+    cleared as a whole on every new stage instead (see clear).
+    """
+
+    def __init__(self, clock) -> None:
+        self.clock = clock
+
+        self.bits: int = gc.TIMER_WHEEL_SLOTS.bit_length() - 1
+        self.slot_mask: int = gc.TIMER_WHEEL_SLOTS - 1
+        self.levels: list[list[list[Timer]]] = [
+            [[] for _ in range(gc.TIMER_WHEEL_SLOTS)]
+            for _ in range(gc.TIMER_WHEEL_LEVELS)
+        ]
+        # Occupied slots of each level, as bit masks
+        self.occupied: list[int] = [0] * gc.TIMER_WHEEL_LEVELS
+        self.overflow: list[Timer] = []
+        self.span: int = 1 << (self.bits * gc.TIMER_WHEEL_LEVELS)
+
+        self.time: int = self.clock.get_ticks()
+        self.pending: int = 0
+
+        # Wheel statistics
+        self.scheduled: int = 0
+        self.fired: int = 0
+        self.cascaded: int = 0
+
+    def __len__(self) -> int:
+        return self.pending
+
+    def schedule(self, delay: int, callback: Callable, *args) -> Timer:
+        """
+        Calls back with the given arguments once the delay (in
+        milliseconds) has passed on the game clock, and returns the
+        timer, so it can be cancelled.
+        """
+        timer = Timer(
+            self.clock.get_ticks() + int(delay),
+            callback,
+            args,
+            self
+        )
+        self.pending += 1
+        self.scheduled += 1
+        self._insert(timer)
+        return timer
+
+    def update(self) -> None:
+        """
+        Moves the wheel up to the current game clock time, firing every
+        timer whose deadline has been reached, in deadline order.
+        """
+        target = self.clock.get_ticks()
+        while self.time < target:
+            time = self._get_next_time()
+            if time > target:
+                self.time = target
+                return
+            self.time = time
+
+            if time & self.slot_mask == 0:
+                self._cascade(time)
+            slot = time & self.slot_mask
+            if self.occupied[0] & (1 << slot):
+                self._fire(slot)
+
+    def clear(self) -> None:
+        """
+        Cancels every pending timer at once, keeping the statistics.
+        """
+        for level, slots in enumerate(self.levels):
+            occupied = self.occupied[level]
+            while occupied:
+                slot = (occupied & -occupied).bit_length() - 1
+                occupied &= occupied - 1
+                for timer in self._take(level, slot):
+                    timer.callback = None
+                    timer.args = ()
+        for timer in self.overflow:
+            timer.callback = None
+            timer.args = ()
+        self.overflow = []
+        self.pending = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Returns the number of timers pending, scheduled, fired and
+        cascaded down the wheel so far.
+        """
+        return {
+            'pending': self.pending,
+            'scheduled': self.scheduled,
+            'fired': self.fired,
+            'cascaded': self.cascaded
+        }
+
+    def _get_next_time(self) -> int:
+        """
+        Returns the time of the next occupied slot, looking at the rest
+        of the current turn of each level, from the lowest one up (or
+        else the time the top level wraps around).
+        """
+        for level, occupied in enumerate(self.occupied):
+            shift = self.bits * level
+            digit = (self.time >> shift) & self.slot_mask
+            ahead = occupied >> (digit + 1)
+            if ahead:
+                # Start of the slot, with the lower digits cleared
+                slot = digit + (ahead & -ahead).bit_length()
+                turn = self.time >> (shift + self.bits) << self.bits
+                return (turn + slot) << shift
+        return (self.time // self.span + 1) * self.span
+
+    def _insert(self, timer: Timer) -> None:
+        """
+        Puts the timer into the lowest level whose slot can hold it.
+        Overdue timers go into the very next slot.
+        """
+        deadline = max(timer.deadline, self.time + 1)
+        differing = deadline ^ self.time
+        if differing >= self.span:
+            self.overflow.append(timer)
+            return
+        level = (differing.bit_length() - 1) // self.bits
+        slot = (deadline >> (self.bits * level)) & self.slot_mask
+        self.levels[level][slot].append(timer)
+        self.occupied[level] |= 1 << slot
+
+    def _take(self, level: int, slot: int) -> list[Timer]:
+        timers = self.levels[level][slot]
+        self.levels[level][slot] = []
+        self.occupied[level] &= ~(1 << slot)
+        return timers
+
+    def _cascade(self, time: int) -> None:
+        """
+        Moves down the timers of every higher level slot starting at the
+        given time, from the top level down.
+        """
+        if time % self.span == 0 and self.overflow:
+            timers, self.overflow = self.overflow, []
+            for timer in timers:
+                if timer.callback is not None:
+                    self._insert_due(timer)
+
+        for level in range(len(self.levels) - 1, 0, -1):
+            if time & ((1 << (self.bits * level)) - 1):
+                continue
+            slot = (time >> (self.bits * level)) & self.slot_mask
+            if not self.occupied[level] & (1 << slot):
+                continue
+            for timer in self._take(level, slot):
+                if timer.callback is not None:
+                    self.cascaded += 1
+                    self._insert_due(timer)
+
+    def _insert_due(self, timer: Timer) -> None:
+        """
+        Cascades a timer down the wheel, keeping those due right now in
+        the current slot of the lowest level, so they fire at once.
+        """
+        if timer.deadline <= self.time:
+            slot = self.time & self.slot_mask
+            self.levels[0][slot].append(timer)
+            self.occupied[0] |= 1 << slot
+            return
+        self._insert(timer)
+
+    def _fire(self, slot: int) -> None:
+        for timer in self._take(0, slot):
+            callback = timer.callback
+            if callback is None:
+                continue
+            args = timer.args
+            timer.callback = None
+            timer.args = ()
+            self.pending -= 1
+            self.fired += 1
+            callback(*args)
@@ -0,0 +1,56 @@
+import pygame
+from pygame.sprite import Group
+
+
+class UpdateRegistry:
+    """
+    Keeps track of the game entities with per-tick behaviour (tanks,
+    bullets, explosions, score banners...), so each tick only visits
+    those, instead of every sprite group. The map tiles, whose update()
+    does nothing, never get in.
+
+    Entities are registered into a phase, and the phases are updated in
+    the order they're given. Each phase is a sprite group, so entities
+    leave the registry by themselves when they're killed (or released
+    to their pool).
+
+    NOTE: Entities taken out of their sprite groups without being killed
+    (e.g. through Group.empty()) must be unregistered as well.
+    """
+
+    def __init__(self, phases: tuple[str, ...]) -> None:
+        self.phases: dict[str, Group] = {phase: Group() for phase in phases}
+
+    def __len__(self) -> int:
+        return sum(len(group) for group in self.phases.values())
+
+    def register(self, phase: str, *entities: pygame.sprite.Sprite) -> None:
+        self.phases[phase].add(*entities)
+
+    def unregister(self, *entities: pygame.sprite.Sprite) -> None:
+        for group in self.phases.values():
+            group.remove(*entities)
+
+    def empty(self) -> None:
+        for group in self.phases.values():
+            group.empty()
+
+    def get_entities(self, phase: str) -> list:
+        """
+        Returns a copy of the entities registered into the given phase.
+        """
+        return self.phases[phase].sprites()
+
+    def update(self, phase: str) -> None:
+        """
+        Updates every entity registered into the given phase, as they
+        were when the phase started.
+        """
+        for entity in self.phases[phase].sprites():
+            entity.update()
+
+    def get_counts(self) -> dict[str, int]:
+        """
+        Returns the number of entities registered into each phase.
+        """
+        return {phase: len(group) for phase, group in self.phases.items()}